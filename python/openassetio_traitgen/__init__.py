@@ -26,7 +26,7 @@ description.
 This package provides several ways to invoke code generation:
 
  - The `openassetio-traitgen` CLI.
- - The `generate` entrypoint in this module.
+ - The `generate` and `generate_many` entrypoints in this module.
  - Custom generation scripts that make use of the `parser` and
    `generators` modules.
 
@@ -72,8 +72,10 @@ import logging
 
 from typing import List
 
+from . import cache
 from . import parser
 from . import generators
+from . import stats
 
 #
 # Code Generation
@@ -89,7 +91,11 @@ def generate(
     logger: logging.Logger,
     dry_run: bool = False,
     template_globals=None,
-):
+    *,
+    cache_dir: str = None,
+    skip_unchanged: bool = False,
+    jobs: int = 1,
+) -> stats.GenerationStats:
     """
     A high-level entry point into code generation. This can be used for
     programmatic generation that mirrors the behaviour of the CLI.
@@ -123,41 +129,145 @@ def generate(
           - spdxLicenseIdentifier: str ["Apache-2.0"] The SPDX license
             identifier under which the code is licensed. (see:
             https://spdx.org/licenses)
+          - cacheTraitViews: bool [False] If set, generated Python
+            specifications lazily create each trait view once per
+            instance, and return the same view from subsequent calls
+            to its accessor.
+          - lazyImports: bool [False] If set, generated Python packages
+            import their sub-modules on first attribute access (see
+            PEP 562), rather than when the package is imported.
+          - typeChecks: str ["raise"] How generated Python property
+            accessors check the type of values, one of
+            generators.python.TYPE_CHECKS. "raise" raises a TypeError
+            for mismatched values, "assert" uses assert statements,
+            which are removed when Python is run with -O, and "none"
+            omits the checks.
+          - cppLayout: str ["tree"] How generated C++ headers are laid
+            out, one of generators.cpp.LAYOUTS. "tree" generates a
+            header per trait and specification, "amalgamated" a single
+            header per package, and "amalgamated-namespaces" a header
+            per namespace.
+          - cppCMakeTarget: bool [False] If set, generated C++ packages
+            include a CMake file, alongside their "include" directory,
+            defining an INTERFACE library target that precompiles the
+            package header in linking targets.
+
+    @param cache_dir: If set, parsed package declarations are cached
+        in this directory, keyed by the content of the description.
+        Unchanged descriptions then skip loading, validation and
+        declaration building. Generators also cache compiled templates
+        here. The directory is created if required.
+
+    @param skip_unchanged: If set, existing files whose content would
+        not change are left untouched, preserving their modification
+        time. The creation_callback is then called with two arguments,
+        the path and whether it was changed.
+
+    @param jobs: The number of worker processes to render files with.
+        Output, and the order of creation_callback calls, is the same
+        regardless of the number of jobs.
+
+    @return A stats.GenerationStats detailing the time spent in each
+        phase of generation, the files rendered, and peak memory usage.
+    """
+    return generate_many(
+        [description_path],
+        output_directory,
+        [generator],
+        creation_callback,
+        logger,
+        dry_run=dry_run,
+        template_globals=template_globals,
+        cache_dir=cache_dir,
+        skip_unchanged=skip_unchanged,
+        jobs=jobs,
+    )
+
+
+# pylint: disable=too-many-arguments,too-many-locals
+def generate_many(
+    description_paths: List[str],
+    output_directory: str,
+    generator_names: List[str],
+    creation_callback,
+    logger: logging.Logger,
+    *,
+    dry_run: bool = False,
+    template_globals=None,
+    cache_dir: str = None,
+    skip_unchanged: bool = False,
+    jobs: int = 1,
+) -> stats.GenerationStats:
     """
+    A batch variant of `generate`, that generates implementations for
+    several package descriptions, with one or more generators, in a
+    single call.
+
+    Imports, the compiled schema and the generators' Jinja environments
+    are shared across the batch, avoiding the cost of a new interpreter
+    per package per language.
+
+    All descriptions are loaded and validated before any code is
+    generated. Each generator is then invoked for every package, in the
+    order supplied.
+
+    @param description_paths: The paths to the YAML package
+        descriptions conforming to the schema.json
+    @param generator_names: Which generators to invoke. See
+        generators.ALL
 
-    # Retrieve the package structure from the YAML file
-    package_description = parser.load_yaml(description_path)
-    # Validate this against the published schema
-    parser.validate_package_description(package_description)
-    # Build the intermediate representation for the generators
-    package_declaration = parser.build_package_declaration(package_description)
+    See `generate` for the remaining parameters, and the return value.
+    """
+    generation_stats = stats.GenerationStats()
 
-    # As a convenience, log the parsed structure
-    _log_package_declaration(package_declaration, logger)
+    package_declarations = []
+    for description_path in description_paths:
+        package_declaration = _load_package_declaration(
+            description_path, cache_dir, logger, generation_stats
+        )
+        # As a convenience, log the parsed structure
+        _log_package_declaration(package_declaration, logger)
+        package_declarations.append(package_declaration)
 
     if dry_run:
-        return
-
-    # Retrieve the generator by looking up an attribute with the
-    # requested name and generate.
-    try:
-        generator_obj = getattr(generators, generator)
-    except AttributeError as exc:
-        # Make the error message a bit friendlier.
-        raise ValueError(f"Could not find generator {generator}") from exc
-
-    # Generate with requested generator
-    logger.info("Generating with generator %s...", generator)
-
-    # Derive template globals for things such as copyright, etc...
-    globals_ = generators.helpers.default_template_globals()
-    if template_globals:
-        globals_.update(template_globals)
-    globals_["generator"] = generator
-
-    generator_obj.generate(
-        package_declaration, globals_, output_directory, creation_callback, logger
-    )
+        generation_stats.update_peak_memory()
+        return generation_stats
+
+    # Retrieve the generators by looking up an attribute with the
+    # requested name, before generating anything.
+    generator_objs = []
+    for generator in generator_names:
+        try:
+            generator_objs.append(getattr(generators, generator))
+        except AttributeError as exc:
+            # Make the error message a bit friendlier.
+            raise ValueError(f"Could not find generator {generator}") from exc
+
+    for generator, generator_obj in zip(generator_names, generator_objs):
+        # Generate with requested generator
+        logger.info("Generating with generator %s...", generator)
+
+        # Derive template globals for things such as copyright, etc...
+        globals_ = generators.helpers.default_template_globals()
+        if template_globals:
+            globals_.update(template_globals)
+        globals_["generator"] = generator
+
+        for package_declaration in package_declarations:
+            with stats.collecting(generation_stats), generation_stats.timed("render_seconds"):
+                generator_obj.generate(
+                    package_declaration,
+                    dict(globals_),
+                    output_directory,
+                    creation_callback,
+                    logger,
+                    skip_unchanged=skip_unchanged,
+                    jobs=jobs,
+                    cache_dir=cache_dir,
+                )
+
+    generation_stats.update_peak_memory()
+    return generation_stats
 
 
 #
@@ -165,6 +275,49 @@ def generate(
 #
 
 
+def _load_package_declaration(description_path, cache_dir, logger, generation_stats):
+    """
+    Loads, validates and builds the package declaration for the
+    supplied description, using the declaration cache in cache_dir, if
+    set, recording the time taken by each phase in generation_stats.
+    """
+    if cache_dir is None:
+        logger.info("Loading %s using %s", description_path, parser.yaml_loader_name())
+        # Retrieve the package structure from the YAML file
+        with generation_stats.timed("load_seconds"):
+            package_description = parser.load_yaml(description_path)
+        # Validate this against the published schema
+        with generation_stats.timed("validate_seconds"):
+            parser.validate_package_description(package_description)
+        # Build the intermediate representation for the generators
+        with generation_stats.timed("build_seconds"):
+            return parser.build_package_declaration(package_description)
+
+    with generation_stats.timed("load_seconds"):
+        with open(description_path, "rb") as file:
+            description_bytes = file.read()
+
+        key = cache.cache_key(description_bytes)
+        package_declaration = cache.load(cache_dir, key, logger)
+
+    if package_declaration is not None:
+        logger.debug("Using cached declaration for %s (%s)", description_path, key)
+        generation_stats.declarations_cached += 1
+        return package_declaration
+
+    logger.info("Loading %s using %s", description_path, parser.yaml_loader_name())
+    with generation_stats.timed("load_seconds"):
+        package_description = parser.parse_yaml(description_bytes)
+    with generation_stats.timed("validate_seconds"):
+        parser.validate_package_description(package_description)
+    with generation_stats.timed("build_seconds"):
+        package_declaration = parser.build_package_declaration(package_description)
+
+    cache.store(cache_dir, key, package_declaration)
+    logger.debug("Cached declaration for %s (%s)", description_path, key)
+    return package_declaration
+
+
 def _log_package_declaration(package, logger):
     """
     Logs a description of the supplied package declaration.
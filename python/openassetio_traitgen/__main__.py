@@ -17,8 +17,8 @@
 Entry point for command-line execution of the specification/trait
 code generation tool.
 
-The CLI is a thin wrapper around the `generate` entrypoint in the main
-`openassetio_traitgen` module. See `openassetio-traitgen --help` for
+The CLI is a thin wrapper around the `generate_many` entrypoint in the
+main `openassetio_traitgen` module. See `openassetio-traitgen --help` for
 more details on its use.
 """
 
@@ -29,7 +29,7 @@ import inspect
 import sys
 import logging
 
-from . import generate
+from . import generate_many
 from . import generators
 
 #
@@ -71,7 +71,11 @@ def _create_argparser():
         help="Load and verify the supplied declarations without generating any code",
     )
 
-    cmdline.add_argument("input", help="YAML file detailing traits and specifications to generate")
+    cmdline.add_argument(
+        "input",
+        nargs="+",
+        help="YAML file(s) detailing traits and specifications to generate",
+    )
 
     cmdline.add_argument(
         "-o",
@@ -86,8 +90,10 @@ def _create_argparser():
         "--generator",
         required=True,
         type=str,
+        action="append",
         choices=generators.ALL,
-        help="Specifies which generator to use.",
+        help="Specifies which generator to use. May be given more than once to generate"
+        " several languages in one invocation.",
     )
 
     cmdline.add_argument(
@@ -110,6 +116,84 @@ def _create_argparser():
         "(https://spdx.org/licenses).",
     )
 
+    cmdline.add_argument(
+        "--cache-trait-views",
+        action="store_true",
+        help="Generate Python specifications that create each trait view once per instance, and"
+        " return it from subsequent calls to its accessor, rather than creating a new view for"
+        " every call.",
+    )
+
+    cmdline.add_argument(
+        "--lazy-imports",
+        action="store_true",
+        help="Generate Python packages that import their sub-modules on first access, rather"
+        " than when the package is imported, to reduce the import time of large packages.",
+    )
+
+    cmdline.add_argument(
+        "--type-checks",
+        choices=generators.python.TYPE_CHECKS,
+        default=generators.python.TYPE_CHECKS[0],
+        help="How generated Python property accessors check the type of values. 'raise'"
+        " raises a TypeError, 'assert' uses assert statements that are removed under"
+        " 'python -O', and 'none' omits the checks. Defaults to 'raise'.",
+    )
+
+    cmdline.add_argument(
+        "--cpp-layout",
+        choices=generators.cpp.LAYOUTS,
+        default=generators.cpp.LAYOUTS[0],
+        help="How generated C++ headers are laid out. 'tree' generates a header per trait and"
+        " specification, included by hoisting headers for each namespace, sub-package and the"
+        " package. 'amalgamated' generates a single self-contained header per package, and"
+        " 'amalgamated-namespaces' a self-contained header per namespace. Defaults to 'tree'.",
+    )
+
+    cmdline.add_argument(
+        "--cpp-cmake-target",
+        action="store_true",
+        help="Generate a CMake file for each C++ package, defining an INTERFACE library target"
+        " that adds the package's headers to the include path of linking targets, and"
+        " precompiles the package header for them.",
+    )
+
+    cmdline.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Cache parsed descriptions and compiled templates under the supplied directory, so"
+        " that unchanged descriptions skip parsing and validation on subsequent runs.",
+    )
+
+    cmdline.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Only write files whose content has changed, preserving the modification time of"
+        " existing files that are already up to date.",
+    )
+
+    cmdline.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="The number of worker processes to render files with (defaults to 1).",
+    )
+
+    cmdline.add_argument(
+        "--stats",
+        action="store_true",
+        help="Prints the time spent in each phase of generation, counts of the files rendered,"
+        " and peak memory usage to stderr on completion.",
+    )
+
+    cmdline.add_argument(
+        "--stats-format",
+        choices=("text", "json"),
+        default="text",
+        help="The format of the statistics printed by --stats (defaults to text).",
+    )
+
     cmdline.add_argument(
         "-v",
         "--verbose",
@@ -129,6 +213,16 @@ def _create_argparser():
     return cmdline
 
 
+def _positive_int(value: str) -> int:
+    """
+    An argparse type for integer arguments that must be at least one.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, not {value}")
+    return number
+
+
 def _createStderrLogger():
     """
     Returns a logger that sends messages to stderr prefixed with
@@ -167,23 +261,43 @@ def main():
         templateGlobals["copyrightDate"] = args.copyright_date
     if args.spdx_license_identifier:
         templateGlobals["spdxLicenseIdentifier"] = args.spdx_license_identifier
+    if args.cache_trait_views:
+        templateGlobals["cacheTraitViews"] = True
+    if args.lazy_imports:
+        templateGlobals["lazyImports"] = True
+    templateGlobals["typeChecks"] = args.type_checks
+    templateGlobals["cppLayout"] = args.cpp_layout
+    if args.cpp_cmake_target:
+        templateGlobals["cppCMakeTarget"] = True
 
     # If -v is set, we output all files/folders created to std::out
     # to aid managing traitgen files in subsequent build steps.
-    def creation_callback(path):
+    # Unchanged files are still output, so the list remains complete.
+    def creation_callback(path, changed=True):
+        if not changed:
+            logger.debug("Skipped unchanged %s", path)
         if args.verbose:
             sys.stdout.write(f"{path}\n")
 
-    generate(
+    generation_stats = generate_many(
         args.input,
         args.output_dir,
-        args.generator,
+        # De-duplicate, preserving order.
+        list(dict.fromkeys(args.generator)),
         creation_callback,
         logger,
-        args.dry_run,
-        templateGlobals,
+        dry_run=args.dry_run,
+        template_globals=templateGlobals,
+        cache_dir=args.cache_dir,
+        skip_unchanged=args.skip_unchanged,
+        jobs=args.jobs,
     )
 
+    if args.stats and args.stats_format == "json":
+        sys.stderr.write(f"{generation_stats.to_json()}\n")
+    elif args.stats:
+        sys.stderr.write(f"{generation_stats.to_text()}\n")
+
 
 if __name__ == "__main__":
     main()
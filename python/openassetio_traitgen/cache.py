@@ -0,0 +1,143 @@
+#
+#   Copyright 2026 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+A content-addressed, on-disk cache of PackageDeclarations.
+
+Entries are keyed by a digest of the raw description bytes, combined
+with the openassetio-traitgen version and the digests of the schema and
+the modules that build the declaration. An unchanged description can
+then skip YAML loading, schema validation and declaration building
+entirely.
+
+Only declarations built from descriptions that passed validation are
+stored, so a cache hit implies a valid description.
+"""
+
+import functools
+import hashlib
+import importlib.metadata
+import logging
+import os
+import pickle
+import tempfile
+
+from typing import Union
+
+from . import datamodel
+
+__all__ = ("cache_key", "load", "store")
+
+
+# Bumped whenever the on-disk format changes in a way not captured by
+# the other components of the key.
+_FORMAT_VERSION = "1"
+
+
+def cache_key(description_bytes: bytes) -> str:
+    """
+    Returns the cache key for a package description with the supplied
+    raw content.
+    """
+    digest = hashlib.sha256()
+    digest.update(_implementation_fingerprint().encode("utf-8"))
+    digest.update(description_bytes)
+    return digest.hexdigest()
+
+
+def load(
+    cache_dir: str, key: str, logger: logging.Logger = None
+) -> Union[datamodel.PackageDeclaration, None]:
+    """
+    Returns the PackageDeclaration previously stored under the supplied
+    key, or None if there is no usable entry.
+
+    Unreadable, corrupt or stale entries are treated as a cache miss.
+    Unpickling can fail in many ways, e.g. an ImportError if an entry
+    references a module that has since been renamed, so any exception
+    counts as a miss, and is logged at debug level to the supplied
+    logger, if any.
+    """
+    path = _entry_path(cache_dir, key)
+    try:
+        with open(path, "rb") as file:
+            declaration = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        if logger is not None:
+            logger.debug("Ignoring unusable cache entry %s: %r", path, exc)
+        return None
+
+    if not isinstance(declaration, datamodel.PackageDeclaration):
+        return None
+    return declaration
+
+
+def store(cache_dir: str, key: str, declaration: datamodel.PackageDeclaration):
+    """
+    Stores the supplied PackageDeclaration under the supplied key,
+    creating cache_dir if required.
+
+    The entry is written to a temporary file and moved into place, so
+    concurrent builds sharing a cache never observe a partial entry.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(declaration, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, _entry_path(cache_dir, key))
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+#
+# Private implementation
+#
+
+
+def _entry_path(cache_dir: str, key: str) -> str:
+    """
+    Returns the path to the cache entry for the supplied key.
+    """
+    return os.path.join(cache_dir, f"{key}.pickle")
+
+
+@functools.lru_cache(maxsize=None)
+def _implementation_fingerprint() -> str:
+    """
+    Returns a string identifying the traitgen implementation that
+    produced a cache entry.
+
+    This covers the package version, along with the schema and the
+    modules responsible for building the declaration, so that entries
+    are invalidated by development changes made without a version bump.
+    """
+    try:
+        version = importlib.metadata.version("openassetio-traitgen")
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+
+    digest = hashlib.sha256()
+    for name in ("schema.json", "parser.py", "datamodel.py"):
+        with open(os.path.join(__rootDir, name), "rb") as file:
+            digest.update(file.read())
+
+    return f"{_FORMAT_VERSION}:{version}:{digest.hexdigest()}"
+
+
+__rootDir = os.path.dirname(__file__)
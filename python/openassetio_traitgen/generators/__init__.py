@@ -45,6 +45,10 @@ Each generator has a single entry point as shown below:
         output_directory: str,
         creation_callback,
         logger: logging.Logger,
+        *,
+        skip_unchanged: bool = False,
+        jobs: int = 1,
+        cache_dir: str = None,
     ):
         ...
 
@@ -58,6 +62,24 @@ Each generator has a single entry point as shown below:
       already exists).
   - logger: A logger to use for any user-facing messaging or
       diagnostic reporting.
+  - skip_unchanged: If set, files whose rendered content matches the
+      existing file must not be rewritten, and creation_callback must
+      instead be called with two arguments, the path and a bool
+      indicating whether it was changed (i.e. written or created).
+      Helpers for this are provided in the `helpers` module.
+  - jobs: The number of worker processes that may be used to render
+      files. The generated output, and the order in which
+      creation_callback is called, must not depend on this. See
+      helpers.FileRenderer.
+  - cache_dir: If set, a directory in which the generator may cache
+      data between runs, such as compiled templates.
+
+Jinja environments should be created once per process and shared
+between calls, so must not hold per-call state. Template globals should
+be supplied per render, and any messages logged via
+`helpers.current_logger()` (see `helpers.generation_logger`). Every
+rendered file should be recorded via `stats.record_render`, which
+`helpers.FileRenderer` does automatically.
 """
 
 from . import helpers
@@ -19,6 +19,7 @@ openassetio_traitgen PackageDefinition model.
 """
 
 import collections
+import functools
 import itertools
 
 # TODO(DF): Refactor to pull out common code, then remove this
@@ -51,22 +52,74 @@ __all__ = ["generate"]
 OPENASSETIO_ABI_VERSION = "v1"
 TRAITGEN_ABI_VERSION = "v1"
 
+# The supported values of the cppLayout template global, which sets how
+# headers are laid out. The first is the default.
+#  - tree: A header per trait and specification, with hoisting headers
+#    for each namespace, sub-package and the package.
+#  - amalgamated: A single self-contained header for the package.
+#  - amalgamated-namespaces: As tree, but with each namespace header
+#    containing its traits or specifications, rather than including
+#    a header for each.
+LAYOUTS = ("tree", "amalgamated", "amalgamated-namespaces")
+
+# Properties required to interpolate when constructing #include
+# directives. Defined at module scope so that template variables can be
+# pickled when rendering in parallel.
+TraitHeaderPathTokens = collections.namedtuple(
+    "TraitHeaderPathTokens", ("package", "namespace", "name")
+)
+
 
-# pylint: disable=too-many-locals
+# pylint: disable=too-many-arguments
 def generate(
     package_declaration: PackageDeclaration,
     globals_: dict,
     output_directory: str,
     creation_callback,
     logger: logging.Logger,
+    *,
+    skip_unchanged: bool = False,
+    jobs: int = 1,
+    cache_dir: str = None,
 ):
     """
     Generates a C++ package for the supplied definition under
     output_directory.
-    """
-    env = _create_jinja_env(globals_, logger)
 
-    Renderer(env, package_declaration, creation_callback).render_package(output_directory)
+    If skip_unchanged is set, existing files are only rewritten if
+    their content has changed, and creation_callback is additionally
+    passed whether each path was changed.
+
+    If jobs is greater than one, headers are rendered in parallel using
+    that many worker processes.
+
+    If cache_dir is set, compiled templates are cached there, to be
+    reused by subsequent processes.
+
+    The cppLayout global sets how headers are laid out, one of
+    LAYOUTS. Amalgamated layouts are always rendered serially.
+
+    If the cppCMakeTarget global is set, a CMake file defining a target
+    for the package, which precompiles the package header, is also
+    generated.
+    """
+    layout = globals_.get("cppLayout", LAYOUTS[0])
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown cppLayout '{layout}', must be one of: {', '.join(LAYOUTS)}")
+    helpers.check_property_ids(package_declaration)
+
+    with helpers.generation_logger(logger):
+        Renderer(
+            _jinja_env(cache_dir),
+            package_declaration,
+            creation_callback,
+            skip_unchanged=skip_unchanged,
+            jobs=jobs,
+            globals_=globals_,
+            cache_dir=cache_dir,
+            layout=layout,
+            cmake_target=globals_.get("cppCMakeTarget", False),
+        ).render_package(output_directory)
 
 
 class Renderer:
@@ -78,26 +131,71 @@ class Renderer:
     "namespace", "module", etc., and translates to directory names,
     (hoisting) header file names, C++ namespaces and C++ classes, as
     appropriate.
+
+    Messages are logged via the current helpers.generation_logger.
     """
 
-    # pylint: disable=too-few-public-methods
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    # pylint: disable=too-many-arguments
     def __init__(
         self,
         env: jinja2.Environment,
         package: PackageDeclaration,
         creation_callback: Callable,
+        *,
+        skip_unchanged: bool = False,
+        jobs: int = 1,
+        globals_: dict = None,
+        cache_dir: str = None,
+        layout: str = LAYOUTS[0],
+        cmake_target: bool = False,
     ):
+        """
+        @param globals_: Template globals, passed to every render.
+        @param jobs: If greater than one, headers are rendered in
+        parallel using that many worker processes, each using the
+        process-wide environment, rather than env. Ignored for
+        amalgamated layouts.
+        @param cache_dir: The bytecode cache directory of the
+        process-wide environment used by worker processes.
+        @param layout: How headers are laid out, one of LAYOUTS. For
+        amalgamated layouts, headers are rendered as for "tree", but
+        held in memory, and combined when the package is complete.
+        @param cmake_target: Whether to render a CMake file defining a
+        target for the package.
+        """
         self.__env = env
         self.__package = package
-        self.__creation_callback = creation_callback
+        self.__layout = layout
+        self.__cmake_target = cmake_target
+        # Amalgamated layout bookkeeping. The content of each rendered
+        # header, and the directories requested, both in render order,
+        # along with the amalgamated header that any header other than
+        # the package header is merged into.
+        self.__headers = {}
+        self.__dirs = []
+        self.__merged_into = {}
+        self.__file_renderer = helpers.FileRenderer(
+            env,
+            creation_callback,
+            globals_,
+            skip_unchanged=skip_unchanged,
+            jobs=jobs if layout == "tree" else 1,
+            env_factory=functools.partial(_jinja_env, cache_dir),
+        )
 
     def render_package(self, output_directory: str):
         """
         Render a package declaration to a C++ header-only package.
 
-        Headers for all traits and specifications are rendered, followed
-        by a top-level convenience hoisting header that imports
-        everything under this package.
+        Headers for all traits and specifications are rendered, along
+        with a registry header indexing them, followed by a top-level
+        convenience hoisting header that imports everything under this
+        package, then, if enabled, a CMake file defining a target for
+        the package alongside its "include" directory.
+
+        For amalgamated layouts, the headers are then combined, see
+        `_amalgamate`, and only the resulting headers are written.
 
         @param output_directory: Top-level directory to place rendered
         artifacts. Subdirectories will be created to contain trait,
@@ -120,10 +218,29 @@ class Renderer:
             if file_name is not None:
                 imports.append(f"{kind}/{file_name}")
 
+        # Package-level index of all traits and specifications, which
+        # includes the sub-package headers collected so far.
+        self.__render_template(
+            "registry",
+            os.path.join(package_abs_path, "registry.hpp"),
+            {
+                "package": self.__package,
+                "relImports": list(imports),
+                "openassetio_abi_version": OPENASSETIO_ABI_VERSION,
+                "traitgen_abi_version": TRAITGEN_ABI_VERSION,
+            },
+        )
+        imports.append("registry.hpp")
+
         # Top-level package header that includes everything.
-        self.__render_package_template(
+        package_header_name = self.__render_package_template(
             package_abs_path, package_name, self.__package.description, imports
         )
+        if self.__layout != "tree":
+            self.__write_amalgamated(os.path.join(package_abs_path, package_header_name))
+        if self.__cmake_target:
+            self.__render_cmake_target(os.path.join(output_directory, package_name), package_name)
+        self.__file_renderer.flush()
 
     def __render_traits_or_specifications(
         self, parent_abs_path: str, kind: str
@@ -210,9 +327,13 @@ class Renderer:
         # Generate the namespace header that pre-imports all the
         # classes.
         imports.sort()
+        namespace_header_path = os.path.join(parent_abs_path, f"{namespace_name}.hpp")
+        if self.__layout == "amalgamated-namespaces":
+            for import_ in imports:
+                self.__merged_into[os.path.join(parent_abs_path, import_)] = namespace_header_path
         self.__render_template(
             kind,
-            os.path.join(parent_abs_path, f"{namespace_name}.hpp"),
+            namespace_header_path,
             {
                 "package": self.__package,
                 "namespace": namespace,
@@ -263,12 +384,6 @@ class Renderer:
         class.
         """
 
-        # Properties required to interpolate when constructing #include
-        # directives.
-        TraitHeaderPathTokens = collections.namedtuple(
-            "TraitHeaderPathTokens", ("package", "namespace", "name")
-        )
-
         # All versions of a given trait live in a single header.
         # Extract fields required to #include the trait headers
         # referenced by all versions of this specification, de-duped.
@@ -311,6 +426,30 @@ class Renderer:
         )
         return f"{name}.hpp"
 
+    def __render_cmake_target(self, package_dir_abs_path: str, package_name: str):
+        """
+        Render the CMake file defining an INTERFACE library target for
+        the package, which links to the targets of the other packages
+        that its specifications use traits from.
+        """
+        specifications = [
+            specification
+            for namespace in self.__package.specifications or []
+            for specification in namespace.members
+        ]
+        self.__file_renderer.render(
+            "cpp/package.cmake.in",
+            os.path.join(package_dir_abs_path, f"{package_name}.cmake"),
+            {
+                "package": self.__package,
+                "dependencies": [
+                    dependency
+                    for dependency in helpers.package_dependencies(specifications)
+                    if dependency != self.__package.id
+                ],
+            },
+        )
+
     def __render_template(self, name: str, path: str, variables: dict):
         """
         A convenience to render a named template into its corresponding
@@ -319,58 +458,258 @@ class Renderer:
         # pylint: disable=line-too-long
         # NB: Jinja assumes '/' on all plaftorms:
         #  https://github.com/pallets/jinja/blob/7fb13bf94443f067c74204a1aee368fdf0591764/src/jinja2/loaders.py#L29
-        template = self.__env.get_template(f"cpp/{name}.hpp.in")
-        with open(path, "w", encoding="utf-8", newline="\n") as file:
-            file.write(template.render(variables))
-        self.__creation_callback(path)
+        if self.__layout == "tree":
+            self.__file_renderer.render(f"cpp/{name}.hpp.in", path, variables)
+            return
+        self.__headers[os.path.normpath(path)] = self.__file_renderer.render_to_string(
+            f"cpp/{name}.hpp.in", variables
+        )
 
     def __create_dir_with_path_components(self, *args) -> str:
         """
         A convenience to create a directory from the supplied path
         components, calling the creation_callback and returning its path
         as a string.
+
+        For amalgamated layouts, directories are only created once the
+        package is complete, if they contain an amalgamated header.
         """
+        if self.__layout == "tree":
+            return self.__file_renderer.create_dir(*args)
         path = os.path.join(*args)
-        os.makedirs(path, exist_ok=True)
-        self.__creation_callback(path)
+        self.__dirs.append(path)
         return path
 
+    def __write_amalgamated(self, package_header_path: str):
+        """
+        Combine the headers rendered for an amalgamated layout, then
+        create the directories that contain the resulting headers and
+        write them, calling the creation_callback for each.
+        """
+        package_header_path = os.path.normpath(package_header_path)
+        merged_into = {
+            path: (
+                package_header_path
+                if self.__layout == "amalgamated"
+                else os.path.normpath(self.__merged_into.get(path, path))
+            )
+            for path in self.__headers
+        }
+        amalgamated = _amalgamate(self.__headers, merged_into)
+
+        output_dirs = {os.path.dirname(path) for path in amalgamated}
+        for path in self.__dirs:
+            if os.path.normpath(path) in output_dirs:
+                self.__file_renderer.create_dir(path)
+        for path, (content, header_count) in amalgamated.items():
+            self.__file_renderer.write(path, content, header_count)
+
+
+#
+## Amalgamation
+#
+
+# Matches an #include directive, capturing its delimiter and path.
+_INCLUDE_RE = re.compile(r'^#include ([<"])(.+)[>"]$')
+
+# Prefixes of the lines at the top of every rendered header, before
+# the auto-generated warning.
+_LICENSE_PREFIXES = ("// SPDX-License-Identifier:", "// Copyright ")
+_WARNING_PREFIX = "// WARNING:"
+
+# A rendered header, split into its parts. See _parse_header.
+_ParsedHeader = collections.namedtuple(
+    "_ParsedHeader", ("license", "file_comment", "warning", "includes", "body")
+)
+
+
+def _amalgamate(headers: dict, merged_into: dict) -> dict:
+    """
+    Combines rendered headers into amalgamated headers.
+
+    Each amalgamated header contains the headers merged into it, each
+    following the headers it includes, i.e. in topological order. Their
+    #include directives are hoisted to the top and de-duplicated, with
+    standard library headers first, then other external headers, then
+    any other amalgamated headers, in the order they are first
+    included. Comments describing the rendered files themselves are
+    dropped, other than for the header that an amalgamated header
+    replaces. Headers that have nothing merged into them, and only
+    include other such headers, are left as rendered.
+
+    @param headers: The content of each rendered header, keyed by
+    normalized path, in render order.
+    @param merged_into: The path of the amalgamated header each
+    rendered header is merged into. An amalgamated header replaces the
+    rendered header at the same path.
+    @return The content of each amalgamated header, and the number of
+    rendered headers combined into it, keyed by path, in render order.
+    """
+    parsed = {path: _parse_header(path, content) for path, content in headers.items()}
+    amalgamated = {}
+
+    for output_path in headers:
+        if merged_into[output_path] != output_path:
+            continue
+
+        ordered = _topologically_ordered(
+            [path for path in headers if merged_into[path] == output_path], parsed
+        )
+        if ordered == [output_path] and all(
+            merged_into[include] == include
+            for delimiter, include in parsed[output_path].includes
+            if delimiter == '"'
+        ):
+            # Nothing to combine, so keep the header as rendered.
+            amalgamated[output_path] = (headers[output_path], 1)
+            continue
+        amalgamated[output_path] = (
+            _combine_headers(output_path, ordered, parsed, merged_into),
+            len(ordered),
+        )
+
+    return amalgamated
+
+
+def _combine_headers(output_path: str, ordered: List[str], parsed: dict, merged_into: dict) -> str:
+    """
+    Returns the content of the amalgamated header at output_path,
+    combining the supplied (topologically) ordered headers, as
+    described in `_amalgamate`.
+    """
+    system_includes, external_includes, internal_includes = set(), set(), {}
+    for path in ordered:
+        for delimiter, include in parsed[path].includes:
+            if delimiter == '"':
+                if merged_into[include] != output_path:
+                    relative_path = os.path.relpath(
+                        merged_into[include], os.path.dirname(output_path)
+                    )
+                    internal_includes[relative_path.replace(os.sep, "/")] = None
+            elif "/" in include:
+                external_includes.add(include)
+            else:
+                system_includes.add(include)
+
+    output = parsed[output_path]
+    preamble = list(output.license)
+    if output.file_comment:
+        preamble += output.file_comment + [""]
+    preamble += [output.warning, "", "#pragma once"]
+    include_blocks = [
+        [f"#include <{include}>" for include in sorted(system_includes)],
+        [f"#include <{include}>" for include in sorted(external_includes)],
+        [f'#include "{include}"' for include in internal_includes],
+    ]
+    blocks = ["\n".join(preamble)]
+    blocks += ["\n".join(block) for block in include_blocks if block]
+    blocks += [parsed[path].body for path in ordered if parsed[path].body]
+    return "\n\n".join(blocks) + "\n"
+
+
+def _topologically_ordered(paths: List[str], parsed: dict) -> List[str]:
+    """
+    Orders the supplied header paths such that each follows any of the
+    others that it (transitively) includes, otherwise preserving their
+    order.
+    """
+    members = set(paths)
+    ordered = []
+    visited = set()
+
+    def visit(path):
+        if path in visited:
+            return
+        visited.add(path)
+        for delimiter, include in parsed[path].includes:
+            if delimiter == '"' and include in members:
+                visit(include)
+        ordered.append(path)
+
+    for path in paths:
+        visit(path)
+    return ordered
+
+
+def _parse_header(path: str, content: str) -> _ParsedHeader:
+    """
+    Splits a rendered header into its license lines, the comment
+    describing the file (i.e. preceding the auto-generated warning),
+    the warning itself, its #include directives, and its body.
+
+    Quoted includes are resolved to normalized paths relative to the
+    header's directory. The body excludes the `#pragma once` directive,
+    and runs of blank lines are collapsed.
+    """
+    license_lines, file_comment, includes, body = [], [], [], []
+    warning = None
+    for line in content.splitlines():
+        if warning is None:
+            if line.startswith(_WARNING_PREFIX):
+                warning = line
+            elif line.startswith(_LICENSE_PREFIXES):
+                license_lines.append(line)
+            elif line:
+                file_comment.append(line)
+            continue
+        match = _INCLUDE_RE.match(line)
+        if match:
+            delimiter, include = match.groups()
+            if delimiter == '"':
+                include = os.path.normpath(os.path.join(os.path.dirname(path), include))
+            includes.append((delimiter, include))
+        elif line != "#pragma once" and (line or (body and body[-1])):
+            body.append(line)
+    return _ParsedHeader(
+        license_lines, file_comment, warning, includes, "\n".join(body).strip("\n")
+    )
+
 
 #
 ## Jinja setup
 #
 
 
-def _create_jinja_env(env_globals, logger):
+@functools.lru_cache(maxsize=None)
+def _jinja_env(bytecode_cache_dir: str = None) -> jinja2.Environment:
     """
-    Creates a custom Jinja2 environment with:
+    Returns the process-wide custom Jinja2 environment, with:
      - A package a loader that automatically finds templates within a
        'templates' directory in the openassetio_traitgen python package.
-     - Updated globals.
      - Custom filters.
+     - A bytecode cache of compiled templates under
+       bytecode_cache_dir, if set.
+
+    The environment is shared between generate calls, so that
+    templates are only compiled once, and must therefore hold no
+    per-call state. Template globals are instead supplied per render.
     """
-    env = jinja2.Environment(loader=jinja2.PackageLoader("openassetio_traitgen"))
-    env.globals.update(env_globals)
-    _install_custom_filters(env, logger)
+    bytecode_cache = None
+    if bytecode_cache_dir:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(bytecode_cache_dir)
+    env = jinja2.Environment(
+        loader=jinja2.PackageLoader("openassetio_traitgen"), bytecode_cache=bytecode_cache
+    )
+    _install_custom_filters(env)
     return env
 
 
 # Custom filters
 
 
-def _install_custom_filters(environment, logger):
+def _install_custom_filters(environment):
     """
     Installs custom filters in to the Jinja template environment that
     allow data from the model to be conformed to C++-specific standards.
 
-    The to_cpp* methods will log a warning if the string is changed from
+    The to_cpp* methods will log a warning to the current generation
+    logger (which de-duplicates messages) if the string is changed from
     the input during this process. An error will be raised if this
     resulted in an empty string.
     """
     # pylint: disable=too-many-statements
 
-    logged_warnings = set()
-
     def validate_identifier(string: str, original: str):
         """
         Validates some string is a legal C++ variable name.
@@ -394,9 +733,7 @@ def _install_custom_filters(environment, logger):
         namespace_name = re.sub(r"[^a-zA-Z0-9_]", "_", no_hypens)
         if namespace_name != no_hypens:
             msg = f"Conforming '{string}' to '{namespace_name}' for namespace name"
-            if msg not in logged_warnings:
-                logged_warnings.add(msg)
-                logger.warning(msg)
+            helpers.current_logger().warning(msg)
         validate_identifier(namespace_name, string)
         return namespace_name
 
@@ -407,9 +744,7 @@ def _install_custom_filters(environment, logger):
         class_name = helpers.to_upper_camel_alnum(string)
         if class_name != string:
             msg = f"Conforming '{string}' to '{class_name}' for class name"
-            if msg not in logged_warnings:
-                logged_warnings.add(msg)
-                logger.warning(msg)
+            helpers.current_logger().warning(msg)
         validate_identifier(class_name, string)
         return class_name
 
@@ -424,9 +759,7 @@ def _install_custom_filters(environment, logger):
         # We expect the first letter to change to lowercase
         if accessor_name != f"{unique_name[0].lower()}{unique_name[1:]}":
             msg = f"Conforming '{unique_name}' to '{accessor_name}' for trait getter name"
-            if msg not in logged_warnings:
-                logged_warnings.add(msg)
-                logger.warning(msg)
+            helpers.current_logger().warning(msg)
         validate_identifier(accessor_name, unique_name)
         return accessor_name
 
@@ -439,9 +772,7 @@ def _install_custom_filters(environment, logger):
         accessor_name = helpers.to_upper_camel_alnum(string)
         if accessor_name != f"{string[0].upper()}{string[1:]}":
             msg = f"Conforming '{string}' to '{accessor_name}' for property accessor name"
-            if msg not in logged_warnings:
-                logged_warnings.add(msg)
-                logger.warning(msg)
+            helpers.current_logger().warning(msg)
         validate_identifier(accessor_name, string)
         return accessor_name
 
@@ -453,9 +784,7 @@ def _install_custom_filters(environment, logger):
         var_name = helpers.to_lower_camel_alnum(string)
         if var_name != string:
             msg = f"Conforming '{string}' to '{var_name}' for variable name"
-            if msg not in logged_warnings:
-                logged_warnings.add(msg)
-                logger.warning(msg)
+            helpers.current_logger().warning(msg)
         validate_identifier(var_name, string)
         return var_name
 
@@ -14,14 +14,21 @@
 #   limitations under the License.
 #
 """
-Utility functions to help code generation templates.
+Utility functions to help code generation templates, and the
+generators that render them.
 """
 
+import concurrent.futures
+import contextlib
+import contextvars
 import datetime
+import logging
+import os
 import re
 
-from typing import List, Union
-from ..datamodel import SpecificationDeclaration, TraitDeclaration
+from typing import Callable, List, Tuple, Union
+from .. import stats
+from ..datamodel import PackageDeclaration, SpecificationDeclaration, TraitDeclaration
 
 
 def to_upper_camel_alnum(string: str) -> str:
@@ -57,14 +64,270 @@ def default_template_globals() -> dict:
 
     - copyrightDate: A date range for copyright text.
     - copyrightOwner: The owner of the copyright license.
+    - cacheTraitViews: Whether specifications memoize their trait views.
+    - lazyImports: Whether Python packages import their sub-modules on
+      first access.
+    - typeChecks: How Python property accessors check value types, one
+      of python.TYPE_CHECKS.
+    - cppLayout: How C++ headers are laid out, one of cpp.LAYOUTS.
+    - cppCMakeTarget: Whether C++ packages include a CMake file defining
+      a target that precompiles the package header.
     """
     return {
         "copyrightDate": datetime.date.today().year,
         "copyrightOwner": "",
         "spdxLicenseIdentifier": "Apache-2.0",
+        "cacheTraitViews": False,
+        "lazyImports": False,
+        "typeChecks": "raise",
+        "cppLayout": "tree",
+        "cppCMakeTarget": False,
     }
 
 
+def write_file(path: str, content: str, skip_unchanged: bool = False) -> bool:
+    """
+    Writes the supplied content to the file at path, UTF-8 encoded and
+    with '\\n' line endings.
+
+    @param skip_unchanged If set, an existing file is only rewritten if
+    its content differs, so that the modification times of unchanged
+    files are preserved. Sizes are compared first, so the existing
+    content is only read if they match.
+
+    @return `True` if the file was written, `False` if it was left
+    untouched.
+    """
+    return _write_data(path, content.encode("utf-8"), skip_unchanged)
+
+
+def create_dir(path: str) -> bool:
+    """
+    Creates the directory at path, along with any missing parents.
+
+    @return `True` if the directory was created, `False` if it already
+    existed.
+    """
+    existed = os.path.isdir(path)
+    os.makedirs(path, exist_ok=True)
+    return not existed
+
+
+def creation_notifier(creation_callback: Callable, report_changes: bool) -> Callable:
+    """
+    Returns a callable taking a path and whether it was changed, that
+    forwards to the supplied generator creation_callback.
+
+    If report_changes is set, the callback is called with both
+    arguments, otherwise just with the path, as per the original
+    callback signature.
+    """
+    if report_changes:
+        return creation_callback
+    return lambda path, _changed: creation_callback(path)
+
+
+class FileRenderer:
+    """
+    Renders templates into files, and creates directories, on behalf of
+    a generator, notifying its creation_callback of each path in the
+    order they were requested.
+
+    Templates are loaded from env and rendered with the supplied
+    globals_, which are passed per render rather than installed in the
+    (shared) environment.
+
+    If jobs is greater than one, rendering is deferred until `flush`,
+    and the queued templates are rendered on a pool of worker
+    processes. Each worker obtains its environment by calling
+    env_factory, which must therefore be picklable (e.g. a module-level
+    function). Messages logged by the workers are re-logged through
+    the current generation_logger, in request order. Directories are
+    always created immediately, as subsequent requests may rely on
+    them.
+
+    Each render is recorded in the current generation statistics (see
+    `stats.collecting`).
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        env,
+        creation_callback: Callable,
+        globals_: dict = None,
+        *,
+        skip_unchanged: bool = False,
+        jobs: int = 1,
+        env_factory: Callable = None,
+    ):
+        if jobs > 1 and env_factory is None:
+            raise ValueError("An env_factory is required when rendering with multiple jobs")
+        self.__env = env
+        self.__notify = creation_notifier(creation_callback, skip_unchanged)
+        self.__globals = globals_ or {}
+        self.__skip_unchanged = skip_unchanged
+        self.__jobs = jobs
+        self.__env_factory = env_factory
+        # Deferred (parallel) mode bookkeeping. Each entry in
+        # __pending is either a (path, changed) pair for a created
+        # directory, or an index into __tasks.
+        self.__pending = []
+        self.__tasks = []
+
+    def create_dir(self, *args) -> str:
+        """
+        Creates a directory from the supplied path components, calling
+        the creation_callback and returning its path as a string.
+        """
+        path = os.path.join(*args)
+        changed = create_dir(path)
+        if self.__jobs > 1:
+            self.__pending.append((path, changed))
+        else:
+            self.__notify(path, changed)
+        return path
+
+    def render(self, template_name: str, path: str, variables: dict):
+        """
+        Renders the named template into the file at path, calling the
+        creation_callback (possibly deferred until `flush`).
+        """
+        context = {**self.__globals, **variables}
+        if self.__jobs > 1:
+            self.__pending.append(len(self.__tasks))
+            self.__tasks.append((template_name, path, context, self.__skip_unchanged))
+            return
+        changed, size = _render_to_file(
+            self.__env, template_name, path, context, self.__skip_unchanged
+        )
+        stats.record_render(size, changed)
+        self.__notify(path, changed)
+
+    def render_to_string(self, template_name: str, variables: dict) -> str:
+        """
+        Renders the named template immediately, in this process,
+        returning its content rather than writing it to a file.
+
+        The render is not recorded in the generation statistics, the
+        caller should instead pass the number of templates combined
+        into each file to `write`.
+        """
+        context = {**self.__globals, **variables}
+        return self.__env.get_template(template_name).render(context)
+
+    def write(self, path: str, content: str, templates: int = 1):
+        """
+        Writes content, rendered from the supplied number of templates,
+        into the file at path, calling the creation_callback (possibly
+        deferred until `flush`).
+        """
+        changed = write_file(path, content, self.__skip_unchanged)
+        stats.record_render(len(content.encode("utf-8")), changed, templates)
+        if self.__jobs > 1:
+            self.__pending.append((path, changed))
+        else:
+            self.__notify(path, changed)
+
+    def flush(self):
+        """
+        Renders any deferred templates, then calls the creation_callback
+        for all outstanding paths, in the order they were requested.
+        """
+        if not self.__pending:
+            return
+
+        # Chunking amortises the cost of pickling variables that are
+        # shared between tasks, e.g. the package declaration.
+        chunksize = max(1, len(self.__tasks) // (self.__jobs * 4))
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.__jobs,
+            initializer=_init_render_worker,
+            initargs=(self.__env_factory,),
+        ) as executor:
+            results = list(executor.map(_render_in_worker, self.__tasks, chunksize=chunksize))
+
+        logger = current_logger()
+        for entry in self.__pending:
+            if isinstance(entry, tuple):
+                self.__notify(*entry)
+                continue
+            changed, size, messages = results[entry]
+            for level, message in messages:
+                logger.log(level, message)
+            stats.record_render(size, changed)
+            self.__notify(self.__tasks[entry][1], changed)
+
+        self.__pending = []
+        self.__tasks = []
+
+
+class DeduplicatingLogger(logging.LoggerAdapter):
+    """
+    A logger adapter that drops any message identical to one already
+    logged through it.
+
+    This allows messages logged by parallel render workers, which each
+    only de-duplicate their own output, to be combined.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        super().__init__(logger, {})
+        self.__logged = set()
+
+    def log(self, level, msg, *args, **kwargs):
+        message = (level, msg % args if args else msg)
+        if message in self.__logged:
+            return
+        self.__logged.add(message)
+        super().log(level, msg, *args, **kwargs)
+
+
+@contextlib.contextmanager
+def generation_logger(logger: logging.Logger):
+    """
+    A context manager that sets the logger used for messages emitted
+    during generation, e.g. by custom template filters, yielding it
+    wrapped in a DeduplicatingLogger.
+
+    Jinja environments are shared between calls to a generator, so
+    filters cannot capture the logger for any one call, and must
+    instead retrieve it via `current_logger`.
+    """
+    deduplicating_logger = DeduplicatingLogger(logger)
+    token = _generation_logger.set(deduplicating_logger)
+    try:
+        yield deduplicating_logger
+    finally:
+        _generation_logger.reset(token)
+
+
+def current_logger() -> Union[logging.Logger, logging.LoggerAdapter]:
+    """
+    Returns the logger set by the innermost active generation_logger,
+    or the module logger if there is none.
+    """
+    return _generation_logger.get(None) or logging.getLogger(__name__)
+
+
+def check_property_ids(package_declaration: PackageDeclaration):
+    """
+    Raises a ValueError if any trait in the supplied package declares a
+    property whose accessors would collide with the bulk property
+    accessors generated for every trait.
+    """
+    for namespace in package_declaration.traits or []:
+        for trait in namespace.members:
+            for property_ in trait.properties:
+                if property_.id in _RESERVED_PROPERTY_IDS:
+                    raise ValueError(
+                        f"Property '{property_.id}' of trait '{trait.id}' is reserved, as its"
+                        " accessors would collide with getProperties/setProperties."
+                    )
+
+
 def package_dependencies(
     declarations: List[Union[SpecificationDeclaration, TraitDeclaration]],
 ) -> List[str]:
@@ -77,6 +340,93 @@ def package_dependencies(
     )
 
 
+def _write_data(path: str, data: bytes, skip_unchanged: bool) -> bool:
+    """
+    Writes data to the file at path, unless skip_unchanged is set and
+    the file already has that content, returning whether it was written.
+    """
+    if skip_unchanged and _file_has_content(path, data):
+        return False
+    with open(path, "wb") as file:
+        file.write(data)
+    return True
+
+
+def _file_has_content(path: str, data: bytes) -> bool:
+    """
+    Checks whether the file at path exists and contains exactly the
+    supplied data.
+    """
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, "rb") as file:
+            return file.read() == data
+    except OSError:
+        return False
+
+
+# Property IDs whose getX/setX accessors would be the bulk property
+# accessors of the trait.
+_RESERVED_PROPERTY_IDS = ("properties",)
+
+# The logger set by generation_logger.
+_generation_logger = contextvars.ContextVar("generation_logger", default=None)
+
+# Per-process state for FileRenderer pool workers.
+_worker_state = {}
+
+
+def _init_render_worker(env_factory: Callable):
+    """
+    Initializes a FileRenderer pool worker process, retrieving its
+    Jinja environment and creating a logger that captures messages, so
+    they can be returned to the parent process.
+    """
+    messages = []
+
+    class CapturingHandler(logging.Handler):
+        """
+        Collects the level and message of every record.
+        """
+
+        def emit(self, record: logging.LogRecord):
+            messages.append((record.levelno, record.getMessage()))
+
+    logger = logging.Logger("openassetio-traitgen-render-worker")
+    logger.addHandler(CapturingHandler())
+    _worker_state["env"] = env_factory()
+    _worker_state["logger"] = logger
+    _worker_state["messages"] = messages
+
+
+def _render_in_worker(task: tuple) -> tuple:
+    """
+    Renders a FileRenderer task in a pool worker process, returning
+    whether the file was changed and its size, along with any messages
+    logged whilst rendering.
+    """
+    template_name, path, variables, skip_unchanged = task
+    messages = _worker_state["messages"]
+    messages.clear()
+    with generation_logger(_worker_state["logger"]):
+        changed, size = _render_to_file(
+            _worker_state["env"], template_name, path, variables, skip_unchanged
+        )
+    return changed, size, list(messages)
+
+
+def _render_to_file(
+    env, template_name: str, path: str, variables: dict, skip_unchanged: bool
+) -> Tuple[bool, int]:
+    """
+    Renders the named template into the file at path, returning
+    whether the file was written, and the size of its content in bytes.
+    """
+    data = env.get_template(template_name).render(variables).encode("utf-8")
+    return _write_data(path, data, skip_unchanged), len(data)
+
+
 def _package_dependencies_for_declaration(
     declaration: Union[SpecificationDeclaration, TraitDeclaration],
 ) -> List[str]:
@@ -18,6 +18,7 @@ A traitgen generator that outputs a python package based on the
 openassetio_traitgen PackageDefinition model.
 """
 
+import functools
 import keyword
 import logging
 import os
@@ -37,48 +38,86 @@ __all__ = ["generate"]
 ## Code Generation
 #
 
+# The supported values of the typeChecks template global, which sets how
+# property accessors check the type of values. The first is the default.
+TYPE_CHECKS = ("raise", "assert", "none")
 
-# pylint: disable=too-many-locals
+
+# pylint: disable=too-many-arguments
 def generate(
     package_declaration: PackageDeclaration,
     globals_: dict,
     output_directory: str,
     creation_callback,
     logger: logging.Logger,
+    *,
+    skip_unchanged: bool = False,
+    jobs: int = 1,
+    cache_dir: str = None,
 ):
     """
     Generates a python package for the supplied definition under outputDirPath.
+
+    If skip_unchanged is set, existing files are only rewritten if
+    their content has changed, and creation_callback is additionally
+    passed whether each path was changed.
+
+    If jobs is greater than one, the namespace modules are rendered in
+    parallel using that many worker processes.
+
+    If cache_dir is set, compiled templates are cached there, to be
+    reused by subsequent processes.
     """
+    type_checks = globals_.get("typeChecks", TYPE_CHECKS[0])
+    if type_checks not in TYPE_CHECKS:
+        raise ValueError(
+            f"Unknown typeChecks '{type_checks}', must be one of: {', '.join(TYPE_CHECKS)}"
+        )
+    helpers.check_property_ids(package_declaration)
+
+    env = _jinja_env(cache_dir)
+    renderer = helpers.FileRenderer(
+        env,
+        creation_callback,
+        globals_,
+        skip_unchanged=skip_unchanged,
+        jobs=jobs,
+        env_factory=functools.partial(_jinja_env, cache_dir),
+    )
+    with helpers.generation_logger(logger):
+        _render_package(package_declaration, output_directory, env, renderer)
+        renderer.flush()
+
 
-    env = _create_jinja_env(globals_, logger)
+def _render_package(
+    package_declaration: PackageDeclaration,
+    output_directory: str,
+    env: jinja2.Environment,
+    renderer: helpers.FileRenderer,
+):
+    """
+    Renders the package for the supplied definition under
+    output_directory.
+    """
+    # pylint: disable=too-many-locals
 
     def render_template(name: str, path: str, variables: dict):
         """
         A convenience to render a named template into its corresponding
         file and call the creationCallback.
+
+        The module's type stub is rendered alongside it, from the
+        corresponding .pyi template.
         """
         # pylint: disable=line-too-long
         # NB: Jinja assumes '/' on all plaftorms:
         #  https://github.com/pallets/jinja/blob/7fb13bf94443f067c74204a1aee368fdf0591764/src/jinja2/loaders.py#L29
-        template = env.get_template(f"python/{name}.py.in")
-        with open(path, "w", encoding="utf-8", newline="\n") as file:
-            file.write(template.render(variables))
-        creation_callback(path)
-
-    def create_dir_with_path_components(*args) -> str:
-        """
-        A convenience to create a directory from the supplied path
-        components, calling the creationCallback and returning its path
-        as a string.
-        """
-        path = os.path.join(*args)
-        os.makedirs(path, exist_ok=True)
-        creation_callback(path)
-        return path
+        renderer.render(f"python/{name}.py.in", path, variables)
+        renderer.render(f"python/{name}.pyi.in", f"{path}i", variables)
 
     # Top level package directory, under a "python" subdirectory
     package_name = env.filters["to_py_module_name"](package_declaration.id)
-    package_dir_path = create_dir_with_path_components(output_directory, package_name)
+    package_dir_path = renderer.create_dir(output_directory, package_name)
 
     # Collect which sub-packages we should import at the top level, so
     # they're available without a 'from x import y' statement.
@@ -91,7 +130,7 @@ def generate(
             package_init_imports.append(kind)
 
             # Create the directory for the sub-package
-            subpackage_dir_path = create_dir_with_path_components(package_dir_path, kind)
+            subpackage_dir_path = renderer.create_dir(package_dir_path, kind)
 
             # Collect the resulting module names for each namespace
             # So we can pre-import them in the sub-package init.
@@ -112,15 +151,28 @@ def generate(
                 )
 
             # Generate the sub-package __init__.py that pre-imports all
-            # of the sub-modules.
+            # of the sub-modules. The specifications sub-package also
+            # provides matching across all of its specifications.
             subpackage_init_imports.sort()
             docstring = f"{kind.capitalize()} defined in the '{package_declaration.id}' package."
             render_template(
                 "__init__",
                 os.path.join(subpackage_dir_path, "__init__.py"),
-                {"docstring": docstring, "relImports": subpackage_init_imports},
+                {
+                    "docstring": docstring,
+                    "relImports": subpackage_init_imports,
+                    "specificationNamespaces": namespaces if kind == "specifications" else None,
+                },
             )
 
+    # Package-level index of all traits and specifications.
+    render_template(
+        "registry",
+        os.path.join(package_dir_path, "registry.py"),
+        {"package": package_declaration},
+    )
+    package_init_imports.append("registry")
+
     # Package __init__.py
     render_template(
         "__init__",
@@ -128,37 +180,52 @@ def generate(
         {"docstring": package_declaration.description, "relImports": package_init_imports},
     )
 
+    # Marks the package as providing type information (PEP 561), so
+    # type checkers use the stubs rather than analysing the modules.
+    renderer.render("python/py.typed.in", os.path.join(package_dir_path, "py.typed"), {})
+
 
 #
 ## Jinja setup
 #
 
 
-def _create_jinja_env(env_globals, logger):
+@functools.lru_cache(maxsize=None)
+def _jinja_env(bytecode_cache_dir: str = None) -> jinja2.Environment:
     """
-    Creates a custom Jinja2 environment with:
+    Returns the process-wide custom Jinja2 environment, with:
      - A package a loader that automatically finds templates within a
        'templates' directory in the openassetio_traitgen python package.
-     - Updated globals.
      - Custom filters.
+     - A bytecode cache of compiled templates under
+       bytecode_cache_dir, if set.
+
+    The environment is shared between generate calls, so that
+    templates are only compiled once, and must therefore hold no
+    per-call state. Template globals are instead supplied per render.
     """
-    env = jinja2.Environment(loader=jinja2.PackageLoader("openassetio_traitgen"))
-    env.globals.update(env_globals)
-    _install_custom_filters(env, logger)
+    bytecode_cache = None
+    if bytecode_cache_dir:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(bytecode_cache_dir)
+    env = jinja2.Environment(
+        loader=jinja2.PackageLoader("openassetio_traitgen"), bytecode_cache=bytecode_cache
+    )
+    _install_custom_filters(env)
     return env
 
 
 # Custom filters
 
 
-def _install_custom_filters(environment, logger):
+def _install_custom_filters(environment):
     """
     Installs custom filters in to the Jinja template environment that allow
     data from the model to be conformed to python-specific standards.
 
-    The toPy* methods will log a warning if the string is changed from
-    the input during this process. An error will be raised if this
-    resulted in an empty string.
+    The toPy* methods will log a warning to the current generation
+    logger if the string is changed from the input during this process.
+    An error will be raised if this resulted in an empty string.
     """
 
     def validate_identifier(string: str, original: str):
@@ -252,13 +319,9 @@ def _install_custom_filters(environment, logger):
         to a valid identifier, if the warning has not already been
         logged.
         """
-        warning = f"Conforming '{original}' to '{conformed}' for {context}"
-        if warning in environment.globals["conform_warnings"]:
-            return
-        environment.globals["conform_warnings"].append(warning)
-        logger.warning(warning)
+        # The generation logger de-duplicates messages.
+        helpers.current_logger().warning(f"Conforming '{original}' to '{conformed}' for {context}")
 
-    environment.globals["conform_warnings"] = []
     environment.filters["to_upper_camel_alnum"] = helpers.to_upper_camel_alnum
     environment.filters["to_py_module_name"] = to_py_module_name
     environment.filters["to_py_class_name"] = to_py_class_name
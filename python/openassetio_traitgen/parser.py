@@ -18,18 +18,31 @@ Code to load and validate trait/specification definitions from
 YAML declarations.
 """
 
+import collections
+import functools
 import json
 import operator
 import os
 
-from typing import List, Dict
+from typing import IO, List, Dict, Union
 
 import yaml
 import jsonschema
 
 from . import datamodel
 
-__all__ = ("load_yaml", "validate_package_description", "build_package_declaration")
+__all__ = (
+    "load_yaml",
+    "parse_yaml",
+    "yaml_loader_name",
+    "validate_package_description",
+    "build_package_declaration",
+)
+
+
+# YAML loader
+# Prefer the libyaml-backed loader where available.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def load_yaml(path: str) -> dict:
@@ -37,19 +50,68 @@ def load_yaml(path: str) -> dict:
     Loads specification and trait definitions from a YAML file.
     """
     with open(path, "r", encoding="utf-8") as file:
-        # It would be nice to take advantage of the auto-instantiation
-        # of classes via the load(), but we can't really require
-        # the addition of the `!!python/object` tag - as that would be
-        # somewhat fragile.
-        model = yaml.safe_load(file)
-    return model
+        return parse_yaml(file)
 
 
-def validate_package_description(description: dict):
+def parse_yaml(content: Union[str, bytes, IO]) -> dict:
+    """
+    Loads specification and trait definitions from a YAML document,
+    supplied as a string, UTF-8 encoded bytes or an open stream.
+    """
+    # It would be nice to take advantage of the auto-instantiation
+    # of classes via the load(), but we can't really require
+    # the addition of the `!!python/object` tag - as that would be
+    # somewhat fragile.
+    return yaml.load(content, Loader=_YamlLoader)
+
+
+def yaml_loader_name() -> str:
+    """
+    Returns the name of the PyYAML loader used to load descriptions.
+
+    This is libyaml's `CSafeLoader` if PyYAML was built with libyaml
+    support, otherwise the pure-Python `SafeLoader`, which is
+    considerably slower for large descriptions.
+    """
+    return _YamlLoader.__name__
+
+
+def validate_package_description(description: dict, collect_all_errors: bool = False):
     """
     Validates the supplied package description meets the openassetio-traitgen schema.
+
+    The schema is loaded, checked and compiled into a validator once
+    per process, so repeated calls only pay the cost of validation.
+
+    @param description The package description to validate.
+    @param collect_all_errors If set, every schema violation is
+    collected in a single pass, and reported through one
+    ValidationError, with the individual errors available via its
+    `context`. Otherwise, only the most relevant error is raised, as
+    per `jsonschema.validate`.
+
+    @exception jsonschema.ValidationError If the description does not
+    conform to the schema.
     """
-    jsonschema.validate(description, schema=_load_schema())
+    validator = _schema_validator()
+
+    if not collect_all_errors:
+        error = jsonschema.exceptions.best_match(validator.iter_errors(description))
+        if error is not None:
+            raise error
+        return
+
+    errors = sorted(validator.iter_errors(description), key=_error_path_key)
+    if not errors:
+        return
+
+    summary = "\n".join(
+        f" - {'/'.join(str(part) for part in error.absolute_path) or '<root>'}: {error.message}"
+        for error in errors
+    )
+    raise jsonschema.ValidationError(
+        f"{len(errors)} schema violation(s) found:\n{summary}", context=errors
+    )
 
 
 def build_package_declaration(description: dict) -> datamodel.PackageDeclaration:
@@ -122,15 +184,16 @@ def _unpack_trait_set(trait_set: List[dict], package_id: str) -> List[datamodel.
     # methods, so we endeavour to find the shortest uniquely identifying
     # set of reference components.
 
-    # Build a list of possible unique short names for all the trait
-    # references of the trait set, we can then check for any given
-    # reference, if any shorter set of components has been seen more
-    # than once.
+    # Count the occurrences of the possible unique short names across
+    # all the trait references of the trait set, we can then check for
+    # any given reference, if any shorter set of components has been
+    # seen more than once.
     # (This would be easier if you could mutate NamedTuples after
     # creation, but well, they're tuples aren't they...)
-    all_permutations = []
+    occurrences = collections.Counter()
     for trait in trait_set:
-        all_permutations.extend(((trait["name"],), (trait["namespace"], trait["name"])))
+        occurrences[(trait["name"],)] += 1
+        occurrences[(trait["namespace"], trait["name"])] += 1
 
     references = set()
     for trait in trait_set:
@@ -142,29 +205,25 @@ def _unpack_trait_set(trait_set: List[dict], package_id: str) -> List[datamodel.
         identifier = _build_trait_id(package, namespace, name, version)
 
         # Check to see which of the possible combinations of reference
-        # parts is unique for this trait.
+        # parts is unique for this trait. The fully qualified name is
+        # never counted, so is always considered unique.
         unique_name_parts = (name,)
-        alternatives = [
-            (namespace, name),
-            (package, namespace, name),
-        ]
-        while alternatives and all_permutations.count(unique_name_parts) > 1:
-            unique_name_parts = alternatives.pop(0)
-
-        references.add(
-            datamodel.TraitReference(
-                id=identifier,
-                name=name,
-                namespace=namespace,
-                package=package,
-                version=version,
-                unique_name_parts=unique_name_parts,
-            )
+        if occurrences[unique_name_parts] > 1:
+            unique_name_parts = (namespace, name)
+            if occurrences[unique_name_parts] > 1:
+                unique_name_parts = (package, namespace, name)
+
+        reference = datamodel.TraitReference(
+            id=identifier,
+            name=name,
+            namespace=namespace,
+            package=package,
+            version=version,
+            unique_name_parts=unique_name_parts,
         )
+        references.add(reference)
 
-    references = list(references)
-    references.sort(key=_byId)
-    return references
+    return sorted(references, key=_byId)
 
 
 def _build_trait_id(package: str, namespace: str, name: str, version: str) -> str:
@@ -244,8 +303,29 @@ def _load_schema() -> dict:
         return json.load(file)
 
 
+@functools.lru_cache(maxsize=None)
+def _schema_validator() -> jsonschema.Draft202012Validator:
+    """
+    Returns the process-wide validator for the schema.
+
+    The schema itself is only loaded and checked on first use.
+    """
+    schema = _load_schema()
+    jsonschema.Draft202012Validator.check_schema(schema)
+    return jsonschema.Draft202012Validator(schema)
+
+
 __rootDir = os.path.dirname(__file__)
 
 # Sort key helpers
+
 _byId = operator.attrgetter("id")
 _byName = operator.attrgetter("name")
+
+
+def _error_path_key(error: jsonschema.ValidationError):
+    """
+    Sort key for schema violations, ordering them by their location
+    within the description.
+    """
+    return [str(part) for part in error.absolute_path]
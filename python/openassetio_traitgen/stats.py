@@ -0,0 +1,179 @@
+#
+#   Copyright 2026 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Statistics collected during code generation, for diagnosing where time
+is spent, and tracking the cost of generation in build telemetry.
+
+Statistics for a call to `generate` or `generate_many` are accumulated
+in a GenerationStats instance, which is returned to the caller.
+Generators record the files they render via `record_render`, which
+updates the instance set by the innermost active `collecting` context.
+"""
+
+import contextlib
+import contextvars
+import dataclasses
+import json
+import sys
+import time
+
+from typing import Optional
+
+__all__ = ("GenerationStats", "collecting", "record_render")
+
+
+@dataclasses.dataclass
+class GenerationStats:
+    """
+    Timings and counters for a single generation run.
+
+    Phase timings are wall times in seconds, summed across all the
+    packages (and, for rendering, generators) in the run.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    # Time taken to read and parse the YAML descriptions.
+    load_seconds: float = 0.0
+    # Time taken to validate the descriptions against the schema.
+    validate_seconds: float = 0.0
+    # Time taken to build the PackageDeclarations.
+    build_seconds: float = 0.0
+    # Time taken by the generators, including writing files.
+    render_seconds: float = 0.0
+    # The number of declarations retrieved from the declaration cache,
+    # rather than being validated and built.
+    declarations_cached: int = 0
+    # The number of templates rendered.
+    templates_rendered: int = 0
+    # The number of files written, and their total size.
+    files_written: int = 0
+    bytes_written: int = 0
+    # The number of files left untouched as their content was unchanged.
+    files_skipped: int = 0
+    # The peak resident memory of this process, and any render worker
+    # processes, if it can be determined on this platform.
+    peak_memory_bytes: Optional[int] = None
+
+    @contextlib.contextmanager
+    def timed(self, field: str):
+        """
+        A context manager that adds the wall time of its body to the
+        named `*_seconds` field.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            setattr(self, field, getattr(self, field) + time.perf_counter() - start)
+
+    def update_peak_memory(self):
+        """
+        Updates peak_memory_bytes with the current high-water mark.
+        """
+        self.peak_memory_bytes = _peak_memory_bytes()
+
+    def as_dict(self) -> dict:
+        """
+        Returns the statistics as a flat dictionary.
+        """
+        return dataclasses.asdict(self)
+
+    def to_json(self) -> str:
+        """
+        Returns the statistics as a JSON object.
+        """
+        return json.dumps(self.as_dict(), indent=2)
+
+    def to_text(self) -> str:
+        """
+        Returns a human-readable report of the statistics.
+        """
+        peak_memory = "unknown"
+        if self.peak_memory_bytes is not None:
+            peak_memory = f"{self.peak_memory_bytes / (1024 * 1024):.1f} MiB"
+        lines = [
+            "Generation statistics:",
+            f"  YAML load:           {self.load_seconds:.3f}s",
+            f"  Validation:          {self.validate_seconds:.3f}s",
+            f"  Declaration build:   {self.build_seconds:.3f}s",
+            f"  Rendering:           {self.render_seconds:.3f}s",
+            f"  Cached declarations: {self.declarations_cached}",
+            f"  Templates rendered:  {self.templates_rendered}",
+            f"  Files written:       {self.files_written} ({self.bytes_written} bytes)",
+            f"  Files unchanged:     {self.files_skipped}",
+            f"  Peak memory:         {peak_memory}",
+        ]
+        return "\n".join(lines)
+
+
+@contextlib.contextmanager
+def collecting(stats: GenerationStats):
+    """
+    A context manager that sets the GenerationStats instance updated by
+    `record_render`.
+    """
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def record_render(size: int, written: bool, templates: int = 1):
+    """
+    Records the rendering of a number of templates into a file of size
+    bytes, and whether the file was written, or skipped as unchanged,
+    in the current GenerationStats, if any are being collected.
+    """
+    stats = _current_stats.get(None)
+    if stats is None:
+        return
+    stats.templates_rendered += templates
+    if written:
+        stats.files_written += 1
+        stats.bytes_written += size
+    else:
+        stats.files_skipped += 1
+
+
+#
+# Private implementation
+#
+
+
+# The stats set by collecting.
+_current_stats = contextvars.ContextVar("generation_stats", default=None)
+
+
+def _peak_memory_bytes() -> Optional[int]:
+    """
+    Returns the peak resident set size of this process, or of any of
+    its terminated child processes, whichever is greater, or None if
+    this cannot be determined on this platform.
+    """
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        # Not available on Windows.
+        return None
+
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in bytes on macOS, but kilobytes elsewhere.
+    return peak if sys.platform == "darwin" else peak * 1024
@@ -0,0 +1,208 @@
+#
+#   Copyright 2026 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Measures the compile time and memory of generated C++ packages, for
+synthetic package descriptions of increasing size.
+
+For each size and header layout, a translation unit that includes the
+package header is compiled with -fsyntax-only, so only the compiler
+front end is measured. The best wall time, and the highest peak
+resident memory of the compiler across repeats, are reported.
+
+With --time-trace, the translation unit is instead compiled with
+Clang's -ftime-trace, and the totals of the trace's front end, source
+(header parsing) and template instantiation events are also reported.
+
+Usage: python tests/benchmarks/bench_cpp_compile.py
+    --include-dir OPENASSETIO_INCLUDE_DIR [--include-dir DIR ...]
+    [--sizes N [N ...]] [--layouts L [L ...]] [--cxx COMPILER]
+    [--time-trace] [--repeat N] [--json]
+
+Requires a GCC or Clang compatible compiler, the OpenAssetIO headers,
+and a POSIX platform, to measure the memory of the compiler process.
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from openassetio_traitgen import parser
+from openassetio_traitgen.generators import cpp, helpers
+
+# The helper modules alongside this script, which pylint cannot
+# resolve, as this directory is not a package.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import synthetic  # pylint: disable=import-error,wrong-import-position
+import timing  # pylint: disable=import-error,wrong-import-position
+
+# The Clang time trace events whose totals are reported, and their
+# result keys.
+_TIME_TRACE_TOTALS = {
+    "Total Frontend": "frontend_seconds",
+    "Total Source": "source_seconds",
+    "Total InstantiateFunction": "instantiate_function_seconds",
+    "Total InstantiateClass": "instantiate_class_seconds",
+}
+
+_TRANSLATION_UNIT = "#include <{module}/{module}.hpp>\n"
+
+
+def main():
+    """
+    Runs the benchmarks, writing the results to stdout.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument(
+        "--include-dir",
+        action="append",
+        required=True,
+        help="Include directory of the OpenAssetIO headers. May be given more than once.",
+    )
+    arg_parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="Numbers of traits and specifications to benchmark.",
+    )
+    arg_parser.add_argument(
+        "--layouts",
+        nargs="+",
+        choices=cpp.LAYOUTS,
+        default=cpp.LAYOUTS,
+        help="Header layouts to benchmark.",
+    )
+    arg_parser.add_argument(
+        "--cxx", default=os.getenv("CXX", "c++"), help="Compiler to use. Defaults to $CXX."
+    )
+    arg_parser.add_argument(
+        "--time-trace",
+        action="store_true",
+        help="Compile with -ftime-trace, and report its totals. Requires Clang.",
+    )
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Compiles to take the best of.")
+    arg_parser.add_argument("--json", action="store_true", help="Write results as JSON.")
+    args = arg_parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        print(f"Benchmarking size {size}...", file=sys.stderr)
+        results.extend(
+            run(
+                size,
+                args.layouts,
+                args.cxx,
+                args.include_dir,
+                time_trace=args.time_trace,
+                repeat=args.repeat,
+            )
+        )
+    timing.emit(results, args.json)
+
+
+# pylint: disable=too-many-arguments,too-many-locals
+def run(size: int, layouts, cxx: str, include_dirs, *, time_trace: bool, repeat: int):
+    """
+    Returns the compile time and memory of a translation unit including
+    a synthetic package of the supplied size, generated with each of the
+    supplied layouts.
+    """
+    logger = logging.getLogger("openassetio-traitgen-benchmark")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    declaration = parser.build_package_declaration(synthetic.description(size))
+    module = f"benchmark_{size}"
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for layout in layouts:
+            output_dir = os.path.join(tmp_dir, layout)
+            globals_ = helpers.default_template_globals()
+            globals_["cppLayout"] = layout
+            cpp.generate(declaration, globals_, output_dir, lambda _path: None, logger)
+            package_include_dir = os.path.join(output_dir, module, "include")
+
+            source_path = os.path.join(output_dir, "translation_unit.cpp")
+            with open(source_path, "w", encoding="utf-8") as file:
+                file.write(_TRANSLATION_UNIT.format(module=module))
+
+            command = [cxx, "-std=c++17", f"-I{package_include_dir}"]
+            command += [f"-isystem{include_dir}" for include_dir in include_dirs]
+            if time_trace:
+                object_path = os.path.join(output_dir, "translation_unit.o")
+                command += ["-ftime-trace", "-c", "-o", object_path, source_path]
+            else:
+                command += ["-fsyntax-only", source_path]
+
+            compiles = [_compile(command) for _ in range(repeat)]
+            result = {
+                "layout": layout,
+                "size": size,
+                "headers": _count_headers(package_include_dir),
+                "seconds": min(seconds for seconds, _ in compiles),
+                "max_rss_mib": max(max_rss for _, max_rss in compiles) / 1024**2,
+            }
+            if time_trace:
+                result.update(_time_trace_totals(os.path.splitext(object_path)[0] + ".json"))
+            results.append(result)
+    return results
+
+
+def _compile(command):
+    """
+    Runs the supplied compiler command, returning its wall time in
+    seconds and its peak resident memory in bytes.
+    """
+    start = time.perf_counter()
+    with subprocess.Popen(command, stderr=subprocess.PIPE, text=True) as process:
+        errors = process.stderr.read()
+        # Reap the process ourselves, rather than via Popen.wait, so
+        # that its resource usage can be collected.
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+    seconds = time.perf_counter() - start
+    if process.returncode != 0:
+        raise RuntimeError(f"Compilation failed: {' '.join(command)}\n{errors}")
+    # ru_maxrss is in bytes on macOS, and kilobytes elsewhere.
+    return seconds, usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+
+def _time_trace_totals(trace_path: str) -> dict:
+    """
+    Returns the durations, in seconds, of the reported total events in
+    the supplied Clang time trace.
+    """
+    with open(trace_path, encoding="utf-8") as file:
+        events = json.load(file)["traceEvents"]
+    totals = dict.fromkeys(_TIME_TRACE_TOTALS.values(), 0.0)
+    for event in events:
+        key = _TIME_TRACE_TOTALS.get(event.get("name"))
+        if key is not None:
+            totals[key] = event["dur"] / 1e6
+    return totals
+
+
+def _count_headers(include_dir: str) -> int:
+    return sum(name.endswith(".hpp") for _, _, names in os.walk(include_dir) for name in names)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#
+#   Copyright 2026 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Measures the import time of generated Python packages, with and
+without lazy sub-module imports.
+
+Each import is timed in a fresh interpreter, with openassetio already
+imported, so only the cost of the generated code is measured.
+
+Usage: python tests/benchmarks/bench_import.py [--size N]
+    [--repeat N] [--json]
+
+Requires openassetio.
+"""
+
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+
+from openassetio_traitgen import generate
+
+# The helper modules alongside this script, which pylint cannot
+# resolve, as this directory is not a package.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import synthetic  # pylint: disable=import-error,wrong-import-position
+import timing  # pylint: disable=import-error,wrong-import-position
+
+# Imports the package, then uses a single trait, printing the time
+# taken by each step.
+_IMPORT_SCRIPT = """
+import time
+import openassetio.trait
+
+start = time.perf_counter()
+import {module}
+imported = time.perf_counter()
+{module}.traits.namespace0.Member0Trait_v1.kId
+used = time.perf_counter()
+print(imported - start, used - start)
+"""
+
+
+def main():
+    """
+    Runs the benchmarks, writing the results to stdout.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument(
+        "--size", type=int, default=1000, help="Number of traits and specifications."
+    )
+    arg_parser.add_argument("--repeat", type=int, default=10, help="Imports to take the best of.")
+    arg_parser.add_argument("--json", action="store_true", help="Write results as JSON.")
+    args = arg_parser.parse_args()
+
+    timing.emit(run(args.size, args.repeat), args.json)
+
+
+def run(size: int, repeat: int):
+    """
+    Returns the best import times of a synthetic package of the
+    supplied size, generated with each import style.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        description_path = os.path.join(tmp_dir, "description.yaml")
+        with open(description_path, "w", encoding="utf-8") as file:
+            file.write(synthetic.description_yaml(size))
+
+        for style, lazy_imports in (("eager", False), ("lazy", True)):
+            output_dir = os.path.join(tmp_dir, style)
+            _generate(description_path, output_dir, {"lazyImports": lazy_imports})
+            timings = [_time_import(output_dir, f"benchmark_{size}") for _ in range(repeat)]
+            results.append(
+                {
+                    "imports": style,
+                    "size": size,
+                    "import_seconds": min(imported for imported, _ in timings),
+                    "import_and_use_one_trait_seconds": min(used for _, used in timings),
+                }
+            )
+    return results
+
+
+def _time_import(package_dir: str, module: str):
+    """
+    Returns the time taken to import the package, and to import it and
+    then use a single trait, in a fresh interpreter.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT.format(module=module)],
+        env={
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(filter(None, (package_dir, os.getenv("PYTHONPATH")))),
+        },
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    imported, used = output.split()
+    return float(imported), float(used)
+
+
+def _generate(description_path: str, output_dir: str, template_globals: dict):
+    logger = logging.getLogger("openassetio-traitgen-benchmark")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    generate(
+        description_path,
+        output_dir,
+        "python",
+        lambda _path: None,
+        logger,
+        template_globals=template_globals,
+    )
+    # Compile ahead of time, so the first import doesn't write bytecode.
+    subprocess.run([sys.executable, "-m", "compileall", "-q", output_dir], check=True)
+
+
+if __name__ == "__main__":
+    main()
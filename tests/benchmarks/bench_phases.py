@@ -0,0 +1,159 @@
+#
+#   Copyright 2026 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Times each phase of code generation, separately, for synthetic package
+descriptions of increasing size.
+
+The phases are YAML loading, schema validation, declaration building,
+and rendering with each generator. Each is timed in isolation, using
+the output of the previous phase as input, so that regressions can be
+attributed to a specific phase.
+
+Usage: python tests/benchmarks/bench_phases.py [--sizes N [N ...]]
+    [--trait-set-width W] [--versions V] [--json] [--output PATH]
+"""
+
+import argparse
+import functools
+import logging
+import os
+import shutil
+import sys
+import tempfile
+
+from openassetio_traitgen import parser
+from openassetio_traitgen.generators import cpp, helpers, python
+
+# The helper modules alongside this script, which pylint cannot
+# resolve, as this directory is not a package.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import synthetic  # pylint: disable=import-error,wrong-import-position
+import timing  # pylint: disable=import-error,wrong-import-position
+
+PHASES = ("load", "validate", "build", "python", "cpp")
+
+
+def main():
+    """
+    Runs the benchmarks, writing the results to stdout, or the path
+    supplied via --output.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000, 10000],
+        help="Numbers of traits and specifications to benchmark.",
+    )
+    arg_parser.add_argument(
+        "--trait-set-width", type=int, default=4, help="Traits in each specification."
+    )
+    arg_parser.add_argument(
+        "--versions", type=int, default=1, help="Versions of each trait and specification."
+    )
+    arg_parser.add_argument(
+        "--phases", nargs="+", choices=PHASES, default=PHASES, help="Phases to time."
+    )
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Timings to take the best of.")
+    arg_parser.add_argument("--json", action="store_true", help="Write results as JSON.")
+    arg_parser.add_argument("--output", help="Write results to this file, rather than stdout.")
+    args = arg_parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        print(f"Benchmarking size {size}...", file=sys.stderr)
+        for phase, seconds in run(
+            size, args.trait_set_width, args.versions, args.phases, args.repeat
+        ):
+            results.append(
+                {
+                    "phase": phase,
+                    "size": size,
+                    "trait_set_width": args.trait_set_width,
+                    "versions": args.versions,
+                    "seconds": seconds,
+                    "us_per_member": seconds * 1e6 / (2 * size * args.versions),
+                }
+            )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as stream:
+            timing.emit(results, args.json, stream)
+    else:
+        timing.emit(results, args.json)
+
+
+# pylint: disable=too-many-arguments
+def run(size: int, trait_set_width: int, versions: int, phases, repeat: int):
+    """
+    Yields the phase name and best wall time for each of the requested
+    phases, for a synthetic package of the supplied size.
+
+    Earlier phases are always run once to provide the input for later
+    ones, but only timed if requested.
+    """
+    logger = logging.getLogger("openassetio-traitgen-benchmark")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        description_path = os.path.join(work_dir, "description.yaml")
+        with open(description_path, "w", encoding="utf-8") as file:
+            file.write(synthetic.description_yaml(size, trait_set_width, versions))
+
+        description = parser.load_yaml(description_path)
+        if "load" in phases:
+            yield "load", timing.best_of(lambda: parser.load_yaml(description_path), repeat)
+
+        if "validate" in phases:
+            yield "validate", timing.best_of(
+                lambda: parser.validate_package_description(description), repeat
+            )
+
+        declaration = parser.build_package_declaration(description)
+        if "build" in phases:
+            yield "build", timing.best_of(
+                lambda: parser.build_package_declaration(description), repeat
+            )
+
+        globals_ = helpers.default_template_globals()
+        for name, generator in (("python", python), ("cpp", cpp)):
+            if name not in phases:
+                continue
+            render = functools.partial(
+                generator.generate,
+                declaration,
+                globals_,
+                os.path.join(work_dir, name),
+                _ignore,
+                logger,
+            )
+            # Render once up front to warm the generator's template
+            # cache, so that only rendering is timed.
+            render()
+            yield name, timing.best_of(render, repeat)
+    finally:
+        shutil.rmtree(work_dir)
+
+
+def _ignore(_path):
+    pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+#
+#   Copyright 2026 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Measures the throughput of generated Python trait and specification
+views, and their per-instance memory.
+
+The test packages are generated with the current tree. With
+--baseline, they are also generated with the openassetio-traitgen of
+the supplied git revision, using its default options, and the results
+of both are reported, along with the relative change from the baseline.
+Each set of packages is measured in a separate interpreter, since they
+share module names.
+
+Usage: python tests/benchmarks/bench_python_views.py [--number N]
+    [--cache-trait-views] [--type-checks {raise,assert,none}]
+    [--baseline REVISION] [--json]
+
+Run under `python -O` to measure "assert" type checks with assertions
+disabled.
+
+Requires openassetio.
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import timeit
+import tracemalloc
+
+from openassetio_traitgen import generate
+from openassetio_traitgen.generators import python
+
+# The helper modules alongside this script, which pylint cannot
+# resolve, as this directory is not a package.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import timing  # pylint: disable=import-error,wrong-import-position
+
+_RESOURCES_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "resources")
+_REPO_DIR = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
+_DESCRIPTIONS = tuple(
+    os.path.join(_RESOURCES_DIR, f"openassetio-traitgen-test-{name}.yaml")
+    for name in ("all", "traits-only", "specifications-only")
+)
+
+
+def main():
+    """
+    Runs the benchmarks, writing the results to stdout.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--number", type=int, default=200000, help="Calls per timing.")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="Timings to take the best of.")
+    arg_parser.add_argument(
+        "--cache-trait-views",
+        action="store_true",
+        help="Generate specifications that cache their trait views.",
+    )
+    arg_parser.add_argument(
+        "--type-checks",
+        choices=python.TYPE_CHECKS,
+        default=python.TYPE_CHECKS[0],
+        help="How property accessors check the type of values.",
+    )
+    arg_parser.add_argument(
+        "--baseline",
+        metavar="REVISION",
+        help="A git revision to generate the baseline packages with, using its default options.",
+    )
+    arg_parser.add_argument("--json", action="store_true", help="Write results as JSON.")
+    # Measures packages previously generated into the supplied
+    # directory, writing JSON, for use in a separate interpreter.
+    arg_parser.add_argument("--measure-dir", help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.measure_dir:
+        sys.path.insert(0, args.measure_dir)
+        timing.emit(run(args.number, args.repeat), as_json=True)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        current_dir = os.path.join(tmp_dir, "current")
+        _generate_test_packages(
+            current_dir,
+            {"cacheTraitViews": args.cache_trait_views, "typeChecks": args.type_checks},
+        )
+        results = _measure(current_dir, args.number, args.repeat)
+
+        if args.baseline:
+            baseline_dir = os.path.join(tmp_dir, "baseline")
+            _generate_baseline_test_packages(
+                os.path.join(tmp_dir, "traitgen"), baseline_dir, args.baseline
+            )
+            results = compare(results, _measure(baseline_dir, args.number, args.repeat))
+
+    timing.emit(results, args.json)
+
+
+def run(number: int, repeat: int):
+    """
+    Returns the results of each benchmark, as time per call, or
+    memory per instance.
+
+    The generated test packages must be importable.
+    """
+    # pylint: disable=import-error,import-outside-toplevel,too-many-locals
+    from openassetio.trait import TraitsData
+    import openassetio_traitgen_test_all as package
+
+    trait_cls = package.traits.aNamespace.AllPropertiesTrait_v1
+    specification_cls = package.specifications.test.LocalAndExternalTraitSpecification_v1
+
+    data = TraitsData()
+    trait = trait_cls(data)
+    trait.imbue()
+    trait.setStringProperty("value")
+    specification = specification_cls(data)
+
+    versioned_specification = package.specifications.test.MultipleVersionsOfTraitSpecification_v1(
+        TraitsData()
+    )
+    versioned_specification.multipleVersionsTrait().imbue()
+    versioned_specification.multipleVersionsTrait().setOldProperty("value")
+
+    benchmarks = {
+        "trait construction": lambda: trait_cls(data),
+        "trait getter": trait.getStringProperty,
+        "trait setter": lambda: trait.setStringProperty("value"),
+        "specification construction": lambda: specification_cls(data),
+        "specification trait accessor": (
+            specification.openassetioTraitgenTestAllANamespaceNoPropertiesTrait
+        ),
+        "specification trait accessor and getter": lambda: (
+            versioned_specification.multipleVersionsTrait().getOldProperty()
+        ),
+    }
+
+    results = []
+    for name, func in benchmarks.items():
+        seconds = min(timeit.repeat(func, number=number, repeat=repeat))
+        results.append({"benchmark": name, "value": seconds * 1e9 / number, "unit": "ns/call"})
+
+    for name, cls in (("trait", trait_cls), ("specification", specification_cls)):
+        results.append(
+            {
+                "benchmark": f"{name} instance size",
+                "value": _instance_size(cls, data),
+                "unit": "bytes",
+            }
+        )
+    return results
+
+
+def compare(results, baseline_results):
+    """
+    Returns the supplied results, each with the value of the
+    corresponding baseline result, and the relative change from it.
+    """
+    baseline_values = {result["benchmark"]: result["value"] for result in baseline_results}
+    compared = []
+    for result in results:
+        baseline = baseline_values[result["benchmark"]]
+        compared.append(
+            {
+                "benchmark": result["benchmark"],
+                "value": result["value"],
+                "baseline": baseline,
+                "change_percent": (result["value"] - baseline) * 100 / baseline,
+                "unit": result["unit"],
+            }
+        )
+    return compared
+
+
+def _measure(package_dir: str, number: int, repeat: int):
+    """
+    Returns the results of running the benchmarks against the packages
+    in package_dir, in a fresh interpreter with the same optimization
+    level as this one.
+    """
+    output = subprocess.run(
+        [
+            sys.executable,
+            *["-O"] * sys.flags.optimize,
+            __file__,
+            "--measure-dir",
+            package_dir,
+            "--number",
+            str(number),
+            "--repeat",
+            str(repeat),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def _instance_size(cls, data, count: int = 10000) -> float:
+    """
+    Returns the mean memory allocated per instance of cls, including
+    any instance __dict__.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instances = [cls(data) for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del instances
+    return (after - before) / count
+
+
+def _generate_baseline_test_packages(traitgen_dir: str, output_dir: str, revision: str):
+    """
+    Generates the test packages into output_dir using the CLI of the
+    openassetio-traitgen at the supplied git revision, extracted into
+    traitgen_dir.
+    """
+    archive = subprocess.run(
+        ["git", "-C", _REPO_DIR, "archive", "--format=tar", revision, "python"],
+        check=True,
+        capture_output=True,
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(traitgen_dir)
+
+    env = {**os.environ, "PYTHONPATH": os.path.join(traitgen_dir, "python")}
+    # Older revisions only accept a single description per invocation.
+    for description in _DESCRIPTIONS:
+        subprocess.run(
+            [sys.executable, "-m", "openassetio_traitgen", "-g", "python", "-o"]
+            + [output_dir, description],
+            env=env,
+            check=True,
+        )
+
+
+def _generate_test_packages(output_dir: str, template_globals: dict):
+    logger = logging.getLogger("openassetio-traitgen-benchmark")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    for description in _DESCRIPTIONS:
+        generate(
+            description,
+            output_dir,
+            "python",
+            lambda _path: None,
+            logger,
+            template_globals=template_globals,
+        )
+
+
+if __name__ == "__main__":
+    main()
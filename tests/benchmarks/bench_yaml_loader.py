@@ -0,0 +1,71 @@
+#
+#   Copyright 2026 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Compares the time taken to load a large synthetic description with the
+pure-Python PyYAML loader, and the loader used by `parser.parse_yaml`.
+
+Usage: python tests/benchmarks/bench_yaml_loader.py [--size N] [--json]
+"""
+
+import argparse
+import os
+import sys
+
+import yaml
+
+from openassetio_traitgen import parser
+
+# The helper modules alongside this script, which pylint cannot
+# resolve, as this directory is not a package.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import synthetic  # pylint: disable=import-error,wrong-import-position
+import timing  # pylint: disable=import-error,wrong-import-position
+
+
+def main():
+    """
+    Runs the benchmark, writing the results to stdout.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=1000, help="Traits and specifications.")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Timings to take the best of.")
+    arg_parser.add_argument("--json", action="store_true", help="Write results as JSON.")
+    args = arg_parser.parse_args()
+
+    document = synthetic.description_yaml(args.size)
+
+    results = []
+    loaders = {"SafeLoader": lambda: yaml.load(document, Loader=yaml.SafeLoader)}
+    loaders[f"parse_yaml ({parser.yaml_loader_name()})"] = lambda: parser.parse_yaml(document)
+    for name, load in loaders.items():
+        results.append(
+            {
+                "loader": name,
+                "size": args.size,
+                "bytes": len(document),
+                "seconds": timing.best_of(load, args.repeat),
+            }
+        )
+
+    baseline = results[0]["seconds"]
+    for result in results:
+        result["speedup"] = round(baseline / result["seconds"], 2)
+
+    timing.emit(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
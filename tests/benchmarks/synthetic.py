@@ -0,0 +1,115 @@
+#
+#   Copyright 2026 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Synthetic package descriptions of arbitrary size, for benchmarking.
+
+Descriptions are deterministic for any given set of arguments, and
+conform to the openassetio-traitgen schema.
+"""
+
+import yaml
+
+_PROPERTY_TYPES = ("string", "integer", "float", "boolean")
+
+
+def description(
+    size: int, trait_set_width: int = 4, versions: int = 1, namespace_size: int = 100
+) -> dict:
+    """
+    Returns a package description with `size` traits and `size`
+    specifications, each with the supplied number of versions.
+
+    Members are spread across namespaces of at most namespace_size
+    members. Every trait has one property of each supported type, and
+    every specification's trait set references trait_set_width traits,
+    spread across namespaces, such that larger packages exercise the
+    resolution of colliding trait names.
+    """
+    trait_set_width = min(trait_set_width, size)
+    traits = {}
+    specifications = {}
+
+    for index in range(size):
+        namespace = _namespace_name(index, namespace_size)
+        name = _member_name(index, namespace_size)
+
+        traits.setdefault(namespace, {"description": f"Traits {namespace}.", "members": {}})
+        traits[namespace]["members"][name] = {
+            "versions": {
+                str(version): {
+                    "description": f"Trait {name} v{version}.",
+                    "properties": {
+                        f"{type_}Property": {
+                            "type": type_,
+                            "description": f"A {type_}-typed property.",
+                        }
+                        for type_ in _PROPERTY_TYPES
+                    },
+                    "usage": ["entity"],
+                }
+                for version in range(1, versions + 1)
+            }
+        }
+
+        # Stride through the traits so that each trait set spans
+        # several namespaces.
+        stride = max(1, size // trait_set_width)
+        trait_set = []
+        for offset in range(trait_set_width):
+            trait_index = (index + offset * stride) % size
+            trait_set.append(
+                {
+                    "namespace": _namespace_name(trait_index, namespace_size),
+                    "name": _member_name(trait_index, namespace_size),
+                    "version": str(versions),
+                }
+            )
+
+        specifications.setdefault(
+            namespace, {"description": f"Specifications {namespace}.", "members": {}}
+        )
+        specifications[namespace]["members"][name] = {
+            "versions": {
+                str(version): {
+                    "description": f"Specification {name} v{version}.",
+                    "traitSet": trait_set,
+                }
+                for version in range(1, versions + 1)
+            }
+        }
+
+    return {
+        "package": f"benchmark-{size}",
+        "description": f"A synthetic package with {size} traits and specifications.",
+        "traits": traits,
+        "specifications": specifications,
+    }
+
+
+def description_yaml(*args, **kwargs) -> str:
+    """
+    Returns the YAML document for the description created by
+    `description` with the supplied arguments.
+    """
+    return yaml.dump(description(*args, **kwargs), Dumper=getattr(yaml, "CDumper", yaml.Dumper))
+
+
+def _namespace_name(index: int, namespace_size: int) -> str:
+    return f"namespace{index // namespace_size}"
+
+
+def _member_name(index: int, namespace_size: int) -> str:
+    return f"Member{index % namespace_size}"
@@ -0,0 +1,64 @@
+#
+#   Copyright 2026 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Shared timing and reporting utilities for the benchmark scripts.
+"""
+
+import json
+import sys
+import time
+
+from typing import Callable, Dict, List
+
+
+def best_of(func: Callable, repeat: int) -> float:
+    """
+    Calls func repeat times, returning the fastest wall time in seconds.
+
+    The minimum is the least noisy estimate of the cost of func, as
+    interference from the rest of the system only ever adds time.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def emit(results: List[Dict], as_json: bool, stream=sys.stdout):
+    """
+    Writes the supplied results, a list of flat dicts sharing the same
+    keys, either as a JSON array or a human-readable table.
+    """
+    if as_json:
+        json.dump(results, stream, indent=2)
+        stream.write("\n")
+        return
+
+    if not results:
+        return
+    columns = list(results[0])
+    cells = [[_format(result[column]) for column in columns] for result in results]
+    widths = [max(len(row[i]) for row in [columns, *cells]) for i in range(len(columns))]
+    for row in [columns, *cells]:
+        stream.write("  ".join(cell.rjust(width) for cell, width in zip(row, widths)) + "\n")
+
+
+def _format(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
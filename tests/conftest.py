@@ -53,6 +53,11 @@ def yaml_path_specifications_only(resources_dir):
     return os.path.join(resources_dir, "openassetio-traitgen-test-specifications-only.yaml")
 
 
+@pytest.fixture(scope="package")
+def yaml_path_mixed_case(resources_dir):
+    return os.path.join(resources_dir, "openassetio-traitgen-test-mixed-case.yaml")
+
+
 @pytest.fixture(scope="package")
 def yaml_path_invalid(resources_dir):
     return os.path.join(resources_dir, "invalid.yaml")
@@ -580,6 +585,42 @@ def declaration_exotic_values():
     )
 
 
+@pytest.fixture
+def declaration_reserved_property_id():
+    """
+    A declaration with a trait property whose accessors would collide
+    with the bulk property accessors of the trait.
+    """
+    return datamodel.PackageDeclaration(
+        id="p",
+        description="",
+        traits=[
+            datamodel.NamespaceDeclaration(
+                id="n",
+                description="",
+                members=[
+                    datamodel.TraitDeclaration(
+                        id="p:n.T",
+                        version="1",
+                        name="T",
+                        deprecated=False,
+                        description="",
+                        usage=[],
+                        properties=[
+                            datamodel.PropertyDeclaration(
+                                id="properties",
+                                description="",
+                                type=datamodel.PropertyType.STRING,
+                            )
+                        ],
+                    ),
+                ],
+            ),
+        ],
+        specifications=[],
+    )
+
+
 @pytest.fixture(scope="session")
 def declaration_invalid_identifiers():
     """
@@ -652,11 +693,19 @@ def creations_minimal_by_generator():
             os.path.join("p_p"),
             os.path.join("p_p", "traits"),
             os.path.join("p_p", "traits", "tn.py"),
+            os.path.join("p_p", "traits", "tn.pyi"),
             os.path.join("p_p", "traits", "__init__.py"),
+            os.path.join("p_p", "traits", "__init__.pyi"),
             os.path.join("p_p", "specifications"),
             os.path.join("p_p", "specifications", "sn.py"),
+            os.path.join("p_p", "specifications", "sn.pyi"),
             os.path.join("p_p", "specifications", "__init__.py"),
+            os.path.join("p_p", "specifications", "__init__.pyi"),
+            os.path.join("p_p", "registry.py"),
+            os.path.join("p_p", "registry.pyi"),
             os.path.join("p_p", "__init__.py"),
+            os.path.join("p_p", "__init__.pyi"),
+            os.path.join("p_p", "py.typed"),
         ],
         "cpp": [
             os.path.join("p_p", "include", "p_p"),
@@ -670,6 +719,7 @@ def creations_minimal_by_generator():
             os.path.join("p_p", "include", "p_p", "specifications", "sn", "SSpecification.hpp"),
             os.path.join("p_p", "include", "p_p", "specifications", "sn.hpp"),
             os.path.join("p_p", "include", "p_p", "specifications", "specifications.hpp"),
+            os.path.join("p_p", "include", "p_p", "registry.hpp"),
             os.path.join("p_p", "include", "p_p", "p_p.hpp"),
         ],
     }
@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+#
+# Script that configures the compile time benchmark project, then times
+# a clean build of its translation units with and without the package's
+# precompiled header.
+#
+# Fails only if the project cannot be configured or built, since build
+# times vary too much between machines to assert on.
+#
+# Usage:
+#   cmake -DSOURCE_DIR=<dir> -DBINARY_DIR=<dir> -DGENERATOR=<generator>
+#         -DCXX_COMPILER=<path> -DCONFIG=<config> -DOpenAssetIO_DIR=<dir>
+#         -DPACKAGE_CMAKE_TARGET=<path> -P compile_time.cmake
+cmake_minimum_required(VERSION 3.23)
+
+foreach (_var SOURCE_DIR BINARY_DIR GENERATOR CXX_COMPILER OpenAssetIO_DIR
+        PACKAGE_CMAKE_TARGET)
+    if (NOT DEFINED ${_var})
+        message(FATAL_ERROR "${_var} must be defined")
+    endif ()
+endforeach ()
+if (NOT CONFIG)
+    set(CONFIG Release)
+endif ()
+
+execute_process(
+    COMMAND ${CMAKE_COMMAND}
+    -S ${SOURCE_DIR}
+    -B ${BINARY_DIR}
+    -G ${GENERATOR}
+    -DCMAKE_CXX_COMPILER=${CXX_COMPILER}
+    -DCMAKE_BUILD_TYPE=${CONFIG}
+    -DOpenAssetIO_DIR=${OpenAssetIO_DIR}
+    -DOPENASSETIO_TRAITGENTEST_BENCH_PACKAGE_CMAKE_TARGET=${PACKAGE_CMAKE_TARGET}
+    RESULT_VARIABLE _result
+)
+if (NOT _result EQUAL 0)
+    message(FATAL_ERROR "Failed to configure compile time benchmark project")
+endif ()
+
+foreach (_target without-pch with-pch)
+    string(TIMESTAMP _start "%s%f")
+    execute_process(
+        COMMAND ${CMAKE_COMMAND}
+        --build ${BINARY_DIR} --target ${_target} --config ${CONFIG} --clean-first
+        OUTPUT_VARIABLE _output
+        ERROR_VARIABLE _output
+        RESULT_VARIABLE _result
+    )
+    string(TIMESTAMP _end "%s%f")
+    if (NOT _result EQUAL 0)
+        message(FATAL_ERROR "Failed to build ${_target}:\n${_output}")
+    endif ()
+    math(EXPR _elapsed_ms "(${_end} - ${_start}) / 1000")
+    message(STATUS "${_target}: ${_elapsed_ms} ms")
+endforeach ()
@@ -0,0 +1,51 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2026 The Foundry Visionmongers Ltd
+#include "measure.hpp"
+
+#include <cstdlib>
+#include <iostream>
+#include <new>
+
+namespace {
+std::size_t allocations = 0;
+}  // namespace
+
+void* operator new(std::size_t size) {
+  ++allocations;
+  if (void* ptr = std::malloc(size == 0 ? 1 : size)) {
+    return ptr;
+  }
+  throw std::bad_alloc{};
+}
+
+// GCC can't tell that operator new uses malloc, so warns of a mismatch
+// where operator delete is inlined.
+#if defined(__GNUC__) && !defined(__clang__)
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wmismatched-new-delete"
+#endif
+void operator delete(void* ptr) noexcept { std::free(ptr); }
+
+void operator delete(void* ptr, std::size_t /*size*/) noexcept { std::free(ptr); }
+#if defined(__GNUC__) && !defined(__clang__)
+#pragma GCC diagnostic pop
+#endif
+
+namespace openassetio_traitgentest::bench {
+std::size_t allocationCount() { return allocations; }
+
+int report(const std::vector<std::pair<Result, Result>>& results) {
+  int status = EXIT_SUCCESS;
+  for (const auto& [generated, equivalent] : results) {
+    for (const Result& result : {generated, equivalent}) {
+      std::cout << result.name << ": " << result.allocationsPerCall << " allocations/call, "
+                << result.nanosecondsPerCall << " ns/call\n";
+    }
+    if (generated.allocationsPerCall > equivalent.allocationsPerCall) {
+      std::cout << generated.name << " makes more allocations than " << equivalent.name << "\n";
+      status = EXIT_FAILURE;
+    }
+  }
+  return status;
+}
+}  // namespace openassetio_traitgentest::bench
@@ -0,0 +1,54 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2026 The Foundry Visionmongers Ltd
+/**
+ * Utilities for measuring the heap allocations and time per call of
+ * generated code.
+ */
+#pragma once
+
+#include <chrono>
+#include <cstddef>
+#include <string_view>
+#include <utility>
+#include <vector>
+
+namespace openassetio_traitgentest::bench {
+/// Heap allocations made so far, counted by the replacement global
+/// operator new defined in measure.cpp.
+std::size_t allocationCount();
+
+/// Allocations and time per call of a measured function.
+struct Result {
+  std::string_view name;
+  double allocationsPerCall;
+  double nanosecondsPerCall;
+};
+
+/**
+ * Returns the allocations and time per call of the supplied function.
+ *
+ * The function is called once before measuring, so that e.g. any
+ * property it sets already exists.
+ */
+template <class Function>
+Result measure(std::string_view name, std::size_t calls, const Function& function) {
+  function();
+  const std::size_t allocationsBefore = allocationCount();
+  const auto start = std::chrono::steady_clock::now();
+  for (std::size_t call = 0; call < calls; ++call) {
+    function();
+  }
+  const std::chrono::duration<double, std::nano> elapsed =
+      std::chrono::steady_clock::now() - start;
+  const auto callCount = static_cast<double>(calls);
+  return {name, static_cast<double>(allocationCount() - allocationsBefore) / callCount,
+          elapsed.count() / callCount};
+}
+
+/**
+ * Prints pairs of results for generated code and its equivalent, and
+ * returns a failure status if any generated code makes more
+ * allocations than its equivalent.
+ */
+int report(const std::vector<std::pair<Result, Result>>& results);
+}  // namespace openassetio_traitgentest::bench
@@ -0,0 +1,69 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2026 The Foundry Visionmongers Ltd
+/**
+ * Measures the heap allocations and time per call of generated trait
+ * property accessors, which use the trait's static property keys,
+ * against equivalent calls that construct a key on every call.
+ *
+ * Exits with a non-zero status if the generated accessors make more
+ * allocations than the equivalent calls.
+ */
+#include <cstddef>
+#include <utility>
+#include <vector>
+
+#include <openassetio_traitgen_bench/openassetio_traitgen_bench.hpp>
+
+#include "measure.hpp"
+
+namespace openassetio_abi = openassetio::v1;
+namespace property = openassetio_abi::trait::property;
+using openassetio_traitgen_bench::traits::bench::PropertiesTrait_v1;
+using openassetio_traitgentest::bench::measure;
+using openassetio_traitgentest::bench::Result;
+
+namespace {
+/// Calls per measurement.
+constexpr std::size_t kCalls = 1000000;
+}  // namespace
+
+int main() {
+  const openassetio_abi::trait::TraitsDataPtr traitsData =
+      openassetio_abi::trait::TraitsData::make();
+  PropertiesTrait_v1 trait{traitsData};
+  const openassetio_abi::Int aValue = 1;
+
+  // Pairs of generated accessors and the equivalent calls with a key
+  // constructed per call.
+  const std::vector<std::pair<Result, Result>> results{
+      {measure("set short name (static key)", kCalls, [&] { trait.setSize(aValue); }),
+       measure("set short name (per-call key)", kCalls,
+               [&] {
+                 traitsData->setTraitProperty(PropertiesTrait_v1::kId, property::Key{"size"},
+                                              aValue);
+               })},
+      {measure("get short name (static key)", kCalls,
+               [&] { static_cast<void>(trait.getSize()); }),
+       measure("get short name (per-call key)", kCalls,
+               [&] {
+                 property::Value value;
+                 static_cast<void>(
+                     traitsData->getTraitProperty(&value, PropertiesTrait_v1::kId, "size"));
+               })},
+      {measure("set long name (static key)", kCalls,
+               [&] { trait.setAPropertyWithALongerName(aValue); }),
+       measure("set long name (per-call key)", kCalls,
+               [&] {
+                 traitsData->setTraitProperty(PropertiesTrait_v1::kId,
+                                              property::Key{"aPropertyWithALongerName"}, aValue);
+               })},
+      {measure("get long name (static key)", kCalls,
+               [&] { static_cast<void>(trait.getAPropertyWithALongerName()); }),
+       measure("get long name (per-call key)", kCalls, [&] {
+         property::Value value;
+         static_cast<void>(traitsData->getTraitProperty(&value, PropertiesTrait_v1::kId,
+                                                        "aPropertyWithALongerName"));
+       })}};
+
+  return openassetio_traitgentest::bench::report(results);
+}
@@ -0,0 +1,45 @@
+// SPDX-License-Identifier: Apache-2.0
+// Copyright 2026 The Foundry Visionmongers Ltd
+/**
+ * Measures the heap allocations and time per call of reading a large
+ * string property through the generated view accessor, reusing a
+ * caller-owned value, against the generated getter, which copies the
+ * string out of a temporary value.
+ *
+ * Exits with a non-zero status if the view accessor makes more
+ * allocations than the getter.
+ */
+#include <cstddef>
+#include <utility>
+#include <vector>
+
+#include <openassetio_traitgen_bench/openassetio_traitgen_bench.hpp>
+
+#include "measure.hpp"
+
+namespace openassetio_abi = openassetio::v1;
+using openassetio_traitgen_bench::traits::bench::PropertiesTrait_v1;
+using openassetio_traitgentest::bench::measure;
+using openassetio_traitgentest::bench::Result;
+
+namespace {
+/// Calls per measurement.
+constexpr std::size_t kCalls = 100000;
+/// Size of the string property, in bytes.
+constexpr std::size_t kPayloadSize = 64 * 1024;
+}  // namespace
+
+int main() {
+  const openassetio_abi::trait::TraitsDataPtr traitsData =
+      openassetio_abi::trait::TraitsData::make();
+  PropertiesTrait_v1 trait{traitsData};
+  trait.setPayload(openassetio_abi::Str(kPayloadSize, 'x'));
+  openassetio_abi::trait::property::Value value;
+
+  const std::vector<std::pair<Result, Result>> results{
+      {measure("view large string", kCalls,
+               [&] { static_cast<void>(trait.viewPayload(&value)); }),
+       measure("get large string", kCalls, [&] { static_cast<void>(trait.getPayload()); })}};
+
+  return openassetio_traitgentest::bench::report(results);
+}
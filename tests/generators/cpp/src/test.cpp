@@ -1,23 +1,37 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2022 The Foundry Visionmongers Ltd
+#include <algorithm>
+#include <cstddef>
 #include <string_view>
 #include <type_traits>
+#include <variant>
+#include <vector>
 
 #include <catch2/catch.hpp>
 
 #if defined OPENASSETIO_TRAITGENTEST_INCLUDES_PACKAGE
 #include <openassetio_traitgen_test_all/openassetio_traitgen_test_all.hpp>
+#include <openassetio_traitgen_test_mixed_case/openassetio_traitgen_test_mixed_case.hpp>
 #include <openassetio_traitgen_test_specifications_only/openassetio_traitgen_test_specifications_only.hpp>
 #elif defined OPENASSETIO_TRAITGENTEST_INCLUDES_SUBPACKAGE
+#include <openassetio_traitgen_test_all/registry.hpp>
 #include <openassetio_traitgen_test_all/specifications/specifications.hpp>
 #include <openassetio_traitgen_test_all/traits/traits.hpp>
+#include <openassetio_traitgen_test_mixed_case/registry.hpp>
+#include <openassetio_traitgen_test_mixed_case/specifications/specifications.hpp>
+#include <openassetio_traitgen_test_mixed_case/traits/traits.hpp>
 #include <openassetio_traitgen_test_specifications_only/specifications/specifications.hpp>
 #elif defined OPENASSETIO_TRAITGENTEST_INCLUDES_NAMESPACE
+#include <openassetio_traitgen_test_all/registry.hpp>
 #include <openassetio_traitgen_test_all/specifications/test.hpp>
 #include <openassetio_traitgen_test_all/traits/aNamespace.hpp>
 #include <openassetio_traitgen_test_all/traits/anotherNamespace.hpp>
+#include <openassetio_traitgen_test_mixed_case/registry.hpp>
+#include <openassetio_traitgen_test_mixed_case/specifications/test.hpp>
+#include <openassetio_traitgen_test_mixed_case/traits/aNamespace.hpp>
 #include <openassetio_traitgen_test_specifications_only/specifications/test.hpp>
 #elif defined OPENASSETIO_TRAITGENTEST_INCLUDES_CLASS
+#include <openassetio_traitgen_test_all/registry.hpp>
 #include <openassetio_traitgen_test_all/specifications/test/DeprecatedSpecification.hpp>
 #include <openassetio_traitgen_test_all/specifications/test/LocalAndExternalTraitSpecification.hpp>
 #include <openassetio_traitgen_test_all/specifications/test/MultipleVersionsOfTraitSpecification.hpp>
@@ -29,6 +43,12 @@
 #include <openassetio_traitgen_test_all/traits/aNamespace/NoPropertiesMultipleUsageTrait.hpp>
 #include <openassetio_traitgen_test_all/traits/aNamespace/NoPropertiesTrait.hpp>
 #include <openassetio_traitgen_test_all/traits/anotherNamespace/NoPropertiesTrait.hpp>
+#include <openassetio_traitgen_test_mixed_case/registry.hpp>
+#include <openassetio_traitgen_test_mixed_case/specifications/test/AllTraitsSpecification.hpp>
+#include <openassetio_traitgen_test_mixed_case/specifications/test/PluginSourceSpecification.hpp>
+#include <openassetio_traitgen_test_mixed_case/traits/aNamespace/DBTableTrait.hpp>
+#include <openassetio_traitgen_test_mixed_case/traits/aNamespace/DCCPluginTrait.hpp>
+#include <openassetio_traitgen_test_mixed_case/traits/aNamespace/DataSourceTrait.hpp>
 #include <openassetio_traitgen_test_specifications_only/specifications/test/SomeSpecification.hpp>
 #else
 #error "An #include style must be chosen"
@@ -402,6 +422,48 @@ struct PropertyFixture<openassetio_abi::Str> {
 };
 }  // namespace
 
+SCENARIO("Trait application to collections of TraitsData") {
+  using openassetio_traitgen_test_all::traits::aNamespace::AllPropertiesTrait_v1;
+  using openassetio_traitgen_test_all::traits::aNamespace::NoPropertiesTrait_v1;
+
+  GIVEN("a collection of TraitsData, some with an AllPropertiesTrait") {
+    const openassetio_abi::trait::TraitsDatas traitsDatas{
+        openassetio_abi::trait::TraitsData::make({AllPropertiesTrait_v1::kId}),
+        openassetio_abi::trait::TraitsData::make({NoPropertiesTrait_v1::kId}),
+        openassetio_abi::trait::TraitsData::make(
+            {AllPropertiesTrait_v1::kId, NoPropertiesTrait_v1::kId})};
+
+    WHEN("imbued instances are filtered") {
+      const openassetio_abi::trait::TraitsDatas imbued =
+          AllPropertiesTrait_v1::filterImbued(traitsDatas);
+
+      THEN("imbued instances are returned in their original order") {
+        REQUIRE(imbued.size() == 2);
+        CHECK(imbued[0] == traitsDatas[0]);
+        CHECK(imbued[1] == traitsDatas[2]);
+      }
+    }
+
+    WHEN("imbued instances are counted") {
+      const std::size_t count = AllPropertiesTrait_v1::countImbued(traitsDatas);
+
+      THEN("number of imbued instances is returned") { CHECK(count == 2); }
+    }
+
+    WHEN("trait is applied to all instances") {
+      AllPropertiesTrait_v1::imbueAll(traitsDatas);
+
+      THEN("all instances have the trait") {
+        CHECK(AllPropertiesTrait_v1::countImbued(traitsDatas) == traitsDatas.size());
+      }
+
+      THEN("existing traits are retained") {
+        CHECK(NoPropertiesTrait_v1::countImbued(traitsDatas) == 2);
+      }
+    }
+  }
+}
+
 TEMPLATE_TEST_CASE("Property getters", "", openassetio_abi::Bool, openassetio_abi::Int,
                    openassetio_abi::Float, openassetio_abi::Str) {
   using openassetio_traitgen_test_all::traits::aNamespace::AllPropertiesTrait_v1;
@@ -552,6 +614,334 @@ SCENARIO("Moveable property setters") {
   }
 }
 
+SCENARIO("Bulk property accessors") {
+  using openassetio_traitgen_test_all::traits::aNamespace::AllPropertiesTrait_v1;
+
+  GIVEN("an AllPropertiesTrait view of a blank TraitsData") {
+    const openassetio_abi::trait::TraitsDataPtr traitsData =
+        openassetio_abi::trait::TraitsData::make();
+    AllPropertiesTrait_v1 trait{traitsData};
+
+    WHEN("some properties are set in bulk") {
+      AllPropertiesTrait_v1::Properties properties;
+      properties.intProperty = 42;
+      properties.stringProperty = "some string";
+      trait.setProperties(std::move(properties));
+
+      THEN("TraitsData contains the set values") {
+        openassetio_abi::trait::property::Value value;
+        CHECK(traitsData->getTraitProperty(&value, AllPropertiesTrait_v1::kId, "intProperty"));
+        CHECK(std::get<openassetio_abi::Int>(value) == 42);
+        CHECK(
+            traitsData->getTraitProperty(&value, AllPropertiesTrait_v1::kId, "stringProperty"));
+        CHECK(std::get<openassetio_abi::Str>(value) == "some string");
+      }
+
+      THEN("empty properties are not set") {
+        openassetio_abi::trait::property::Value value;
+        CHECK_FALSE(
+            traitsData->getTraitProperty(&value, AllPropertiesTrait_v1::kId, "boolProperty"));
+        CHECK_FALSE(
+            traitsData->getTraitProperty(&value, AllPropertiesTrait_v1::kId, "floatProperty"));
+      }
+
+      AND_WHEN("properties are queried in bulk") {
+        const AllPropertiesTrait_v1::Properties actual = trait.getProperties();
+
+        THEN("set properties have their values and others are empty") {
+          CHECK(actual.intProperty == openassetio_abi::Int{42});
+          CHECK(actual.stringProperty == openassetio_abi::Str{"some string"});
+          CHECK_FALSE(actual.boolProperty.has_value());
+          CHECK_FALSE(actual.floatProperty.has_value());
+        }
+      }
+    }
+
+    WHEN("a property of an unexpected type is queried in bulk") {
+      traitsData->setTraitProperty(AllPropertiesTrait_v1::kId, "intProperty",
+                                   openassetio_abi::Str{"not an int"});
+
+      THEN("exception is thrown") {
+        CHECK_THROWS_MATCHES(
+            trait.getProperties(), std::runtime_error,
+            Catch::Matchers::Message("Invalid stored value type: should be 'openassetio::Int'."));
+      }
+    }
+  }
+}
+
+SCENARIO("Property keys") {
+  using openassetio_traitgen_test_all::traits::aNamespace::AllPropertiesTrait_v1;
+
+  THEN("each property has a key constant holding its ID") {
+    CHECK(AllPropertiesTrait_v1::kBoolPropertyKey == "boolProperty");
+    CHECK(AllPropertiesTrait_v1::kFloatPropertyKey == "floatProperty");
+    CHECK(AllPropertiesTrait_v1::kIntPropertyKey == "intProperty");
+    CHECK(AllPropertiesTrait_v1::kStringPropertyKey == "stringProperty");
+  }
+
+  GIVEN("a TraitsData with a property set using its key constant") {
+    const openassetio_abi::trait::TraitsDataPtr traitsData =
+        openassetio_abi::trait::TraitsData::make();
+    traitsData->setTraitProperty(AllPropertiesTrait_v1::kId,
+                                 AllPropertiesTrait_v1::kIntPropertyKey, openassetio_abi::Int{3});
+
+    THEN("the property is retrieved by the trait view") {
+      CHECK(AllPropertiesTrait_v1{traitsData}.getIntProperty() == openassetio_abi::Int{3});
+    }
+  }
+}
+
+SCENARIO("Viewing string properties") {
+  using openassetio_traitgen_test_all::traits::aNamespace::AllPropertiesTrait_v1;
+
+  GIVEN("a trait view wrapping a TraitsData") {
+    const openassetio_abi::trait::TraitsDataPtr traitsData =
+        openassetio_abi::trait::TraitsData::make();
+    AllPropertiesTrait_v1 trait{traitsData};
+    openassetio_abi::trait::property::Value value;
+
+    WHEN("an unset string property is viewed") {
+      const openassetio_abi::Str* view = trait.viewStringProperty(&value);
+
+      THEN("no value is returned") { CHECK(view == nullptr); }
+    }
+
+    WHEN("a set string property is viewed") {
+      trait.setStringProperty("a value");
+      const openassetio_abi::Str* view = trait.viewStringProperty(&value);
+
+      THEN("the returned value points into the supplied value") {
+        REQUIRE(view != nullptr);
+        CHECK(*view == "a value");
+        CHECK(view == std::get_if<openassetio_abi::Str>(&value));
+      }
+
+      AND_WHEN("the property is changed and viewed again with the same value") {
+        trait.setStringProperty("another value");
+        view = trait.viewStringProperty(&value);
+
+        THEN("the new value is returned") {
+          REQUIRE(view != nullptr);
+          CHECK(*view == "another value");
+        }
+      }
+    }
+
+    WHEN("a string property of an unexpected type is viewed") {
+      traitsData->setTraitProperty(AllPropertiesTrait_v1::kId,
+                                   AllPropertiesTrait_v1::kStringPropertyKey,
+                                   openassetio_abi::Int{1});
+
+      THEN("exception is thrown") {
+        CHECK_THROWS_MATCHES(
+            trait.viewStringProperty(&value), std::runtime_error,
+            Catch::Matchers::Message("Invalid stored value type: should be 'openassetio::Str'."));
+      }
+    }
+  }
+}
+
+SCENARIO("Specification matching") {
+  namespace registry = openassetio_traitgen_test_all::registry;
+  using openassetio_traitgen_test_all::specifications::test::LocalAndExternalTraitSpecification_v1;
+  using openassetio_traitgen_test_all::specifications::test::TwoLocalTraitsSpecification_v1;
+
+  CHECK(std::is_sorted(LocalAndExternalTraitSpecification_v1::kSortedTraitIds.begin(),
+                       LocalAndExternalTraitSpecification_v1::kSortedTraitIds.end()));
+
+  GIVEN("a TraitsData created by a LocalAndExternalTraitSpecification") {
+    const openassetio_abi::trait::TraitsDataPtr traitsData =
+        LocalAndExternalTraitSpecification_v1::create().traitsData();
+
+    THEN("it is matched by the specification") {
+      CHECK(LocalAndExternalTraitSpecification_v1::isMatchedBy(traitsData));
+    }
+
+    THEN("it is not matched by another specification") {
+      CHECK_FALSE(TwoLocalTraitsSpecification_v1::isMatchedBy(traitsData));
+    }
+
+    WHEN("matching specifications in the package are queried") {
+      const std::vector<registry::SpecificationView> matches =
+          registry::matchingSpecifications(traitsData);
+
+      THEN("only a view on the data as the specification is returned") {
+        REQUIRE(matches.size() == 1);
+        REQUIRE(std::holds_alternative<LocalAndExternalTraitSpecification_v1>(matches[0]));
+        CHECK(std::get<LocalAndExternalTraitSpecification_v1>(matches[0]).traitsData() ==
+              traitsData);
+      }
+    }
+  }
+
+  GIVEN("the sorted trait IDs of a LocalAndExternalTraitSpecification") {
+    const std::vector<std::string_view> traitIds{
+        LocalAndExternalTraitSpecification_v1::kSortedTraitIds.begin(),
+        LocalAndExternalTraitSpecification_v1::kSortedTraitIds.end()};
+
+    THEN("they are matched by the specification") {
+      CHECK(LocalAndExternalTraitSpecification_v1::isMatchedBy(traitIds));
+    }
+
+    THEN("they are not matched by another specification") {
+      CHECK_FALSE(TwoLocalTraitsSpecification_v1::isMatchedBy(traitIds));
+    }
+  }
+
+  GIVEN("a blank TraitsData") {
+    const openassetio_abi::trait::TraitsDataPtr traitsData =
+        openassetio_abi::trait::TraitsData::make();
+
+    THEN("it is not matched by the specification") {
+      CHECK_FALSE(LocalAndExternalTraitSpecification_v1::isMatchedBy(traitsData));
+    }
+
+    THEN("no specifications in the package match") {
+      CHECK(registry::matchingSpecifications(traitsData).empty());
+    }
+  }
+}
+
+SCENARIO("Specification matching with IDs ordered differently when case is ignored") {
+  namespace registry = openassetio_traitgen_test_mixed_case::registry;
+  using openassetio_traitgen_test_mixed_case::specifications::test::AllTraitsSpecification_v1;
+  using openassetio_traitgen_test_mixed_case::specifications::test::PluginSourceSpecification_v1;
+
+  CHECK(std::is_sorted(AllTraitsSpecification_v1::kSortedTraitIds.begin(),
+                       AllTraitsSpecification_v1::kSortedTraitIds.end()));
+  CHECK(std::is_sorted(PluginSourceSpecification_v1::kSortedTraitIds.begin(),
+                       PluginSourceSpecification_v1::kSortedTraitIds.end()));
+
+  GIVEN("a TraitsData created by an AllTraitsSpecification") {
+    const openassetio_abi::trait::TraitsDataPtr traitsData =
+        AllTraitsSpecification_v1::create().traitsData();
+
+    THEN("it is matched by both specifications") {
+      CHECK(AllTraitsSpecification_v1::isMatchedBy(traitsData));
+      CHECK(PluginSourceSpecification_v1::isMatchedBy(traitsData));
+    }
+
+    WHEN("matching specifications in the package are queried") {
+      const std::vector<registry::SpecificationView> matches =
+          registry::matchingSpecifications(traitsData);
+
+      THEN("both specifications are returned") {
+        REQUIRE(matches.size() == 2);
+        CHECK(std::holds_alternative<AllTraitsSpecification_v1>(matches[0]));
+        CHECK(std::holds_alternative<PluginSourceSpecification_v1>(matches[1]));
+      }
+    }
+  }
+
+  GIVEN("a TraitsData created by a PluginSourceSpecification") {
+    const openassetio_abi::trait::TraitsDataPtr traitsData =
+        PluginSourceSpecification_v1::create().traitsData();
+
+    THEN("it is matched by only that specification") {
+      CHECK_FALSE(AllTraitsSpecification_v1::isMatchedBy(traitsData));
+      CHECK(PluginSourceSpecification_v1::isMatchedBy(traitsData));
+    }
+
+    WHEN("matching specifications in the package are queried") {
+      const std::vector<registry::SpecificationView> matches =
+          registry::matchingSpecifications(traitsData);
+
+      THEN("only that specification is returned") {
+        REQUIRE(matches.size() == 1);
+        CHECK(std::holds_alternative<PluginSourceSpecification_v1>(matches[0]));
+      }
+    }
+  }
+}
+
+SCENARIO("Package registry") {
+  namespace registry = openassetio_traitgen_test_all::registry;
+  using openassetio_traitgen_test_all::specifications::test::LocalAndExternalTraitSpecification_v1;
+  using openassetio_traitgen_test_all::traits::aNamespace::AllPropertiesTrait_v1;
+
+  STATIC_REQUIRE(registry::kTraits.size() == 7);
+  STATIC_REQUIRE(registry::kSpecifications.size() == 6);
+  STATIC_REQUIRE(std::variant_size_v<registry::TraitView> == registry::kTraits.size());
+  STATIC_REQUIRE(std::variant_size_v<registry::SpecificationView> ==
+                 registry::kSpecifications.size());
+
+  WHEN("a trait is looked up by ID") {
+    const registry::TraitEntry* entry = registry::findTrait(AllPropertiesTrait_v1::kId);
+
+    THEN("a view on data as the trait can be constructed") {
+      REQUIRE(entry != nullptr);
+      const openassetio_abi::trait::TraitsDataPtr traitsData =
+          openassetio_abi::trait::TraitsData::make();
+      const registry::TraitView view = entry->makeView(traitsData);
+
+      REQUIRE(std::holds_alternative<AllPropertiesTrait_v1>(view));
+      std::visit([](const auto& trait) { trait.imbue(); }, view);
+      CHECK(AllPropertiesTrait_v1::isImbuedTo(traitsData));
+    }
+  }
+
+  WHEN("an unknown trait is looked up") {
+    THEN("no entry is returned") { CHECK(registry::findTrait("someOtherTrait") == nullptr); }
+  }
+
+  WHEN("the specification entries are queried") {
+    THEN("each provides the trait IDs of its specification") {
+      const auto entry = std::find_if(
+          registry::kSpecifications.begin(), registry::kSpecifications.end(),
+          [](const registry::SpecificationEntry& specificationEntry) {
+            return specificationEntry.traitIdsBegin ==
+                   LocalAndExternalTraitSpecification_v1::kSortedTraitIds.data();
+          });
+      REQUIRE(entry != registry::kSpecifications.end());
+      openassetio_abi::trait::TraitSet traitSet;
+      std::for_each(entry->traitIdsBegin, entry->traitIdsEnd,
+                    [&traitSet](std::string_view traitId) { traitSet.emplace(traitId); });
+      CHECK(traitSet == LocalAndExternalTraitSpecification_v1::kTraitSet);
+
+      AND_THEN("a view on data as the specification can be constructed") {
+        const registry::SpecificationView view =
+            entry->makeView(openassetio_abi::trait::TraitsData::make());
+        CHECK(std::holds_alternative<LocalAndExternalTraitSpecification_v1>(view));
+      }
+    }
+  }
+}
+
+SCENARIO("Package registry with IDs ordered differently when case is ignored") {
+  namespace registry = openassetio_traitgen_test_mixed_case::registry;
+  using openassetio_traitgen_test_mixed_case::traits::aNamespace::DataSourceTrait_v1;
+  using openassetio_traitgen_test_mixed_case::traits::aNamespace::DBTableTrait_v1;
+  using openassetio_traitgen_test_mixed_case::traits::aNamespace::DCCPluginTrait_v1;
+
+  CHECK(std::is_sorted(
+      registry::kTraits.begin(), registry::kTraits.end(),
+      [](const registry::TraitEntry& lhs, const registry::TraitEntry& rhs) {
+        return lhs.traitId < rhs.traitId;
+      }));
+
+  WHEN("each trait is looked up by ID") {
+    THEN("its entry is found") {
+      for (const std::string_view traitId :
+           {DataSourceTrait_v1::kId, DBTableTrait_v1::kId, DCCPluginTrait_v1::kId}) {
+        CAPTURE(traitId);
+        const registry::TraitEntry* entry = registry::findTrait(traitId);
+        REQUIRE(entry != nullptr);
+        CHECK(entry->traitId == traitId);
+      }
+    }
+  }
+
+  WHEN("each entry is looked up by its own ID") {
+    THEN("the same entry is found") {
+      for (const registry::TraitEntry& entry : registry::kTraits) {
+        CAPTURE(entry.traitId);
+        CHECK(registry::findTrait(entry.traitId) == &entry);
+      }
+    }
+  }
+}
+
 SCENARIO("Specifications providing trait views") {
   GIVEN("a LocalAndExternalTraitSpecification") {
     const auto specification = openassetio_traitgen_test_all::specifications::test::
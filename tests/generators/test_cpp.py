@@ -27,6 +27,7 @@ import functools
 import logging
 import os
 import pathlib
+import re
 import subprocess
 
 import pytest
@@ -35,6 +36,23 @@ from tree_sitter_languages import get_parser, get_language
 from openassetio_traitgen import generate
 from openassetio_traitgen.generators import cpp as cpp_generator, cpp_keywords
 
+# Template globals of the variants that the test packages are generated
+# with, in addition to the defaults, keyed by variant name.
+_TEMPLATE_GLOBALS_VARIANTS = {
+    "amalgamated": {"cppLayout": "amalgamated"},
+    "amalgamated_namespaces": {"cppLayout": "amalgamated-namespaces"},
+    "cmake_target": {"cppCMakeTarget": True},
+}
+
+
+def _template_globals_variant(name):
+    """
+    Marks a test (or class) as using the test packages generated with
+    the template globals of the named variant, via generated_path_variant.
+    """
+    return pytest.mark.parametrize("generated_path_variant", [name], indirect=True)
+
+
 #
 # Tests: Packages and Structure
 #
@@ -241,6 +259,46 @@ class Test_cpp_package_all_traits_aNamespace_AllPropertiesTrait:
 """.strip()
         )
 
+    def test_has_bulk_property_setter_with_expected_docstring(self, docstring_for):
+        assert (
+            docstring_for(
+                "openassetio_traitgen_test_all",
+                is_specification=False,
+                namespace="aNamespace",
+                name="AllPropertiesTrait",
+                version="1",
+                func="setProperties",
+            )
+            == """
+  /**
+   * Sets all of the properties with a value in the supplied struct.
+   *
+   * Empty members are left unchanged.
+   */
+""".strip()
+        )
+
+    def test_has_bulk_property_getter_with_expected_docstring(self, docstring_for):
+        assert (
+            docstring_for(
+                "openassetio_traitgen_test_all",
+                is_specification=False,
+                namespace="aNamespace",
+                name="AllPropertiesTrait",
+                version="1",
+                func="getProperties",
+            )
+            == """
+  /**
+   * Gets the values of all of this trait's properties.
+   *
+   * Properties that are not set are empty in the returned struct.
+   *
+   * @throw std::runtime_error If a property is of an unexpected type.
+   */
+""".strip()
+        )
+
 
 class Test_cpp_package_all_traits_aNamespace_MultipleVersionsTrait:
     def test_v1_has_expected_docstring(self, docstring_for):
@@ -626,6 +684,41 @@ class Test_cpp_package_all_specifications_test_DeprecatedSpecification:
         )
 
 
+class Test_cpp_package_mixed_case_registry:
+    def test_traits_are_sorted_by_byte_value(self, generated_path):
+        contents = (
+            _include_dir(generated_path, "openassetio_traitgen_test_mixed_case") / "registry.hpp"
+        ).read_text(encoding="utf-8")
+
+        trait_ids = re.findall(r'^\s*\{"([^"]+)", &detail::makeView<', contents, re.MULTILINE)
+
+        assert trait_ids == [
+            "openassetio-traitgen-test-mixed-case:aNamespace.DBTable",
+            "openassetio-traitgen-test-mixed-case:aNamespace.DCCPlugin",
+            "openassetio-traitgen-test-mixed-case:aNamespace.DataSource",
+        ]
+
+
+class Test_cpp_package_mixed_case_specifications:
+    def test_sorted_trait_ids_are_sorted_by_byte_value(self, generated_path):
+        contents = (
+            _include_dir(generated_path, "openassetio_traitgen_test_mixed_case")
+            / "specifications"
+            / "test"
+            / "AllTraitsSpecification.hpp"
+        ).read_text(encoding="utf-8")
+
+        sorted_trait_ids = re.search(
+            r"kSortedTraitIds\{ \{\n(.*?)\} \};", contents, re.DOTALL
+        ).group(1)
+
+        assert re.findall(r'"([^"]+)"', sorted_trait_ids) == [
+            "openassetio-traitgen-test-mixed-case:aNamespace.DBTable",
+            "openassetio-traitgen-test-mixed-case:aNamespace.DCCPlugin",
+            "openassetio-traitgen-test-mixed-case:aNamespace.DataSource",
+        ]
+
+
 class Test_generate:
     def test_when_files_created_then_creation_callback_is_called(
         self, declaration_exotic_values, creations_exotic_values, tmp_path_factory
@@ -648,6 +741,26 @@ class Test_generate:
 
         assert actual == expected
 
+    def test_when_property_id_reserved_then_ValueError_raised_and_nothing_created(
+        self, declaration_reserved_property_id, tmp_path_factory
+    ):
+        output_dir = tmp_path_factory.mktemp("test_cpp_generate_reserved_property_id")
+
+        with pytest.raises(ValueError) as err:
+            cpp_generator.generate(
+                declaration_reserved_property_id,
+                {},
+                output_dir,
+                lambda _: _,
+                logging.Logger("Test_generate"),
+            )
+
+        assert str(err.value) == (
+            "Property 'properties' of trait 'p:n.T' is reserved, as its accessors would collide"
+            " with getProperties/setProperties."
+        )
+        assert not os.listdir(output_dir)
+
     def test_when_names_invalid_then_warnings_are_logged(
         self,
         declaration_exotic_values,
@@ -662,6 +775,237 @@ class Test_generate:
 
         assert a_capturing_logger.handlers[0].messages == warnings_exotic_values
 
+    def test_when_called_repeatedly_then_warnings_are_logged_for_each_call(
+        self,
+        declaration_exotic_values,
+        warnings_exotic_values,
+        a_capturing_logger,
+        tmp_path_factory,
+    ):
+        output_dir = tmp_path_factory.mktemp("test_cpp_generate_repeated_warnings")
+        for _ in range(2):
+            cpp_generator.generate(
+                declaration_exotic_values, {}, output_dir, lambda _: _, a_capturing_logger
+            )
+
+        assert a_capturing_logger.handlers[0].messages == warnings_exotic_values * 2
+
+    def test_when_globals_differ_between_calls_then_output_uses_each_calls_globals(
+        self, declaration_exotic_values, tmp_path_factory
+    ):
+        for owner in ("Owner A", "Owner B"):
+            output_dir = tmp_path_factory.mktemp("test_cpp_generate_globals")
+            created = []
+            cpp_generator.generate(
+                declaration_exotic_values,
+                {"copyrightOwner": owner, "copyrightDate": 2000, "spdxLicenseIdentifier": "X"},
+                output_dir,
+                created.append,
+                logging.Logger("Test_generate"),
+            )
+
+            assert f"Copyright 2000 {owner}" in pathlib.Path(created[-1]).read_text(
+                encoding="utf-8"
+            )
+
+    def test_when_cache_dir_set_then_compiled_templates_cached(
+        self, declaration_exotic_values, tmp_path_factory
+    ):
+        output_dir = tmp_path_factory.mktemp("test_cpp_generate_cache_dir")
+        cache_dir = output_dir / "cache"
+        cpp_generator.generate(
+            declaration_exotic_values,
+            {},
+            output_dir / "out",
+            lambda _: _,
+            logging.Logger("Test_generate"),
+            cache_dir=str(cache_dir),
+        )
+
+        assert list(cache_dir.glob("__jinja2_*.cache"))
+
+    def test_when_jobs_set_then_output_and_callbacks_match_serial(
+        self, declaration_all, tmp_path_factory
+    ):
+        outputs = {}
+        for jobs in (1, 3):
+            output_dir = tmp_path_factory.mktemp(f"test_cpp_generate_jobs_{jobs}")
+            created = []
+            cpp_generator.generate(
+                declaration_all,
+                {},
+                output_dir,
+                created.append,
+                logging.Logger("Test_generate"),
+                jobs=jobs,
+            )
+            outputs[jobs] = [
+                (
+                    os.path.relpath(path, output_dir),
+                    (
+                        pathlib.Path(path).read_text(encoding="utf-8")
+                        if os.path.isfile(path)
+                        else None
+                    ),
+                )
+                for path in created
+            ]
+
+        assert outputs[3] == outputs[1]
+
+    def test_when_jobs_set_and_names_invalid_then_warnings_are_logged_once(
+        self,
+        declaration_exotic_values,
+        warnings_exotic_values,
+        a_capturing_logger,
+        tmp_path_factory,
+    ):
+        output_dir = tmp_path_factory.mktemp("test_cpp_generate_jobs_warnings")
+        cpp_generator.generate(
+            declaration_exotic_values, {}, output_dir, lambda _: _, a_capturing_logger, jobs=2
+        )
+
+        assert sorted(a_capturing_logger.handlers[0].messages) == sorted(warnings_exotic_values)
+
+    def test_when_skip_unchanged_and_regenerated_then_files_untouched(
+        self, declaration_exotic_values, creations_exotic_values, tmp_path_factory
+    ):
+        output_dir = tmp_path_factory.mktemp("test_cpp_generate_skip_unchanged")
+        expected = [(os.path.join(output_dir, p), False) for p in creations_exotic_values]
+
+        cpp_generator.generate(
+            declaration_exotic_values, {}, output_dir, lambda *_: _, logging.Logger("Test")
+        )
+        for path, _ in expected:
+            os.utime(path, (0, 0))
+
+        actual = []
+
+        def creation_callback(path, changed):
+            actual.append((path, changed))
+
+        cpp_generator.generate(
+            declaration_exotic_values,
+            {},
+            output_dir,
+            creation_callback,
+            logging.Logger("Test_generate"),
+            skip_unchanged=True,
+        )
+
+        assert actual == expected
+        for path, _ in expected:
+            assert os.stat(path).st_mtime == 0
+
+    def test_when_cpp_layout_unknown_then_ValueError_raised(
+        self, declaration_exotic_values, tmp_path_factory
+    ):
+        output_dir = tmp_path_factory.mktemp("test_cpp_generate_unknown_layout")
+
+        with pytest.raises(ValueError) as err:
+            cpp_generator.generate(
+                declaration_exotic_values,
+                {"cppLayout": "flat"},
+                output_dir,
+                lambda _: _,
+                logging.Logger("Test_generate"),
+            )
+
+        assert str(err.value) == (
+            "Unknown cppLayout 'flat', must be one of: tree, amalgamated, amalgamated-namespaces"
+        )
+
+    @pytest.mark.parametrize(
+        "layout,expected",
+        (
+            (
+                "amalgamated",
+                [
+                    os.path.join("p_p", "include", "p_p"),
+                    os.path.join("p_p", "include", "p_p", "p_p.hpp"),
+                ],
+            ),
+            (
+                "amalgamated-namespaces",
+                [
+                    os.path.join("p_p", "include", "p_p"),
+                    os.path.join("p_p", "include", "p_p", "traits"),
+                    os.path.join("p_p", "include", "p_p", "specifications"),
+                    os.path.join("p_p", "include", "p_p", "traits", "t_n.hpp"),
+                    os.path.join("p_p", "include", "p_p", "traits", "traits.hpp"),
+                    os.path.join("p_p", "include", "p_p", "specifications", "s_n.hpp"),
+                    os.path.join("p_p", "include", "p_p", "specifications", "specifications.hpp"),
+                    os.path.join("p_p", "include", "p_p", "registry.hpp"),
+                    os.path.join("p_p", "include", "p_p", "p_p.hpp"),
+                ],
+            ),
+        ),
+    )
+    def test_when_cpp_layout_amalgamated_then_only_amalgamated_headers_created(
+        self, declaration_exotic_values, tmp_path_factory, layout, expected
+    ):
+        output_dir = tmp_path_factory.mktemp("test_cpp_generate_amalgamated")
+        actual = []
+
+        cpp_generator.generate(
+            declaration_exotic_values,
+            {"cppLayout": layout},
+            output_dir,
+            actual.append,
+            logging.Logger("Test_generate"),
+        )
+
+        assert actual == [os.path.join(output_dir, path) for path in expected]
+
+    @pytest.mark.parametrize("layout", ("amalgamated", "amalgamated-namespaces"))
+    def test_when_cpp_layout_amalgamated_and_skip_unchanged_then_files_untouched(
+        self, declaration_exotic_values, tmp_path_factory, layout
+    ):
+        output_dir = tmp_path_factory.mktemp("test_cpp_generate_amalgamated_skip_unchanged")
+        expected = []
+        cpp_generator.generate(
+            declaration_exotic_values,
+            {"cppLayout": layout},
+            output_dir,
+            lambda path: expected.append((path, False)),
+            logging.Logger("Test_generate"),
+        )
+        actual = []
+
+        def creation_callback(path, changed):
+            actual.append((path, changed))
+
+        cpp_generator.generate(
+            declaration_exotic_values,
+            {"cppLayout": layout},
+            output_dir,
+            creation_callback,
+            logging.Logger("Test_generate"),
+            skip_unchanged=True,
+        )
+
+        assert actual == expected
+
+    def test_when_cpp_cmake_target_set_then_cmake_file_created_last(
+        self, declaration_exotic_values, creations_exotic_values, tmp_path_factory
+    ):
+        output_dir = tmp_path_factory.mktemp("test_cpp_generate_cmake_target")
+        expected = [
+            os.path.join(output_dir, path)
+            for path in creations_exotic_values + [os.path.join("p_p", "p_p.cmake")]
+        ]
+        actual = []
+
+        cpp_generator.generate(
+            declaration_exotic_values,
+            {"cppCMakeTarget": True},
+            output_dir,
+            actual.append,
+            logging.Logger("Test_generate"),
+        )
+
+        assert actual == expected
+
     @pytest.mark.parametrize(
         "id_type",
         ("package_name", "specification_namespace", "trait_namespace"),
@@ -698,13 +1042,212 @@ class Test_generate:
         )
 
 
+@_template_globals_variant("amalgamated")
+class Test_cpp_layout_amalgamated:
+    def test_package_header_contains_all_classes(self, generated_path, generated_path_variant):
+        for package_name in _test_package_names:
+            tree_classes = set()
+            for header in _include_dir(generated_path, package_name).rglob("*.hpp"):
+                tree_classes.update(_class_names(header.read_text(encoding="utf-8")))
+
+            amalgamated = _package_header(generated_path_variant, package_name)
+
+            assert _class_names(amalgamated.read_text(encoding="utf-8")) == tree_classes
+
+    def test_package_header_is_only_header(self, generated_path_variant):
+        for package_name in _test_package_names:
+            include_dir = _include_dir(generated_path_variant, package_name)
+
+            assert list(include_dir.rglob("*")) == [include_dir / f"{package_name}.hpp"]
+
+    def test_includes_are_unique_and_external(self, generated_path_variant):
+        for package_name in _test_package_names:
+            contents = _package_header(generated_path_variant, package_name).read_text(
+                encoding="utf-8"
+            )
+            includes = [line for line in contents.splitlines() if line.startswith("#include")]
+
+            assert contents.count("#pragma once") == 1
+            assert len(includes) == len(set(includes))
+            assert all(include.startswith("#include <") for include in includes)
+
+    def test_external_traits_included_via_package_header(self, generated_path_variant):
+        contents = _package_header(
+            generated_path_variant, "openassetio_traitgen_test_all"
+        ).read_text(encoding="utf-8")
+
+        assert (
+            "#include <openassetio_traitgen_test_traits_only/"
+            "openassetio_traitgen_test_traits_only.hpp>"
+        ) in contents
+
+    def test_traits_precede_specifications_that_use_them(self, generated_path_variant):
+        contents = _package_header(
+            generated_path_variant, "openassetio_traitgen_test_all"
+        ).read_text(encoding="utf-8")
+
+        assert contents.index("class AllPropertiesTrait_v1 {") < contents.index(
+            "class TwoLocalTraitsSpecification_v1 {"
+        )
+
+    def test_package_docstring_precedes_warning(self, generated_path_variant):
+        contents = _package_header(
+            generated_path_variant, "openassetio_traitgen_test_all"
+        ).read_text(encoding="utf-8")
+
+        assert contents.startswith(
+            "/**\n"
+            " * Test classes to validate the integrity of the openassetio-traitgen\n"
+            " * tool.\n"
+            " */\n"
+            "\n"
+            "// WARNING: This file is auto-generated by openassetio-traitgen, do not edit.\n"
+            "\n"
+            "#pragma once\n"
+        )
+
+
+@_template_globals_variant("amalgamated_namespaces")
+class Test_cpp_layout_amalgamated_namespaces:
+    def test_namespace_headers_contain_their_classes(self, generated_path, generated_path_variant):
+        for package_name in _test_package_names:
+            tree_dir = _include_dir(generated_path, package_name)
+            amalgamated_dir = _include_dir(generated_path_variant, package_name)
+            for namespace_dir in (path for path in tree_dir.glob("*/*") if path.is_dir()):
+                namespace_header = namespace_dir.with_suffix(".hpp").relative_to(tree_dir)
+                tree_classes = set()
+                for header in namespace_dir.glob("*.hpp"):
+                    tree_classes.update(_class_names(header.read_text(encoding="utf-8")))
+
+                assert (
+                    _class_names((amalgamated_dir / namespace_header).read_text(encoding="utf-8"))
+                    == tree_classes
+                )
+                assert not (amalgamated_dir / namespace_header.with_suffix("")).exists()
+
+    def test_other_headers_are_unchanged(self, generated_path, generated_path_variant):
+        package_name = "openassetio_traitgen_test_all"
+        for header in (
+            "openassetio_traitgen_test_all.hpp",
+            "registry.hpp",
+            "traits/traits.hpp",
+            "specifications/specifications.hpp",
+        ):
+            assert (_include_dir(generated_path_variant, package_name) / header).read_text(
+                encoding="utf-8"
+            ) == (_include_dir(generated_path, package_name) / header).read_text(encoding="utf-8")
+
+    def test_specifications_include_trait_namespace_headers(self, generated_path_variant):
+        contents = (
+            _include_dir(generated_path_variant, "openassetio_traitgen_test_all")
+            / "specifications"
+            / "test.hpp"
+        ).read_text(encoding="utf-8")
+
+        assert '#include "../traits/aNamespace.hpp"\n' in contents
+        assert '#include "../traits/anotherNamespace.hpp"\n' in contents
+
+
+class Test_cpp_cmake_target:
+    def test_when_not_set_then_no_cmake_file_created(self, generated_path):
+        for package_name in _test_package_names:
+            assert not (
+                pathlib.Path(generated_path) / package_name / f"{package_name}.cmake"
+            ).exists()
+
+    @_template_globals_variant("cmake_target")
+    def test_defines_interface_target_with_precompiled_package_header(
+        self, generated_path_variant
+    ):
+        for package_name in _test_package_names:
+            contents = _cmake_target(generated_path_variant, package_name)
+
+            assert f"add_library({package_name} INTERFACE)\n" in contents
+            assert (
+                f"target_include_directories({package_name} SYSTEM INTERFACE"
+                ' "${CMAKE_CURRENT_LIST_DIR}/include")\n'
+            ) in contents
+            assert (
+                "target_precompile_headers(\n"
+                f"    {package_name}\n"
+                "    INTERFACE\n"
+                f'    "${{CMAKE_CURRENT_LIST_DIR}}/include/{package_name}/{package_name}.hpp"\n'
+                ")"
+            ) in contents
+
+    @_template_globals_variant("cmake_target")
+    def test_links_to_packages_of_external_traits(self, generated_path_variant):
+        assert _cmake_links(
+            _cmake_target(generated_path_variant, "openassetio_traitgen_test_all")
+        ) == ["OpenAssetIO::openassetio-core", "openassetio_traitgen_test_traits_only"]
+        assert _cmake_links(
+            _cmake_target(generated_path_variant, "openassetio_traitgen_test_specifications_only")
+        ) == [
+            "OpenAssetIO::openassetio-core",
+            "openassetio_traitgen_test_all",
+            "openassetio_traitgen_test_traits_only",
+        ]
+        assert _cmake_links(
+            _cmake_target(generated_path_variant, "openassetio_traitgen_test_traits_only")
+        ) == ["OpenAssetIO::openassetio-core"]
+
+
+_test_package_names = (
+    "openassetio_traitgen_test_all",
+    "openassetio_traitgen_test_mixed_case",
+    "openassetio_traitgen_test_specifications_only",
+    "openassetio_traitgen_test_traits_only",
+)
+
+
+def _include_dir(output_dir, package_name):
+    return pathlib.Path(output_dir) / package_name / "include" / package_name
+
+
+def _package_header(output_dir, package_name):
+    return _include_dir(output_dir, package_name) / f"{package_name}.hpp"
+
+
+def _cmake_target(output_dir, package_name):
+    return (pathlib.Path(output_dir) / package_name / f"{package_name}.cmake").read_text(
+        encoding="utf-8"
+    )
+
+
+def _cmake_links(contents):
+    """
+    Returns the libraries linked to in the supplied CMake file contents.
+    """
+    links = re.search(
+        r"^target_link_libraries\(\n\s*\w+\n\s*INTERFACE\n(.*?)^\)",
+        contents,
+        re.MULTILINE | re.DOTALL,
+    )
+    return links.group(1).split()
+
+
+def _class_names(contents):
+    """
+    Returns the names of the versioned classes defined in the supplied
+    header contents.
+    """
+    return set(re.findall(r"(\w+_v\d+) \{$", contents, re.MULTILINE))
+
+
 @pytest.mark.skipif(
     not os.environ.get("OPENASSETIO_TRAITGENTEST_CMAKE_PRESET"),
     reason="OPENASSETIO_TRAITGENTEST_CMAKE_PRESET environment variable is not set",
 )
 @pytest.mark.ctest
-def test_cpp_project(generated_path, tmp_path_factory, cpp_project_dir):
+def test_cpp_project(generated_path, test_package_descriptions, tmp_path_factory, cpp_project_dir):
     build_dir = tmp_path_factory.mktemp("test_cpp_project")
+    # Each amalgamated layout is tested alongside the default layout.
+    generated_path_amalgamated = _generate_variant(
+        "amalgamated", test_package_descriptions, tmp_path_factory
+    )
+    generated_path_amalgamated_namespaces = _generate_variant(
+        "amalgamated_namespaces", test_package_descriptions, tmp_path_factory
+    )
 
     # Install third-party C++ library dependencies.
     subprocess.check_call(
@@ -721,13 +1264,10 @@ def test_cpp_project(generated_path, tmp_path_factory, cpp_project_dir):
         ]
     )
 
-    include_paths = ";".join(
-        (
-            f"{generated_path}/openassetio_traitgen_test_all/include",
-            f"{generated_path}/openassetio_traitgen_test_specifications_only/include",
-            f"{generated_path}/openassetio_traitgen_test_traits_only/include",
+    def include_paths(output_dir):
+        return ";".join(
+            f"{output_dir}/{package_name}/include" for package_name in _test_package_names
         )
-    )
 
     # Configure CMake project
     subprocess.check_call(
@@ -740,7 +1280,11 @@ def test_cpp_project(generated_path, tmp_path_factory, cpp_project_dir):
             "--preset",
             os.environ["OPENASSETIO_TRAITGENTEST_CMAKE_PRESET"],
             f"-DCMAKE_PREFIX_PATH={build_dir}/.conan",
-            f"-DOPENASSETIO_TRAITGENTEST_ADDITIONAL_INCLUDE_DIRS={include_paths}",
+            f"-DOPENASSETIO_TRAITGENTEST_ADDITIONAL_INCLUDE_DIRS={include_paths(generated_path)}",
+            "-DOPENASSETIO_TRAITGENTEST_AMALGAMATED_INCLUDE_DIRS="
+            f"{include_paths(generated_path_amalgamated)}",
+            "-DOPENASSETIO_TRAITGENTEST_AMALGAMATED_NAMESPACES_INCLUDE_DIRS="
+            f"{include_paths(generated_path_amalgamated_namespaces)}",
         ]
     )
     subprocess.check_call(["cmake", "--build", build_dir, "--config", "RelWithDebInfo"])
@@ -940,23 +1484,56 @@ def cpp_project_dir():
 
 
 @pytest.fixture(scope="module")
-def generated_path(
-    yaml_path_all, yaml_path_traits_only, yaml_path_specifications_only, tmp_path_factory
+def test_package_descriptions(
+    yaml_path_all, yaml_path_traits_only, yaml_path_specifications_only, yaml_path_mixed_case
 ):
-    output_dir = tmp_path_factory.mktemp("generated_path")
+    return (
+        yaml_path_all,
+        yaml_path_traits_only,
+        yaml_path_specifications_only,
+        yaml_path_mixed_case,
+    )
+
+
+@pytest.fixture(scope="module")
+def generated_path(test_package_descriptions, tmp_path_factory):
+    return _generate_test_packages(
+        test_package_descriptions, tmp_path_factory.mktemp("generated_path")
+    )
+
+
+@pytest.fixture(scope="module")
+def generated_path_variant(request, test_package_descriptions, tmp_path_factory):
+    """
+    Generates the test packages with the template globals of the
+    variant named by the parameter supplied via
+    _template_globals_variant.
+    """
+    return _generate_variant(request.param, test_package_descriptions, tmp_path_factory)
+
+
+def _generate_variant(name, descriptions, tmp_path_factory):
+    return _generate_test_packages(
+        descriptions,
+        tmp_path_factory.mktemp(f"generated_path_{name}"),
+        _TEMPLATE_GLOBALS_VARIANTS[name],
+    )
+
 
+def _generate_test_packages(descriptions, output_dir, template_globals=None):
     def creation_callback(_):
         pass
 
     # As there are dependencies between the different packages, we need
     # to generate them all together to avoid import errors.
-    for description in (yaml_path_all, yaml_path_traits_only, yaml_path_specifications_only):
+    for description in descriptions:
         generate(
             description_path=description,
             output_directory=str(output_dir),
             generator="cpp",
             creation_callback=creation_callback,
             logger=logging.Logger(name="Capturing logger"),
+            template_globals=template_globals,
         )
 
     return output_dir
@@ -976,6 +1553,7 @@ def creations_exotic_values():
         os.path.join("p_p", "include", "p_p", "specifications", "s_n", "SSpecification.hpp"),
         os.path.join("p_p", "include", "p_p", "specifications", "s_n.hpp"),
         os.path.join("p_p", "include", "p_p", "specifications", "specifications.hpp"),
+        os.path.join("p_p", "include", "p_p", "registry.hpp"),
         os.path.join("p_p", "include", "p_p", "p_p.hpp"),
     ]
 
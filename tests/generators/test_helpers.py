@@ -21,6 +21,7 @@ Tests for the traitgen generator helpers
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
 import datetime
+import os
 
 import pytest
 
@@ -86,6 +87,47 @@ class Test_packaged_dependencies:
 #
 
 
+class Test_write_file:
+    def test_when_file_missing_then_written_and_returns_true(self, tmp_path):
+        path = tmp_path / "a.txt"
+
+        assert helpers.write_file(str(path), "a\n🤠", skip_unchanged=True) is True
+        assert path.read_bytes() == "a\n🤠".encode("utf-8")
+
+    def test_when_not_skipping_unchanged_then_always_written(self, tmp_path):
+        path = tmp_path / "a.txt"
+        path.write_text("a", encoding="utf-8")
+
+        assert helpers.write_file(str(path), "a") is True
+
+    def test_when_skipping_unchanged_and_content_same_then_not_written(self, tmp_path):
+        path = tmp_path / "a.txt"
+        path.write_text("a", encoding="utf-8")
+        os.utime(path, (0, 0))
+
+        assert helpers.write_file(str(path), "a", skip_unchanged=True) is False
+        assert path.stat().st_mtime == 0
+
+    @pytest.mark.parametrize("new_content", ("b", "ab"))
+    def test_when_skipping_unchanged_and_content_differs_then_written(self, tmp_path, new_content):
+        path = tmp_path / "a.txt"
+        path.write_text("a", encoding="utf-8")
+
+        assert helpers.write_file(str(path), new_content, skip_unchanged=True) is True
+        assert path.read_text(encoding="utf-8") == new_content
+
+
+class Test_create_dir:
+    def test_when_missing_then_created_and_returns_true(self, tmp_path):
+        path = tmp_path / "a" / "b"
+
+        assert helpers.create_dir(str(path)) is True
+        assert path.is_dir()
+
+    def test_when_exists_then_returns_false(self, tmp_path):
+        assert helpers.create_dir(str(tmp_path)) is False
+
+
 @pytest.fixture
 def some_trait_declarations():
     return [
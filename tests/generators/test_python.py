@@ -18,13 +18,16 @@ Tests for the Python code generator.
 """
 
 # pylint: disable=invalid-name,redefined-outer-name
-# pylint: disable=too-few-public-methods
+# pylint: disable=too-few-public-methods,too-many-lines
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
+import ast
 import inspect
 import logging
 import os
+import pathlib
 import sys
+import warnings
 
 from typing import Any, NamedTuple
 
@@ -34,6 +37,25 @@ from openassetio.trait import TraitsData
 from openassetio_traitgen import generate
 from openassetio_traitgen.generators import python as python_generator
 
+# The template globals of each variant of the test packages, as used by
+# generated_path_variant.
+_TEMPLATE_GLOBALS_VARIANTS = {
+    "cached_trait_views": {"cacheTraitViews": True},
+    "lazy_imports": {"lazyImports": True},
+    "type_checks_assert": {"typeChecks": "assert"},
+    "type_checks_none": {"typeChecks": "none"},
+}
+
+
+def _template_globals_variant(name):
+    """
+    Marks a test (or class) as using the test packages generated with
+    the template globals of the named variant, via generated_path_variant
+    and module_all_variant.
+    """
+    return pytest.mark.parametrize("generated_path_variant", [name], indirect=True)
+
+
 #
 # Tests: Packages and Structure
 #
@@ -173,6 +195,22 @@ Test specifications.
             module_all.specifications.test.LocalAndExternalTraitSpecification_v1
         )
 
+    def test_matchingSpecifications_returns_specifications_matched_by_data(self, module_all):
+        specifications = module_all.specifications
+        a_data = TraitsData(
+            specifications.test.TwoLocalTraitsSpecification_v1.kTraitSet
+            | specifications.test.MultipleVersionsOfTraitSpecification_v2.kTraitSet
+        )
+
+        assert specifications.matchingSpecifications(a_data) == [
+            specifications.test.MultipleVersionsOfTraitSpecification_v2,
+            specifications.test.TwoLocalTraitsSpecification_v1,
+        ]
+
+    def test_matchingSpecifications_when_no_match_then_returns_empty_list(self, module_all):
+        a_data = TraitsData({"someOtherTrait"})
+        assert module_all.specifications.matchingSpecifications(a_data) == []
+
 
 class Test_python_package_all_specifications_test_TwoLocalTraitsSpecification:
     def test_docstring_contains_description(self, module_all):
@@ -318,6 +356,12 @@ class Test_AllPropertiesTrait:
     def test_traitId_is_composed_of_package_aNamespace_and_name(self, all_properties_trait):
         assert all_properties_trait.kId == "openassetio-traitgen-test-all:aNamespace.AllProperties"
 
+    def test_instances_have_no_dict(self, all_properties_trait, an_empty_traitsData):
+        trait = all_properties_trait(an_empty_traitsData)
+        assert not hasattr(trait, "__dict__")
+        with pytest.raises(AttributeError):
+            trait.someAttribute = 1
+
 
 class Test_AllPropertiesTrait_isImbued:
     def test_when_data_has_trait_returns_true(self, all_properties_trait):
@@ -358,6 +402,49 @@ class Test_AllPropertiesTrait_imbueTo:
         all_properties_trait.imbueTo(a_data)
 
 
+class Test_AllPropertiesTrait_filterImbued:
+    def test_returns_list_of_data_with_trait_in_original_order(self, all_properties_trait):
+        datas = [
+            TraitsData({all_properties_trait.kId}),
+            TraitsData({"someOtherTrait"}),
+            TraitsData({all_properties_trait.kId, "someOtherTrait"}),
+        ]
+        actual = all_properties_trait.filterImbued(iter(datas))
+        assert isinstance(actual, list)
+        assert len(actual) == 2
+        assert actual[0] is datas[0]
+        assert actual[1] is datas[2]
+
+    def test_when_no_data_then_returns_empty_list(self, all_properties_trait):
+        assert all_properties_trait.filterImbued([]) == []
+
+
+class Test_AllPropertiesTrait_countImbued:
+    def test_returns_number_of_data_with_trait(self, all_properties_trait):
+        datas = [
+            TraitsData({all_properties_trait.kId}),
+            TraitsData({"someOtherTrait"}),
+            TraitsData({all_properties_trait.kId, "someOtherTrait"}),
+        ]
+        assert all_properties_trait.countImbued(iter(datas)) == 2
+
+    def test_when_no_data_then_returns_zero(self, all_properties_trait):
+        assert all_properties_trait.countImbued([]) == 0
+
+
+class Test_AllPropertiesTrait_imbueAll:
+    def test_adds_trait_to_all_data(self, all_properties_trait):
+        datas = [
+            TraitsData(),
+            TraitsData({all_properties_trait.kId}),
+            TraitsData({"someOtherTrait"}),
+        ]
+        all_properties_trait.imbueAll(iter(datas))
+        for a_data in datas:
+            assert all_properties_trait.kId in a_data.traitSet()
+        assert datas[2].traitSet() == {all_properties_trait.kId, "someOtherTrait"}
+
+
 class PropertyTestValues(NamedTuple):
     name: str
     valid_value: Any
@@ -492,6 +579,98 @@ class Test_AllPropertiesTrait_set:
         )
 
 
+class Test_AllPropertiesTrait_setProperties:
+    def test_when_set_then_trait_data_contains_values(
+        self, all_properties_trait, an_empty_traitsData
+    ):
+        a_trait = all_properties_trait(an_empty_traitsData)
+
+        a_trait.setProperties(
+            **{
+                property_.name: property_.valid_value
+                for property_ in kAllPropertiesTrait_property_test_values
+            }
+        )
+
+        for property_ in kAllPropertiesTrait_property_test_values:
+            actual = an_empty_traitsData.getTraitProperty(all_properties_trait.kId, property_.name)
+            assert actual == property_.valid_value
+
+    def test_when_property_is_omitted_or_None_then_it_is_not_set(
+        self, all_properties_trait, an_all_properties_traitsData
+    ):
+        a_trait = all_properties_trait(an_all_properties_traitsData)
+
+        a_trait.setProperties(intProperty=42, stringProperty=None)
+
+        assert an_all_properties_traitsData.traitPropertyKeys(all_properties_trait.kId) == {
+            "intProperty"
+        }
+
+    @pytest.mark.parametrize("property_", kAllPropertiesTrait_property_test_values)
+    def test_when_type_is_wrong_then_TypeError_is_raised(
+        self, all_properties_trait, an_all_properties_traitsData, property_
+    ):
+        a_trait = all_properties_trait(an_all_properties_traitsData)
+
+        with pytest.raises(TypeError) as err:
+            a_trait.setProperties(**{property_.name: property_.invalid_value})
+
+        assert (
+            str(err.value)
+            == f"{property_.name} must be a '{type(property_.valid_value).__name__}'."
+        )
+
+    def test_when_trait_has_no_properties_then_not_defined(self, module_all):
+        assert not hasattr(module_all.traits.aNamespace.NoPropertiesTrait_v1, "setProperties")
+
+
+class Test_AllPropertiesTrait_getProperties:
+    def test_when_properties_are_set_then_returns_expected_values(
+        self, all_properties_trait, an_all_properties_traitsData
+    ):
+        for property_ in kAllPropertiesTrait_property_test_values:
+            an_all_properties_traitsData.setTraitProperty(
+                all_properties_trait.kId, property_.name, property_.valid_value
+            )
+        a_trait = all_properties_trait(an_all_properties_traitsData)
+
+        assert a_trait.getProperties() == {
+            property_.name: property_.valid_value
+            for property_ in kAllPropertiesTrait_property_test_values
+        }
+
+    def test_when_properties_are_not_set_then_values_are_None(
+        self, all_properties_trait, an_empty_traitsData
+    ):
+        a_trait = all_properties_trait(an_empty_traitsData)
+
+        assert a_trait.getProperties() == {
+            property_.name: None for property_ in kAllPropertiesTrait_property_test_values
+        }
+
+    @pytest.mark.parametrize("property_", kAllPropertiesTrait_property_test_values)
+    def test_when_property_has_wrong_type_then_raises_TypeError(
+        self, all_properties_trait, an_all_properties_traitsData, property_
+    ):
+        an_all_properties_traitsData.setTraitProperty(
+            all_properties_trait.kId, property_.name, property_.invalid_value
+        )
+        a_trait = all_properties_trait(an_all_properties_traitsData)
+
+        with pytest.raises(TypeError) as err:
+            a_trait.getProperties()
+
+        assert (
+            str(err.value)
+            == f"Invalid stored value type: '{type(property_.invalid_value).__name__}' should be "
+            f"'{type(property_.valid_value).__name__}'."
+        )
+
+    def test_when_trait_has_no_properties_then_not_defined(self, module_all):
+        assert not hasattr(module_all.traits.aNamespace.NoPropertiesTrait_v1, "getProperties")
+
+
 class Test_MultipleVersionsTrait:
     def test_version_1_has_expected_id(self, module_all):
         assert module_all.traits.aNamespace.MultipleVersionsTrait_v1.kId == (
@@ -538,8 +717,12 @@ class Test_MultipleVersionsTrait:
             if attr_name not in builtin_attr_names
         ]
         # Ensure no overrides of the base class, other than constructor
-        # (for deprecation warning).
-        assert user_defined_attr_names == ["__init__"]
+        # and flag (for deprecation warning), and (empty) slots.
+        assert user_defined_attr_names == [
+            "__slots__",
+            "_MultipleVersionsTrait__deprecationWarned",
+            "__init__",
+        ]
 
     def test_unversioned_has_same_docstring_as_version_1_but_with_deprecation(self, module_all):
         assert (
@@ -555,13 +738,28 @@ class Test_MultipleVersionsTrait:
             != module_all.traits.aNamespace.MultipleVersionsTrait_v2.__doc__
         )
 
-    def test_when_unversioned_constructed_then_logs_deprecation_warning(self, module_all):
+    def test_when_unversioned_constructed_then_logs_deprecation_warning(self, module_all_isolated):
         expected_warning = (
             "Unversioned trait view classes are deprecated. Please switch from"
             " MultipleVersionsTrait to MultipleVersionsTrait_v1."
         )
         with pytest.deprecated_call(match=expected_warning):
-            module_all.traits.aNamespace.MultipleVersionsTrait(TraitsData())
+            module_all_isolated.traits.aNamespace.MultipleVersionsTrait(TraitsData())
+
+    def test_when_unversioned_constructed_again_then_no_deprecation_warning(
+        self, module_all_isolated
+    ):
+        with pytest.deprecated_call():
+            module_all_isolated.traits.aNamespace.MultipleVersionsTrait(TraitsData())
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            module_all_isolated.traits.aNamespace.MultipleVersionsTrait(TraitsData())
+
+    def test_when_unversioned_constructed_then_instance_has_no_dict(self, module_all_isolated):
+        with pytest.deprecated_call():
+            trait = module_all_isolated.traits.aNamespace.MultipleVersionsTrait(TraitsData())
+        assert not hasattr(trait, "__dict__")
 
     def test_when_unversioned_constructed_then_calls_base_constructor(self, module_all):
         data = TraitsData()
@@ -575,12 +773,27 @@ class Test_MultipleVersionsTrait:
 
 
 class Test_DeprecatedTrait:
-    def test_when_constructed_then_logs_deprecation_warning(self, module_all):
+    def test_when_constructed_then_logs_deprecation_warning(self, module_all_isolated):
         expected_warning = (
             "The 'openassetio-traitgen-test-all:aNamespace.Deprecated' trait is deprecated."
         )
         with pytest.deprecated_call(match=expected_warning):
-            module_all.traits.aNamespace.DeprecatedTrait_v1(TraitsData())
+            module_all_isolated.traits.aNamespace.DeprecatedTrait_v1(TraitsData())
+
+    def test_when_constructed_again_then_no_deprecation_warning(self, module_all_isolated):
+        with pytest.deprecated_call():
+            module_all_isolated.traits.aNamespace.DeprecatedTrait_v1(TraitsData())
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            module_all_isolated.traits.aNamespace.DeprecatedTrait_v1(TraitsData())
+
+    def test_when_warning_is_error_then_raised_on_each_construction(self, module_all_isolated):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            for _ in range(2):
+                with pytest.raises(DeprecationWarning):
+                    module_all_isolated.traits.aNamespace.DeprecatedTrait_v1(TraitsData())
 
     def test_docstring_contains_deprecation_notice(self, module_all):
         assert module_all.traits.aNamespace.DeprecatedTrait_v1.__doc__ == """
@@ -591,6 +804,12 @@ class Test_DeprecatedTrait:
 
 
 class Test_LocalAndExternalTraitSpecification:
+    def test_instances_have_no_dict(self, local_and_external_trait_specification):
+        a_specification = local_and_external_trait_specification(TraitsData())
+        assert not hasattr(a_specification, "__dict__")
+        with pytest.raises(AttributeError):
+            a_specification.someAttribute = 1
+
     def test_external_trait_accessor_is_of_expected_type(
         self, local_and_external_trait_specification, module_traits_only
     ):
@@ -651,6 +870,87 @@ class Test_LocalAndExternalTraitSpecification:
         assert data.traitSet() == local_and_external_trait_specification.kTraitSet
 
 
+class Test_LocalAndExternalTraitSpecification_isMatchedBy:
+    def test_when_data_has_all_traits_then_returns_true(
+        self, local_and_external_trait_specification
+    ):
+        a_data = TraitsData(local_and_external_trait_specification.kTraitSet | {"someOtherTrait"})
+        assert local_and_external_trait_specification.isMatchedBy(a_data) is True
+
+    def test_when_data_has_some_traits_then_returns_false(
+        self, local_and_external_trait_specification
+    ):
+        a_trait_id = next(iter(local_and_external_trait_specification.kTraitSet))
+        a_data = TraitsData({a_trait_id})
+        assert local_and_external_trait_specification.isMatchedBy(a_data) is False
+
+    def test_when_data_empty_then_returns_false(self, local_and_external_trait_specification):
+        assert local_and_external_trait_specification.isMatchedBy(TraitsData()) is False
+
+
+class Test_LocalAndExternalTraitSpecification_trait_views:
+    def test_when_not_cached_then_new_view_returned_for_each_call(
+        self, local_and_external_trait_specification
+    ):
+        a_specification = local_and_external_trait_specification(TraitsData())
+        assert (
+            a_specification.openassetioTraitgenTestAllANamespaceNoPropertiesTrait()
+            is not a_specification.openassetioTraitgenTestAllANamespaceNoPropertiesTrait()
+        )
+
+    @_template_globals_variant("cached_trait_views")
+    def test_when_cached_then_same_view_returned_for_each_call(self, module_all_variant):
+        specification_cls = (
+            module_all_variant.specifications.test.LocalAndExternalTraitSpecification_v1
+        )
+        a_specification = specification_cls(TraitsData())
+
+        for accessor in (
+            a_specification.openassetioTraitgenTestAllANamespaceNoPropertiesTrait,
+            a_specification.openassetioTraitgenTestTraitsOnlyANamespaceNoPropertiesTrait,
+        ):
+            assert accessor() is accessor()
+
+    @_template_globals_variant("cached_trait_views")
+    def test_when_cached_then_view_wraps_specifications_traits_data(self, module_all_variant):
+        specification_cls = (
+            module_all_variant.specifications.test.LocalAndExternalTraitSpecification_v1
+        )
+        a_traits_data = TraitsData()
+        a_specification = specification_cls(a_traits_data)
+
+        a_trait = a_specification.openassetioTraitgenTestAllANamespaceNoPropertiesTrait()
+
+        assert (
+            a_trait._NoPropertiesTrait_v1__data  # pylint: disable=protected-access
+            is a_traits_data
+        )
+        assert isinstance(a_trait, module_all_variant.traits.aNamespace.NoPropertiesTrait_v1)
+
+    @_template_globals_variant("cached_trait_views")
+    def test_when_cached_then_views_not_shared_between_instances(self, module_all_variant):
+        specification_cls = (
+            module_all_variant.specifications.test.LocalAndExternalTraitSpecification_v1
+        )
+        a_specification = specification_cls(TraitsData())
+        another_specification = specification_cls(TraitsData())
+
+        assert (
+            a_specification.openassetioTraitgenTestAllANamespaceNoPropertiesTrait()
+            is not another_specification.openassetioTraitgenTestAllANamespaceNoPropertiesTrait()
+        )
+
+    @_template_globals_variant("cached_trait_views")
+    def test_when_cached_then_instances_have_no_dict(self, module_all_variant):
+        specification_cls = (
+            module_all_variant.specifications.test.LocalAndExternalTraitSpecification_v1
+        )
+        a_specification = specification_cls(TraitsData())
+        a_specification.openassetioTraitgenTestAllANamespaceNoPropertiesTrait()
+
+        assert not hasattr(a_specification, "__dict__")
+
+
 class Test_MultipleVersionsOfTraitSpecification:
 
     def test_version_1_has_version_1_of_trait(self, module_all):
@@ -687,8 +987,32 @@ class Test_MultipleVersionsOfTraitSpecification:
             if attr_name not in builtin_attr_names
         ]
         # Ensure no overrides of the base class, other than constructor
-        # (for deprecation warning).
-        assert user_defined_attr_names == ["__init__"]
+        # and flag (for deprecation warning), and (empty) slots.
+        assert user_defined_attr_names == [
+            "__slots__",
+            "_MultipleVersionsTrait__deprecationWarned",
+            "__init__",
+        ]
+
+    def test_unversioned_only_adds_deprecation_to_version_1(self, module_all):
+        specification = module_all.specifications.test.MultipleVersionsOfTraitSpecification
+
+        # Create an empty class and get its __dict__ keys.
+        builtin_attr_names = set(type("Empty", (), {}).__dict__.keys())
+
+        # Get attributes defined on subclass, minus builtin attrs.
+        user_defined_attr_names = [
+            attr_name
+            for attr_name in specification.__dict__
+            if attr_name not in builtin_attr_names
+        ]
+        # Ensure no overrides of the base class, other than constructor
+        # and flag (for deprecation warning), and (empty) slots.
+        assert user_defined_attr_names == [
+            "__slots__",
+            "_MultipleVersionsOfTraitSpecification__deprecationWarned",
+            "__init__",
+        ]
 
     def test_unversioned_has_same_docstring_as_version_1_but_with_deprecation(self, module_all):
         spec = module_all.specifications.test.MultipleVersionsOfTraitSpecification
@@ -703,16 +1027,27 @@ class Test_MultipleVersionsOfTraitSpecification:
             != module_all.specifications.test.MultipleVersionsOfTraitSpecification_v2.__doc__
         )
 
-    def test_when_unversioned_constructed_then_logs_deprecation_warning(self, module_all):
+    def test_when_unversioned_constructed_then_logs_deprecation_warning(self, module_all_isolated):
         expected_warning = (
             "Unversioned specification view classes are deprecated. Please switch from"
             " MultipleVersionsOfTraitSpecification to MultipleVersionsOfTraitSpecification_v1."
         )
         with pytest.deprecated_call(match=expected_warning):
-            module_all.specifications.test.MultipleVersionsOfTraitSpecification(TraitsData())
+            module_all_isolated.specifications.test.MultipleVersionsOfTraitSpecification.create()
 
-        with pytest.deprecated_call(match=expected_warning):
-            module_all.specifications.test.MultipleVersionsOfTraitSpecification.create()
+    def test_when_unversioned_constructed_again_then_no_deprecation_warning(
+        self, module_all_isolated
+    ):
+        specification = (
+            module_all_isolated.specifications.test.MultipleVersionsOfTraitSpecification
+        )
+        with pytest.deprecated_call():
+            specification(TraitsData())
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            specification(TraitsData())
+            specification.create()
 
     def test_when_unversioned_created_then_is_correct_instance(self, module_all):
         spec = module_all.specifications.test.MultipleVersionsOfTraitSpecification.create()
@@ -733,13 +1068,21 @@ class Test_MultipleVersionsOfTraitSpecification:
 
 
 class Test_DeprecatedSpecification:
-    def test_when_constructed_then_logs_deprecation_warning(self, module_all):
+    def test_when_constructed_then_logs_deprecation_warning(self, module_all_isolated):
         expected_warning = (
             "The 'test.Deprecated' specification of the 'openassetio_traitgen_test_all' package is"
             " deprecated."
         )
         with pytest.deprecated_call(match=expected_warning):
-            module_all.specifications.test.DeprecatedSpecification_v1(TraitsData())
+            module_all_isolated.specifications.test.DeprecatedSpecification_v1(TraitsData())
+
+    def test_when_constructed_again_then_no_deprecation_warning(self, module_all_isolated):
+        with pytest.deprecated_call():
+            module_all_isolated.specifications.test.DeprecatedSpecification_v1(TraitsData())
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            module_all_isolated.specifications.test.DeprecatedSpecification_v1(TraitsData())
 
     def test_docstring_contains_deprecation_notice(self, module_all):
         assert module_all.specifications.test.DeprecatedSpecification_v1.__doc__ == """
@@ -749,6 +1092,210 @@ class Test_DeprecatedSpecification:
     """
 
 
+class Test_registry:
+    def test_traitClasses_maps_every_trait_id_to_its_view_class(self, module_all):
+        traits = module_all.traits
+        assert dict(module_all.registry.traitClasses()) == {
+            trait.kId: trait
+            for trait in (
+                traits.aNamespace.AllPropertiesTrait_v1,
+                traits.aNamespace.DeprecatedTrait_v1,
+                traits.aNamespace.MultipleVersionsTrait_v1,
+                traits.aNamespace.MultipleVersionsTrait_v2,
+                traits.aNamespace.NoPropertiesMultipleUsageTrait_v1,
+                traits.aNamespace.NoPropertiesTrait_v1,
+                traits.anotherNamespace.NoPropertiesTrait_v1,
+            )
+        }
+
+    def test_traitClasses_is_built_once_and_read_only(self, module_all):
+        trait_classes = module_all.registry.traitClasses()
+        assert module_all.registry.traitClasses() is trait_classes
+        with pytest.raises(TypeError):
+            trait_classes["someTrait"] = object
+
+    def test_traitClass_returns_view_class_for_trait_id(self, module_all):
+        trait = module_all.traits.aNamespace.MultipleVersionsTrait_v2
+        assert module_all.registry.traitClass(trait.kId) is trait
+
+    def test_when_trait_id_unknown_then_traitClass_returns_None(self, module_all):
+        assert module_all.registry.traitClass("someOtherTrait") is None
+
+    def test_specificationTraitSets_maps_every_specification_to_its_trait_set(self, module_all):
+        test = module_all.specifications.test
+        assert dict(module_all.registry.specificationTraitSets()) == {
+            specification: frozenset(specification.kTraitSet)
+            for specification in (
+                test.DeprecatedSpecification_v1,
+                test.LocalAndExternalTraitSpecification_v1,
+                test.MultipleVersionsOfTraitSpecification_v1,
+                test.MultipleVersionsOfTraitSpecification_v2,
+                test.OneExternalTraitSpecification_v1,
+                test.TwoLocalTraitsSpecification_v1,
+            )
+        }
+
+    def test_when_package_has_no_specifications_then_specificationTraitSets_is_empty(
+        self, module_traits_only
+    ):
+        assert len(module_traits_only.registry.specificationTraitSets()) == 0
+
+    def test_when_package_has_no_traits_then_traitClasses_is_empty(
+        self, module_specifications_only
+    ):
+        assert len(module_specifications_only.registry.traitClasses()) == 0
+
+
+@_template_globals_variant("lazy_imports")
+class Test_lazy_imports:
+    @pytest.mark.usefixtures("module_all_variant")
+    def test_when_package_imported_then_submodules_not_imported(self):
+        assert "openassetio_traitgen_test_all.traits" not in sys.modules
+        assert "openassetio_traitgen_test_all.specifications" not in sys.modules
+        assert "openassetio_traitgen_test_all.registry" not in sys.modules
+
+    def test_when_namespace_accessed_then_only_that_namespace_imported(self, module_all_variant):
+        trait = module_all_variant.traits.aNamespace.AllPropertiesTrait_v1
+
+        assert trait.kId == "openassetio-traitgen-test-all:aNamespace.AllProperties"
+        assert "openassetio_traitgen_test_all.traits.aNamespace" in sys.modules
+        assert "openassetio_traitgen_test_all.traits.anotherNamespace" not in sys.modules
+        assert "openassetio_traitgen_test_all.specifications" not in sys.modules
+
+    def test_submodules_are_listed_by_dir(self, module_all_variant):
+        assert {"traits", "specifications", "registry"} <= set(dir(module_all_variant))
+        assert {"aNamespace", "anotherNamespace"} <= set(dir(module_all_variant.traits))
+
+    def test_when_attribute_unknown_then_AttributeError_raised(self, module_all_variant):
+        with pytest.raises(AttributeError):
+            module_all_variant.someAttribute  # pylint: disable=pointless-statement
+
+    def test_when_specification_matched_then_namespaces_imported(self, module_all_variant):
+        specifications = module_all_variant.specifications
+        a_data = TraitsData(specifications.test.TwoLocalTraitsSpecification_v1.kTraitSet)
+
+        assert specifications.matchingSpecifications(a_data) == [
+            specifications.test.TwoLocalTraitsSpecification_v1
+        ]
+
+    def test_registry_is_populated(self, module_all_variant):
+        trait = module_all_variant.traits.anotherNamespace.NoPropertiesTrait_v1
+        assert module_all_variant.registry.traitClass(trait.kId) is trait
+
+
+class Test_stubs:
+    def test_every_module_has_a_stub(self, generated_path):
+        modules = sorted(generated_path.glob("**/*.py"))
+
+        assert modules
+        for module in modules:
+            assert module.with_suffix(".pyi").is_file()
+
+    def test_packages_are_marked_as_typed(self, generated_path):
+        for package in ("all", "traits_only", "specifications_only"):
+            marker = generated_path / f"openassetio_traitgen_test_{package}" / "py.typed"
+            assert marker.read_text(encoding="utf-8") == ""
+
+    def test_stubs_declare_the_public_classes_and_methods_of_each_module(self, generated_path):
+        for module in sorted(generated_path.glob("**/*.py")):
+            stub = module.with_suffix(".pyi")
+
+            assert _public_api(stub) == _public_api(module), stub
+
+    def test_when_default_given_then_getter_is_overloaded_to_return_value_type(
+        self, generated_path
+    ):
+        stub = (
+            generated_path / "openassetio_traitgen_test_all" / "traits" / "aNamespace.pyi"
+        ).read_text(encoding="utf-8")
+
+        assert (
+            "    @overload\n"
+            "    def getIntProperty(self, defaultValue: None = None) -> int | None: ...\n"
+            "    @overload\n"
+            "    def getIntProperty(self, defaultValue: int) -> int: ...\n"
+        ) in stub
+
+
+@_template_globals_variant("type_checks_assert")
+class Test_type_checks_assert:
+    def test_when_set_with_wrong_type_then_AssertionError_is_raised(self, module_all_variant):
+        trait = module_all_variant.traits.aNamespace.AllPropertiesTrait_v1
+        a_trait = trait(TraitsData())
+
+        with pytest.raises(AssertionError) as err:
+            a_trait.setIntProperty("a string")
+
+        assert str(err.value) == "intProperty must be a 'int'."
+
+    def test_when_property_has_wrong_type_then_AssertionError_is_raised(self, module_all_variant):
+        trait = module_all_variant.traits.aNamespace.AllPropertiesTrait_v1
+        a_traitsData = TraitsData()
+        a_traitsData.setTraitProperty(trait.kId, "intProperty", "a string")
+
+        with pytest.raises(AssertionError) as err:
+            trait(a_traitsData).getIntProperty()
+
+        assert str(err.value) == "Invalid stored value type: 'str' should be 'int'."
+
+    def test_when_property_has_wrong_type_and_default_given_then_returns_default(
+        self, module_all_variant
+    ):
+        trait = module_all_variant.traits.aNamespace.AllPropertiesTrait_v1
+        a_traitsData = TraitsData()
+        a_traitsData.setTraitProperty(trait.kId, "intProperty", "a string")
+
+        assert trait(a_traitsData).getIntProperty(defaultValue=3) == 3
+
+    def test_when_set_with_wrong_type_in_bulk_then_AssertionError_is_raised(
+        self, module_all_variant
+    ):
+        trait = module_all_variant.traits.aNamespace.AllPropertiesTrait_v1
+        a_trait = trait(TraitsData())
+
+        with pytest.raises(AssertionError):
+            a_trait.setProperties(intProperty="a string")
+
+    def test_when_property_not_set_then_default_is_returned(self, module_all_variant):
+        trait = module_all_variant.traits.aNamespace.AllPropertiesTrait_v1
+
+        assert trait(TraitsData()).getIntProperty(defaultValue=3) == 3
+
+
+@_template_globals_variant("type_checks_none")
+class Test_type_checks_none:
+    def test_when_set_with_wrong_type_then_value_is_stored(self, module_all_variant):
+        trait = module_all_variant.traits.aNamespace.AllPropertiesTrait_v1
+        a_traitsData = TraitsData()
+
+        trait(a_traitsData).setIntProperty("a string")
+        trait(a_traitsData).setProperties(floatProperty="another string")
+
+        assert a_traitsData.getTraitProperty(trait.kId, "intProperty") == "a string"
+        assert a_traitsData.getTraitProperty(trait.kId, "floatProperty") == "another string"
+
+    def test_when_property_has_wrong_type_then_value_is_returned(self, module_all_variant):
+        trait = module_all_variant.traits.aNamespace.AllPropertiesTrait_v1
+        a_traitsData = TraitsData()
+        a_traitsData.setTraitProperty(trait.kId, "intProperty", "a string")
+
+        assert trait(a_traitsData).getIntProperty(defaultValue=3) == "a string"
+        assert trait(a_traitsData).getProperties()["intProperty"] == "a string"
+
+    def test_when_property_not_set_then_default_is_returned(self, module_all_variant):
+        trait = module_all_variant.traits.aNamespace.AllPropertiesTrait_v1
+
+        assert trait(TraitsData()).getIntProperty(defaultValue=3) == 3
+
+    def test_when_generated_then_modules_have_no_type_checks(self, generated_path_variant):
+        contents = (
+            generated_path_variant / "openassetio_traitgen_test_all" / "traits" / "aNamespace.py"
+        ).read_text(encoding="utf-8")
+
+        assert "TypeError" not in contents
+        assert "assert " not in contents
+
+
 class Test_generate:
     def test_when_files_created_then_creation_callback_is_called(
         self, declaration_exotic_values, creations_exotic_values, tmp_path_factory
@@ -771,6 +1318,44 @@ class Test_generate:
 
         assert actual == expected
 
+    def test_when_typeChecks_unknown_then_ValueError_is_raised(
+        self, declaration_exotic_values, tmp_path_factory
+    ):
+        output_dir = tmp_path_factory.mktemp("test_python_generate_type_checks")
+
+        with pytest.raises(ValueError) as err:
+            python_generator.generate(
+                declaration_exotic_values,
+                {"typeChecks": "sometimes"},
+                output_dir,
+                lambda _: _,
+                logging.Logger("Test_generate"),
+            )
+
+        assert str(err.value) == (
+            "Unknown typeChecks 'sometimes', must be one of: raise, assert, none"
+        )
+
+    def test_when_property_id_reserved_then_ValueError_raised_and_nothing_created(
+        self, declaration_reserved_property_id, tmp_path_factory
+    ):
+        output_dir = tmp_path_factory.mktemp("test_python_generate_reserved_property_id")
+
+        with pytest.raises(ValueError) as err:
+            python_generator.generate(
+                declaration_reserved_property_id,
+                {},
+                output_dir,
+                lambda _: _,
+                logging.Logger("Test_generate"),
+            )
+
+        assert str(err.value) == (
+            "Property 'properties' of trait 'p:n.T' is reserved, as its accessors would collide"
+            " with getProperties/setProperties."
+        )
+        assert not os.listdir(output_dir)
+
     def test_when_names_invalid_then_warnings_are_logged(
         self,
         declaration_exotic_values,
@@ -785,6 +1370,127 @@ class Test_generate:
 
         assert a_capturing_logger.handlers[0].messages == warnings_exotic_values
 
+    def test_when_called_repeatedly_then_warnings_are_logged_for_each_call(
+        self,
+        declaration_exotic_values,
+        warnings_exotic_values,
+        a_capturing_logger,
+        tmp_path_factory,
+    ):
+        output_dir = tmp_path_factory.mktemp("test_python_generate_repeated_warnings")
+        for _ in range(2):
+            python_generator.generate(
+                declaration_exotic_values, {}, output_dir, lambda _: _, a_capturing_logger
+            )
+
+        assert a_capturing_logger.handlers[0].messages == warnings_exotic_values * 2
+
+    def test_when_globals_differ_between_calls_then_output_uses_each_calls_globals(
+        self, declaration_exotic_values, tmp_path_factory
+    ):
+        for owner in ("Owner A", "Owner B"):
+            output_dir = tmp_path_factory.mktemp("test_python_generate_globals")
+            python_generator.generate(
+                declaration_exotic_values,
+                {"copyrightOwner": owner, "copyrightDate": 2000, "spdxLicenseIdentifier": "X"},
+                output_dir,
+                lambda _: _,
+                logging.Logger("Test_generate"),
+            )
+
+            assert f"Copyright 2000 {owner}" in (output_dir / "p_p" / "__init__.py").read_text(
+                encoding="utf-8"
+            )
+
+    def test_when_cache_dir_set_then_compiled_templates_cached(
+        self, declaration_exotic_values, tmp_path_factory
+    ):
+        output_dir = tmp_path_factory.mktemp("test_python_generate_cache_dir")
+        cache_dir = output_dir / "cache"
+        python_generator.generate(
+            declaration_exotic_values,
+            {},
+            output_dir / "out",
+            lambda _: _,
+            logging.Logger("Test_generate"),
+            cache_dir=str(cache_dir),
+        )
+
+        assert list(cache_dir.glob("__jinja2_*.cache"))
+
+    def test_when_jobs_set_then_output_and_callbacks_match_serial(
+        self, declaration_all, tmp_path_factory
+    ):
+        outputs = {}
+        for jobs in (1, 3):
+            output_dir = tmp_path_factory.mktemp(f"test_python_generate_jobs_{jobs}")
+            created = []
+            python_generator.generate(
+                declaration_all,
+                {},
+                output_dir,
+                created.append,
+                logging.Logger("Test_generate"),
+                jobs=jobs,
+            )
+            outputs[jobs] = [
+                (
+                    os.path.relpath(path, output_dir),
+                    (
+                        pathlib.Path(path).read_text(encoding="utf-8")
+                        if os.path.isfile(path)
+                        else None
+                    ),
+                )
+                for path in created
+            ]
+
+        assert outputs[3] == outputs[1]
+
+    def test_when_jobs_set_and_names_invalid_then_warnings_are_logged_once(
+        self,
+        declaration_exotic_values,
+        warnings_exotic_values,
+        a_capturing_logger,
+        tmp_path_factory,
+    ):
+        output_dir = tmp_path_factory.mktemp("test_python_generate_jobs_warnings")
+        python_generator.generate(
+            declaration_exotic_values, {}, output_dir, lambda _: _, a_capturing_logger, jobs=2
+        )
+
+        assert sorted(a_capturing_logger.handlers[0].messages) == sorted(warnings_exotic_values)
+
+    def test_when_skip_unchanged_and_regenerated_then_files_untouched(
+        self, declaration_exotic_values, creations_exotic_values, tmp_path_factory
+    ):
+        output_dir = tmp_path_factory.mktemp("test_python_generate_skip_unchanged")
+        expected = [(os.path.join(output_dir, p), False) for p in creations_exotic_values]
+
+        python_generator.generate(
+            declaration_exotic_values, {}, output_dir, lambda *_: _, logging.Logger("Test")
+        )
+        for path, _ in expected:
+            os.utime(path, (0, 0))
+
+        actual = []
+
+        def creation_callback(path, changed):
+            actual.append((path, changed))
+
+        python_generator.generate(
+            declaration_exotic_values,
+            {},
+            output_dir,
+            creation_callback,
+            logging.Logger("Test_generate"),
+            skip_unchanged=True,
+        )
+
+        assert actual == expected
+        for path, _ in expected:
+            assert os.stat(path).st_mtime == 0
+
 
 #
 # Fixtures
@@ -814,6 +1520,100 @@ def generated_path(
     return output_dir
 
 
+@pytest.fixture
+def module_all_isolated(generated_path, monkeypatch):
+    """
+    Retrieves a fresh import of the python module corresponding to the
+    'all' description, for tests of per-class state, e.g. whether a
+    deprecation warning has been issued.
+    """
+    yield from _isolated_import_of_module_all(generated_path, monkeypatch)
+
+
+@pytest.fixture(scope="module")
+def generated_path_variant(
+    request, yaml_path_all, yaml_path_traits_only, yaml_path_specifications_only, tmp_path_factory
+):
+    """
+    Generates the test packages with the template globals of the
+    variant named by the parameter supplied via
+    _template_globals_variant.
+    """
+    output_dir = tmp_path_factory.mktemp(f"generated_path_{request.param}")
+    _generate_test_packages(
+        (yaml_path_all, yaml_path_traits_only, yaml_path_specifications_only),
+        output_dir,
+        _TEMPLATE_GLOBALS_VARIANTS[request.param],
+    )
+    return output_dir
+
+
+@pytest.fixture
+def module_all_variant(generated_path_variant, monkeypatch):
+    """
+    Retrieves the python module corresponding to the 'all' description,
+    generated with the template globals of a variant.
+    """
+    yield from _isolated_import_of_module_all(generated_path_variant, monkeypatch)
+
+
+def _public_api(path):
+    """
+    Returns the names of the public top-level functions and classes
+    in the Python source or stub file at path, along with the public
+    methods of each class.
+    """
+    api = set()
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)) and not node.name.startswith("_"):
+            api.add(node.name)
+        if isinstance(node, ast.ClassDef) and not node.name.startswith("_"):
+            api.update(
+                f"{node.name}.{member.name}"
+                for member in node.body
+                if isinstance(member, ast.FunctionDef) and not member.name.startswith("__")
+            )
+    return api
+
+
+def _generate_test_packages(descriptions, output_dir, template_globals):
+    for description in descriptions:
+        generate(
+            description_path=description,
+            output_directory=output_dir,
+            generator="python",
+            creation_callback=lambda _: None,
+            logger=logging.Logger(name="Capturing logger"),
+            template_globals=template_globals,
+        )
+
+
+def _isolated_import_of_module_all(generated_path, monkeypatch):
+    """
+    Imports and yields the python module corresponding to the 'all'
+    description from generated_path.
+
+    All previously imported test packages, including their submodules,
+    are temporarily removed from sys.modules, so they are not confused
+    with the default variants.
+    """
+
+    # pylint: disable=import-error,import-outside-toplevel
+    def test_package_module_names():
+        return [name for name in sys.modules if name.startswith("openassetio_traitgen_test_")]
+
+    for name in test_package_module_names():
+        monkeypatch.delitem(sys.modules, name)
+    monkeypatch.syspath_prepend(generated_path)
+
+    import openassetio_traitgen_test_all
+
+    yield openassetio_traitgen_test_all
+
+    for name in test_package_module_names():
+        del sys.modules[name]
+
+
 @pytest.fixture
 def extended_python_path(generated_path, monkeypatch):
     """
@@ -887,11 +1687,19 @@ def creations_exotic_values():
         os.path.join("p_p"),
         os.path.join("p_p", "traits"),
         os.path.join("p_p", "traits", "t_n.py"),
+        os.path.join("p_p", "traits", "t_n.pyi"),
         os.path.join("p_p", "traits", "__init__.py"),
+        os.path.join("p_p", "traits", "__init__.pyi"),
         os.path.join("p_p", "specifications"),
         os.path.join("p_p", "specifications", "s_n.py"),
+        os.path.join("p_p", "specifications", "s_n.pyi"),
         os.path.join("p_p", "specifications", "__init__.py"),
+        os.path.join("p_p", "specifications", "__init__.pyi"),
+        os.path.join("p_p", "registry.py"),
+        os.path.join("p_p", "registry.pyi"),
         os.path.join("p_p", "__init__.py"),
+        os.path.join("p_p", "__init__.pyi"),
+        os.path.join("p_p", "py.typed"),
     ]
 
 
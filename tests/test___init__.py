@@ -20,9 +20,12 @@ Tests for the main openassetio_traitgen.generate entry point.
 import logging
 from unittest import mock
 
+import jsonschema
 import pytest
+import yaml
 
 import openassetio_traitgen
+from openassetio_traitgen import parser
 
 # pylint: disable=redefined-outer-name, invalid-name
 # pylint: disable=missing-class-docstring, missing-function-docstring
@@ -232,6 +235,9 @@ class Test_generate:
         )
         structureMsg = a_capturing_logger.handlers[0].messages
         structureMsg.remove((logging.INFO, "Generating with generator python..."))
+        structureMsg.remove(
+            (logging.INFO, f"Loading {yaml_path_all} using {parser.yaml_loader_name()}")
+        )
         assert structureMsg == structure_all_log_messages
 
     def test_when_dry_run_set_true_then_structure_is_still_logged_as_info(
@@ -253,7 +259,28 @@ class Test_generate:
 
         # Dry run does not make it to the generation code path, so no
         # "Generating with" message is logged.
-        assert a_capturing_logger.handlers[0].messages == structure_all_log_messages
+        assert a_capturing_logger.handlers[0].messages == [
+            (logging.INFO, f"Loading {yaml_path_all} using {parser.yaml_loader_name()}"),
+            *structure_all_log_messages,
+        ]
+
+    def test_when_loading_then_yaml_loader_is_logged_as_info(
+        self, yaml_path_all, some_output_dir, some_creation_callback, a_capturing_logger
+    ):
+        openassetio_traitgen.generate(
+            description_path=yaml_path_all,
+            output_directory=some_output_dir,
+            generator="python",
+            creation_callback=some_creation_callback,
+            logger=a_capturing_logger,
+            dry_run=True,
+        )
+
+        loader = "CSafeLoader" if yaml.__with_libyaml__ else "SafeLoader"
+        assert (
+            logging.INFO,
+            f"Loading {yaml_path_all} using {loader}",
+        ) in a_capturing_logger.handlers[0].messages
 
     def test_when_invalid_generator_error_raised(
         self,
@@ -274,6 +301,250 @@ class Test_generate:
         assert exc.value.args[0] == "Could not find generator Algol"
 
 
+class Test_generate_many:
+    def test_when_many_descriptions_and_generators_then_each_generator_called_for_each(
+        self,
+        yaml_path_all,
+        yaml_path_traits_only,
+        declaration_all,
+        declaration_traits_only,
+        some_output_dir,
+        some_creation_callback,
+        mock_generator_a,
+        mock_generator_b,
+        a_capturing_logger,
+    ):
+        openassetio_traitgen.generate_many(
+            description_paths=[yaml_path_all, yaml_path_traits_only],
+            output_directory=some_output_dir,
+            generator_names=["a", "b"],
+            creation_callback=some_creation_callback,
+            logger=a_capturing_logger,
+        )
+
+        for mock_generator, name in ((mock_generator_a, "a"), (mock_generator_b, "b")):
+            declarations = [call.args[0] for call in mock_generator.generate.call_args_list]
+            assert declarations == [declaration_all, declaration_traits_only]
+            for call in mock_generator.generate.call_args_list:
+                assert call.args[1]["generator"] == name
+
+    def test_when_any_description_invalid_then_no_generator_called(
+        self,
+        yaml_path_all,
+        yaml_path_invalid,
+        some_output_dir,
+        some_creation_callback,
+        mock_generator_a,
+        a_capturing_logger,
+    ):
+        with pytest.raises(jsonschema.ValidationError):
+            openassetio_traitgen.generate_many(
+                description_paths=[yaml_path_all, yaml_path_invalid],
+                output_directory=some_output_dir,
+                generator_names=["a"],
+                creation_callback=some_creation_callback,
+                logger=a_capturing_logger,
+            )
+
+        mock_generator_a.generate.assert_not_called()
+
+    def test_when_any_generator_invalid_then_no_generator_called(
+        self,
+        yaml_path_all,
+        some_output_dir,
+        some_creation_callback,
+        mock_generator_a,
+        a_capturing_logger,
+    ):
+        with pytest.raises(ValueError) as exc:
+            openassetio_traitgen.generate_many(
+                description_paths=[yaml_path_all],
+                output_directory=some_output_dir,
+                generator_names=["a", "Algol"],
+                creation_callback=some_creation_callback,
+                logger=a_capturing_logger,
+            )
+
+        assert exc.value.args[0] == "Could not find generator Algol"
+        mock_generator_a.generate.assert_not_called()
+
+
+class Test_generate_cache_dir:
+    def test_when_cache_dir_set_then_generate_called_with_declaration(
+        self,
+        yaml_path_all,
+        declaration_all,
+        some_output_dir,
+        some_creation_callback,
+        mock_generator_a,
+        a_capturing_logger,
+        tmp_path,
+    ):
+        for _ in range(2):
+            openassetio_traitgen.generate(
+                description_path=yaml_path_all,
+                output_directory=some_output_dir,
+                generator="a",
+                creation_callback=some_creation_callback,
+                logger=a_capturing_logger,
+                cache_dir=str(tmp_path / "cache"),
+            )
+
+            call_args = mock_generator_a.generate.call_args[0]
+            assert call_args[0] == declaration_all
+
+    def test_when_description_unchanged_then_parsing_skipped(
+        self,
+        yaml_path_all,
+        some_output_dir,
+        some_creation_callback,
+        mock_generator_a,
+        a_capturing_logger,
+        tmp_path,
+        monkeypatch,
+    ):
+        cache_dir = str(tmp_path / "cache")
+        openassetio_traitgen.generate(
+            description_path=yaml_path_all,
+            output_directory=some_output_dir,
+            generator="a",
+            creation_callback=some_creation_callback,
+            logger=a_capturing_logger,
+            cache_dir=cache_dir,
+        )
+
+        mock_parser = mock.Mock()
+        monkeypatch.setattr(openassetio_traitgen, "parser", mock_parser)
+
+        openassetio_traitgen.generate(
+            description_path=yaml_path_all,
+            output_directory=some_output_dir,
+            generator="a",
+            creation_callback=some_creation_callback,
+            logger=a_capturing_logger,
+            cache_dir=cache_dir,
+        )
+
+        mock_parser.parse_yaml.assert_not_called()
+        mock_parser.validate_package_description.assert_not_called()
+        mock_parser.build_package_declaration.assert_not_called()
+        assert mock_generator_a.generate.call_count == 2
+
+    def test_when_description_invalid_then_ValidationError_raised_and_not_cached(
+        self,
+        yaml_path_invalid,
+        some_output_dir,
+        some_creation_callback,
+        a_capturing_logger,
+        tmp_path,
+    ):
+        cache_dir = tmp_path / "cache"
+        with pytest.raises(jsonschema.ValidationError):
+            openassetio_traitgen.generate(
+                description_path=yaml_path_invalid,
+                output_directory=some_output_dir,
+                generator="a",
+                creation_callback=some_creation_callback,
+                logger=a_capturing_logger,
+                cache_dir=str(cache_dir),
+            )
+
+        assert not cache_dir.exists() or not list(cache_dir.iterdir())
+
+
+class Test_generate_stats:
+    def test_when_generated_then_stats_returned_with_phase_timings(
+        self, yaml_path_all, some_output_dir, some_creation_callback, a_capturing_logger
+    ):
+        stats = openassetio_traitgen.generate(
+            description_path=yaml_path_all,
+            output_directory=some_output_dir,
+            generator="python",
+            creation_callback=some_creation_callback,
+            logger=a_capturing_logger,
+        )
+
+        assert isinstance(stats, openassetio_traitgen.stats.GenerationStats)
+        assert stats.load_seconds > 0
+        assert stats.validate_seconds > 0
+        assert stats.build_seconds > 0
+        assert stats.render_seconds > 0
+
+    def test_when_generated_then_stats_count_rendered_files(
+        self, yaml_path_minimal, tmp_path, creations_minimal_by_generator, a_capturing_logger
+    ):
+        stats = openassetio_traitgen.generate(
+            description_path=yaml_path_minimal,
+            output_directory=str(tmp_path),
+            generator="python",
+            creation_callback=lambda _: _,
+            logger=a_capturing_logger,
+        )
+
+        files = [
+            tmp_path / path
+            for path in creations_minimal_by_generator["python"]
+            if (tmp_path / path).is_file()
+        ]
+        assert stats.templates_rendered == len(files)
+        assert stats.files_written == len(files)
+        assert stats.bytes_written == sum(file.stat().st_size for file in files)
+        assert stats.files_skipped == 0
+
+    def test_when_regenerated_with_skip_unchanged_then_stats_count_skipped_files(
+        self, yaml_path_minimal, tmp_path, a_capturing_logger
+    ):
+        for _ in range(2):
+            stats = openassetio_traitgen.generate(
+                description_path=yaml_path_minimal,
+                output_directory=str(tmp_path),
+                generator="cpp",
+                creation_callback=lambda _path, _changed: None,
+                logger=a_capturing_logger,
+                skip_unchanged=True,
+            )
+
+        assert stats.files_written == 0
+        assert stats.bytes_written == 0
+        assert stats.files_skipped == stats.templates_rendered > 0
+
+    def test_when_dry_run_then_nothing_rendered(
+        self, yaml_path_all, some_output_dir, some_creation_callback, a_capturing_logger
+    ):
+        stats = openassetio_traitgen.generate(
+            description_path=yaml_path_all,
+            output_directory=some_output_dir,
+            generator="python",
+            creation_callback=some_creation_callback,
+            logger=a_capturing_logger,
+            dry_run=True,
+        )
+
+        assert stats.build_seconds > 0
+        assert stats.render_seconds == 0
+        assert stats.templates_rendered == 0
+
+    @pytest.mark.usefixtures("mock_generator_a")
+    def test_when_cached_then_cached_declarations_counted(
+        self,
+        yaml_path_all,
+        some_output_dir,
+        some_creation_callback,
+        a_capturing_logger,
+        tmp_path,
+    ):
+        for expected in (0, 1):
+            stats = openassetio_traitgen.generate(
+                description_path=yaml_path_all,
+                output_directory=some_output_dir,
+                generator="a",
+                creation_callback=some_creation_callback,
+                logger=a_capturing_logger,
+                cache_dir=str(tmp_path / "cache"),
+            )
+            assert stats.declarations_cached == expected
+
+
 @pytest.fixture
 def mock_generator_a(monkeypatch):
     mock_generator = mock.Mock()
@@ -282,6 +553,14 @@ def mock_generator_a(monkeypatch):
     return mock_generator
 
 
+@pytest.fixture
+def mock_generator_b(monkeypatch):
+    mock_generator = mock.Mock()
+    mock_generator.generate = mock.Mock()
+    monkeypatch.setattr(openassetio_traitgen.generators, "b", mock_generator, raising=False)
+    return mock_generator
+
+
 @pytest.fixture
 def some_output_dir(tmp_path):
     return str(tmp_path)
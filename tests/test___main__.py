@@ -18,6 +18,7 @@ Test for the openassetio-codgen CLI tool
 """
 
 import datetime
+import json
 import os
 import subprocess
 
@@ -278,6 +279,305 @@ class Test_CLI_args_spdxLicenseIdentifier:
         assert "SPDX-License-Identifier: Unlicense" in contents
 
 
+class Test_CLI_args_cache_trait_views:
+    def test_when_not_set_then_trait_views_not_cached(self, tmp_path, yaml_path_minimal):
+        execute_cli("-g", "python", "-o", tmp_path, yaml_path_minimal)
+
+        assert "except AttributeError" not in file_contents(
+            tmp_path, "p_p", "specifications", "sn.py"
+        )
+
+    def test_when_set_then_trait_views_cached(self, tmp_path, yaml_path_minimal):
+        execute_cli("-g", "python", "--cache-trait-views", "-o", tmp_path, yaml_path_minimal)
+
+        assert "except AttributeError" in file_contents(tmp_path, "p_p", "specifications", "sn.py")
+
+
+class Test_CLI_args_lazy_imports:
+    def test_when_not_set_then_submodules_imported_eagerly(self, tmp_path, yaml_path_minimal):
+        execute_cli("-g", "python", "-o", tmp_path, yaml_path_minimal)
+
+        assert "from . import traits" in file_contents(tmp_path, "p_p", "__init__.py")
+
+    def test_when_set_then_submodules_imported_lazily(self, tmp_path, yaml_path_minimal):
+        execute_cli("-g", "python", "--lazy-imports", "-o", tmp_path, yaml_path_minimal)
+
+        contents = file_contents(tmp_path, "p_p", "__init__.py")
+        assert "from . import traits" not in contents
+        assert "def __getattr__(name):" in contents
+
+
+class Test_CLI_args_type_checks:
+    def test_when_not_set_then_TypeError_raised(self, tmp_path, yaml_path_minimal):
+        execute_cli("-g", "python", "-o", tmp_path, yaml_path_minimal)
+
+        assert "raise TypeError(" in file_contents(tmp_path, "p_p", "traits", "tn.py")
+
+    def test_when_assert_then_assert_used(self, tmp_path, yaml_path_minimal):
+        execute_cli("-g", "python", "--type-checks", "assert", "-o", tmp_path, yaml_path_minimal)
+
+        contents = file_contents(tmp_path, "p_p", "traits", "tn.py")
+        assert "raise TypeError(" not in contents
+        assert "assert type(p) is bool" in contents
+
+    def test_when_none_then_no_checks(self, tmp_path, yaml_path_minimal):
+        execute_cli("-g", "python", "--type-checks", "none", "-o", tmp_path, yaml_path_minimal)
+
+        contents = file_contents(tmp_path, "p_p", "traits", "tn.py")
+        assert "raise TypeError(" not in contents
+        assert "assert " not in contents
+
+    def test_when_unknown_then_error_reported(self, tmp_path, yaml_path_minimal):
+        result = execute_cli(
+            "-g", "python", "--type-checks", "sometimes", "-o", tmp_path, yaml_path_minimal
+        )
+
+        assert result.returncode == 2
+        assert "invalid choice: 'sometimes'" in result.stderr
+
+
+class Test_CLI_args_cpp_layout:
+    def test_when_not_set_then_header_per_class(self, tmp_path, yaml_path_minimal):
+        execute_cli("-g", "cpp", "-o", tmp_path, yaml_path_minimal)
+
+        assert (tmp_path / "p_p" / "include" / "p_p" / "traits" / "tn" / "TTrait.hpp").is_file()
+
+    def test_when_amalgamated_then_single_header(self, tmp_path, yaml_path_minimal):
+        execute_cli("-g", "cpp", "--cpp-layout", "amalgamated", "-o", tmp_path, yaml_path_minimal)
+
+        include_dir = tmp_path / "p_p" / "include" / "p_p"
+        assert [path.name for path in include_dir.iterdir()] == ["p_p.hpp"]
+        assert "class TTrait_v1 {" in file_contents(include_dir, "p_p.hpp")
+
+    def test_when_amalgamated_namespaces_then_header_per_namespace(
+        self, tmp_path, yaml_path_minimal
+    ):
+        execute_cli(
+            "-g",
+            "cpp",
+            "--cpp-layout",
+            "amalgamated-namespaces",
+            "-o",
+            tmp_path,
+            yaml_path_minimal,
+        )
+
+        traits_dir = tmp_path / "p_p" / "include" / "p_p" / "traits"
+        assert sorted(path.name for path in traits_dir.iterdir()) == ["tn.hpp", "traits.hpp"]
+        assert "class TTrait_v1 {" in file_contents(traits_dir, "tn.hpp")
+
+    def test_when_unknown_then_error_reported(self, tmp_path, yaml_path_minimal):
+        result = execute_cli(
+            "-g", "cpp", "--cpp-layout", "flat", "-o", tmp_path, yaml_path_minimal
+        )
+
+        assert result.returncode == 2
+        assert "invalid choice: 'flat'" in result.stderr
+
+
+class Test_CLI_args_cpp_cmake_target:
+    def test_when_not_set_then_no_cmake_file(self, tmp_path, yaml_path_minimal):
+        execute_cli("-g", "cpp", "-o", tmp_path, yaml_path_minimal)
+
+        assert not (tmp_path / "p_p" / "p_p.cmake").exists()
+
+    def test_when_set_then_cmake_file_alongside_include_dir(self, tmp_path, yaml_path_minimal):
+        execute_cli("-g", "cpp", "--cpp-cmake-target", "-o", tmp_path, yaml_path_minimal)
+
+        assert "target_precompile_headers(" in file_contents(tmp_path / "p_p", "p_p.cmake")
+
+
+@pytest.mark.parametrize("generator", ("python", "cpp"))
+class Test_CLI_args_cache_dir:
+    def test_when_set_then_cache_populated(self, tmp_path, yaml_path_minimal, generator):
+        cache_dir = tmp_path / "cache"
+        execute_cli(
+            "--generator",
+            generator,
+            "--cache-dir",
+            cache_dir,
+            "-o",
+            tmp_path / "out",
+            yaml_path_minimal,
+        )
+
+        assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    def test_when_set_then_compiled_templates_cached(self, tmp_path, yaml_path_minimal, generator):
+        cache_dir = tmp_path / "cache"
+        execute_cli(
+            "--generator",
+            generator,
+            "--cache-dir",
+            cache_dir,
+            "-o",
+            tmp_path / "out",
+            yaml_path_minimal,
+        )
+
+        assert list(cache_dir.glob("__jinja2_*.cache"))
+
+    def test_when_cached_then_code_is_generated_to_expected_path(
+        self, tmp_path, yaml_path_minimal, generator
+    ):
+        cache_dir = tmp_path / "cache"
+        for output_dir in ("a", "b"):
+            execute_cli(
+                "--generator",
+                generator,
+                "--cache-dir",
+                cache_dir,
+                "-o",
+                tmp_path / output_dir,
+                yaml_path_minimal,
+            )
+
+        assert os.path.isdir(os.path.join(tmp_path, "b", "p_p"))
+
+
+@pytest.mark.parametrize("generator", ("python", "cpp"))
+class Test_CLI_args_skip_unchanged:
+    def test_when_set_and_regenerated_then_files_untouched(
+        self, tmp_path, yaml_path_minimal, generator
+    ):
+        execute_cli("--generator", generator, "-o", tmp_path, yaml_path_minimal)
+        package_file = os.path.join(tmp_path, "p_p", *package_path[generator])
+        os.utime(package_file, (0, 0))
+
+        execute_cli(
+            "--generator", generator, "--skip-unchanged", "-o", tmp_path, yaml_path_minimal
+        )
+
+        assert os.stat(package_file).st_mtime == 0
+
+    def test_when_set_and_verbose_then_all_paths_written_to_stdout(
+        self, yaml_path_minimal, creations_minimal_by_generator, tmp_path, generator
+    ):
+        expected = [
+            os.path.join(tmp_path, path) for path in creations_minimal_by_generator[generator]
+        ]
+        execute_cli("--generator", generator, "-o", tmp_path, yaml_path_minimal)
+
+        actual = execute_cli(
+            "--generator", generator, "--skip-unchanged", "-o", tmp_path, yaml_path_minimal, "-v"
+        ).stdout.splitlines()
+
+        assert actual == expected
+
+
+@pytest.mark.parametrize("generator", ("python", "cpp"))
+class Test_CLI_args_jobs:
+    def test_when_set_then_created_paths_written_to_stdout_in_order(
+        self, yaml_path_minimal, creations_minimal_by_generator, tmp_path, generator
+    ):
+        expected = [
+            os.path.join(tmp_path, path) for path in creations_minimal_by_generator[generator]
+        ]
+
+        actual = execute_cli(
+            "--generator", generator, "--jobs", "2", "-o", tmp_path, yaml_path_minimal, "-v"
+        ).stdout.splitlines()
+
+        assert actual == expected
+
+    def test_when_not_positive_then_exit_code_is_two(self, yaml_path_minimal, tmp_path, generator):
+        assert (
+            execute_cli(
+                "--generator", generator, "-j", "0", "-o", tmp_path, yaml_path_minimal
+            ).returncode
+            == 2
+        )
+
+
+class Test_CLI_args_multiple:
+    def test_when_many_inputs_then_all_packages_generated(
+        self, yaml_path_minimal, yaml_path_traits_only, tmp_path
+    ):
+        execute_cli("-g", "python", "-o", tmp_path, yaml_path_minimal, yaml_path_traits_only)
+
+        assert os.path.isdir(os.path.join(tmp_path, "p_p"))
+        assert os.path.isdir(os.path.join(tmp_path, "openassetio_traitgen_test_traits_only"))
+
+    def test_when_many_generators_then_all_languages_generated(self, yaml_path_minimal, tmp_path):
+        execute_cli("-g", "python", "-g", "cpp", "-o", tmp_path, yaml_path_minimal)
+
+        assert os.path.isfile(os.path.join(tmp_path, "p_p", *package_path["python"]))
+        assert os.path.isfile(os.path.join(tmp_path, "p_p", *package_path["cpp"]))
+
+    def test_when_verbose_then_created_paths_written_in_generator_then_input_order(
+        self, yaml_path_minimal, creations_minimal_by_generator, tmp_path
+    ):
+        expected = [
+            os.path.join(tmp_path, path)
+            for generator in ("cpp", "python")
+            for path in creations_minimal_by_generator[generator]
+        ]
+
+        actual = execute_cli(
+            "-g", "cpp", "-g", "python", "-o", tmp_path, yaml_path_minimal, "-v"
+        ).stdout.splitlines()
+
+        assert actual == expected
+
+
+@pytest.mark.parametrize("generator", ("python", "cpp"))
+class Test_CLI_args_stats:
+    def test_when_json_then_stats_written_to_stderr_as_json(
+        self, yaml_path_minimal, creations_minimal_by_generator, tmp_path, generator
+    ):
+        result = execute_cli(
+            "--generator",
+            generator,
+            "--stats",
+            "--stats-format",
+            "json",
+            "-o",
+            tmp_path,
+            yaml_path_minimal,
+        )
+
+        stats = json.loads(result.stderr)
+        num_files = len(
+            [path for path in creations_minimal_by_generator[generator] if "." in path]
+        )
+        assert stats["templates_rendered"] == num_files
+        assert stats["files_written"] == num_files
+        assert stats["render_seconds"] > 0
+        assert result.stdout == ""
+
+    def test_when_set_without_format_then_text_stats_written_to_stderr(
+        self, yaml_path_minimal, tmp_path, generator
+    ):
+        result = execute_cli(
+            "--generator", generator, "--stats", "-o", tmp_path, yaml_path_minimal
+        )
+
+        assert result.stderr.startswith("Generation statistics:")
+        assert "Templates rendered:" in result.stderr
+
+    def test_when_set_before_input_path_then_input_path_not_consumed(
+        self, yaml_path_minimal, tmp_path, generator
+    ):
+        result = execute_cli("--stats", yaml_path_minimal, "-g", generator, "-o", tmp_path)
+
+        assert result.returncode == 0
+        assert result.stderr.startswith("Generation statistics:")
+
+    def test_when_not_set_then_no_stats_written(self, yaml_path_minimal, tmp_path, generator):
+        result = execute_cli("--generator", generator, "-o", tmp_path, yaml_path_minimal)
+
+        assert result.stderr == ""
+
+    def test_when_only_format_set_then_no_stats_written(
+        self, yaml_path_minimal, tmp_path, generator
+    ):
+        result = execute_cli(
+            "--generator", generator, "--stats-format", "json", "-o", tmp_path, yaml_path_minimal
+        )
+
+        assert result.stderr == ""
+
+
 class Test_CLI_args_help:
     def test_when_h_set_then_help_is_generated(self, tmp_path, yaml_path_minimal):
         assert "usage: openassetio-traitgen" in execute_cli("-h").stdout
@@ -0,0 +1,95 @@
+#
+#   Copyright 2026 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Tests for the package declaration cache.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import logging
+import os
+
+import pytest
+
+from openassetio_traitgen import cache
+
+
+class Test_cache_key:
+    def test_when_same_content_then_key_is_equal(self):
+        assert cache.cache_key(b"package: p") == cache.cache_key(b"package: p")
+
+    def test_when_content_differs_then_key_differs(self):
+        assert cache.cache_key(b"package: p") != cache.cache_key(b"package: q")
+
+
+class Test_cache_load:
+    def test_when_not_stored_then_returns_None(self, tmp_path):
+        assert cache.load(str(tmp_path), cache.cache_key(b"")) is None
+
+    def test_when_cache_dir_missing_then_returns_None(self, tmp_path):
+        assert cache.load(str(tmp_path / "missing"), cache.cache_key(b"")) is None
+
+    def test_when_stored_then_returns_equal_declaration(self, tmp_path, declaration_all):
+        key = cache.cache_key(b"all")
+        cache.store(str(tmp_path), key, declaration_all)
+
+        assert cache.load(str(tmp_path), key) == declaration_all
+
+    def test_when_entry_corrupt_then_returns_None(self, tmp_path, declaration_all):
+        key = cache.cache_key(b"all")
+        cache.store(str(tmp_path), key, declaration_all)
+        (entry,) = os.listdir(tmp_path)
+        (tmp_path / entry).write_bytes(b"not a pickle")
+
+        assert cache.load(str(tmp_path), key) is None
+
+    @pytest.mark.parametrize(
+        "content",
+        (
+            # Garbage.
+            b"\x00\x01\x02",
+            # References a module that cannot be imported.
+            b"cmissing_module_for_test_cache\nThing\n.",
+            # Unsupported pickle protocol (ValueError).
+            b"\x80\x7f.",
+        ),
+    )
+    def test_when_entry_unloadable_then_returns_None_and_logs_debug(
+        self, tmp_path, a_capturing_logger, content
+    ):
+        key = cache.cache_key(b"all")
+        (tmp_path / f"{key}.pickle").write_bytes(content)
+
+        assert cache.load(str(tmp_path), key, a_capturing_logger) is None
+
+        ((level, message),) = a_capturing_logger.handlers[0].messages
+        assert level == logging.DEBUG
+        assert message.startswith(f"Ignoring unusable cache entry {tmp_path / key}.pickle: ")
+
+
+class Test_cache_store:
+    def test_when_cache_dir_missing_then_created(self, tmp_path, declaration_all):
+        cache_dir = tmp_path / "a" / "cache"
+        cache.store(str(cache_dir), cache.cache_key(b"all"), declaration_all)
+
+        assert os.path.isdir(cache_dir)
+
+    def test_when_stored_then_no_temporary_files_remain(self, tmp_path, declaration_all):
+        key = cache.cache_key(b"all")
+        cache.store(str(tmp_path), key, declaration_all)
+
+        assert os.listdir(tmp_path) == [f"{key}.pickle"]
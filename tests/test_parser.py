@@ -17,13 +17,14 @@
 Tests for the traitgen description parser.
 """
 
-# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=invalid-name,redefined-outer-name,too-few-public-methods
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
 import os
 
 import pytest
 import jsonschema
+import yaml
 
 from openassetio_traitgen import parser
 
@@ -41,6 +42,17 @@ class Test_Parser_loadYAML:
         with pytest.raises(FileNotFoundError):
             parser.load_yaml("not_a_file")
 
+    def test_when_libyaml_available_then_CSafeLoader_used(self):
+        expected = "CSafeLoader" if yaml.__with_libyaml__ else "SafeLoader"
+
+        assert parser.yaml_loader_name() == expected
+
+    def test_when_loading_then_result_matches_pure_python_loader(self, yaml_path_all):
+        with open(yaml_path_all, "r", encoding="utf-8") as file:
+            expected = yaml.load(file, Loader=yaml.SafeLoader)
+
+        assert parser.load_yaml(yaml_path_all) == expected
+
 
 class Test_Parser_validateDescription:
     def test_when_valid_then_noop(self, description_all):
@@ -56,6 +68,40 @@ class Test_Parser_validateDescription:
         with pytest.raises(jsonschema.ValidationError):
             parser.validate_package_description(description_invalid_values)
 
+    def test_when_collecting_all_errors_and_valid_then_noop(self, description_all):
+        parser.validate_package_description(description_all, collect_all_errors=True)
+
+    def test_when_collecting_all_errors_then_every_violation_is_reported(
+        self, description_invalid_values
+    ):
+        with pytest.raises(jsonschema.ValidationError) as exc:
+            parser.validate_package_description(
+                description_invalid_values, collect_all_errors=True
+            )
+
+        assert len(exc.value.context) > 1
+        for error in exc.value.context:
+            assert error.message in exc.value.message
+
+    def test_when_called_repeatedly_then_schema_is_loaded_once(self, description_all, monkeypatch):
+        # pylint: disable=protected-access
+        parser._schema_validator.cache_clear()
+        load_count = 0
+        load_schema = parser._load_schema
+
+        def counting_load_schema():
+            nonlocal load_count
+            load_count += 1
+            return load_schema()
+
+        monkeypatch.setattr(parser, "_load_schema", counting_load_schema)
+
+        parser.validate_package_description(description_all)
+        parser.validate_package_description(description_all)
+
+        assert load_count == 1
+        parser._schema_validator.cache_clear()
+
 
 class Test_Parser_buildPackageDeclaration:
     def test_when_contains_traits_and_specifications_then_expected_declaration_returned(
@@ -81,3 +127,46 @@ class Test_Parser_buildPackageDeclaration:
     ):
         actual = parser.build_package_declaration(description_exotic_values)
         assert actual == declaration_exotic_values
+
+
+class Test_Parser_buildPackageDeclaration_traitSet:
+    def test_when_names_collide_then_shortest_unique_name_parts_used(self):
+        description = {
+            "package": "p",
+            "specifications": {
+                "s": {
+                    "description": "",
+                    "members": {
+                        "S": {
+                            "versions": {
+                                "1": {
+                                    "traitSet": [
+                                        {"namespace": "a", "name": "unique", "version": "1"},
+                                        {"namespace": "a", "name": "name", "version": "1"},
+                                        {"namespace": "b", "name": "name", "version": "1"},
+                                        {"namespace": "c", "name": "both", "version": "1"},
+                                        {
+                                            "package": "q",
+                                            "namespace": "c",
+                                            "name": "both",
+                                            "version": "1",
+                                        },
+                                    ]
+                                }
+                            }
+                        }
+                    },
+                }
+            },
+        }
+
+        (namespace,) = parser.build_package_declaration(description).specifications
+        (specification,) = namespace.members
+
+        assert [(ref.id, ref.unique_name_parts) for ref in specification.trait_set] == [
+            ("p:a.name", ("a", "name")),
+            ("p:a.unique", ("unique",)),
+            ("p:b.name", ("b", "name")),
+            ("p:c.both", ("p", "c", "both")),
+            ("q:c.both", ("q", "c", "both")),
+        ]
@@ -0,0 +1,87 @@
+#
+#   Copyright 2026 The Foundry Visionmongers Ltd
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Tests for the generation statistics.
+"""
+
+# pylint: disable=invalid-name,redefined-outer-name,too-few-public-methods
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import json
+import sys
+
+import pytest
+
+from openassetio_traitgen import stats
+
+
+class Test_GenerationStats_timed:
+    def test_when_timed_repeatedly_then_time_accumulated(self):
+        generation_stats = stats.GenerationStats()
+
+        with generation_stats.timed("load_seconds"):
+            pass
+        first = generation_stats.load_seconds
+        with generation_stats.timed("load_seconds"):
+            pass
+
+        assert generation_stats.load_seconds > first > 0
+        assert generation_stats.validate_seconds == 0
+
+
+class Test_GenerationStats_update_peak_memory:
+    @pytest.mark.skipif(sys.platform == "win32", reason="Peak memory not available on Windows")
+    def test_when_updated_then_peak_memory_is_positive(self):
+        generation_stats = stats.GenerationStats()
+
+        generation_stats.update_peak_memory()
+
+        assert generation_stats.peak_memory_bytes > 0
+
+
+class Test_GenerationStats_to_json:
+    def test_returns_all_fields(self):
+        generation_stats = stats.GenerationStats(templates_rendered=3, bytes_written=42)
+
+        assert json.loads(generation_stats.to_json()) == generation_stats.as_dict()
+
+
+class Test_GenerationStats_to_text:
+    def test_when_peak_memory_unknown_then_reported_as_unknown(self):
+        assert "Peak memory:         unknown" in stats.GenerationStats().to_text()
+
+
+class Test_record_render:
+    def test_when_collecting_then_current_stats_updated(self):
+        generation_stats = stats.GenerationStats()
+
+        with stats.collecting(generation_stats):
+            stats.record_render(10, True)
+            stats.record_render(20, False)
+
+        assert generation_stats.templates_rendered == 2
+        assert generation_stats.files_written == 1
+        assert generation_stats.bytes_written == 10
+        assert generation_stats.files_skipped == 1
+
+    def test_when_not_collecting_then_noop(self):
+        generation_stats = stats.GenerationStats()
+        with stats.collecting(generation_stats):
+            pass
+
+        stats.record_render(10, True)
+
+        assert generation_stats.templates_rendered == 0